@@ -0,0 +1,202 @@
+"""Columnar batch normalization for large backfills and replays."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+try:
+    from app.ingestion.normalizer_spec import (
+        DATE_PARSERS,
+        FieldPath,
+        Normalizer,
+        Record,
+        SourceSpec,
+        compile_path,
+        compile_row_emitter,
+        count_organizers,
+        parse_datetime,
+        to_utc_iso,
+    )
+    from app.ingestion.record import HackathonRecord
+    from app.ingestion.timeline_parser import parse_many
+except ModuleNotFoundError:
+    from ingestion.normalizer_spec import (  # type: ignore[no-redef]
+        DATE_PARSERS,
+        FieldPath,
+        Normalizer,
+        Record,
+        SourceSpec,
+        compile_path,
+        compile_row_emitter,
+        count_organizers,
+        parse_datetime,
+        to_utc_iso,
+    )
+    from ingestion.record import HackathonRecord  # type: ignore[no-redef]
+    from ingestion.timeline_parser import parse_many  # type: ignore[no-redef]
+
+NUMPY_AVAILABLE = np is not None
+
+# int64 minimum, the same bit pattern NumPy uses for NaT.
+NAT = -(2**63)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def to_epoch_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return NAT
+    return (value - EPOCH) // ONE_MICROSECOND
+
+
+class _DateColumns:
+    """Parses each distinct raw value once per batch."""
+
+    def __init__(self, parse: Callable[[Any], Optional[datetime]]) -> None:
+        self.parse = parse
+        self._micros: Dict[Any, int] = {}
+
+    def micros(self, value: Any) -> int:
+        if not isinstance(value, Hashable):
+            return to_epoch_micros(self.parse(value))
+        # Keyed with the type so that 1, 1.0 and True stay apart.
+        key = (value.__class__, value)
+        cached = self._micros.get(key)
+        if cached is None:
+            cached = self._micros[key] = to_epoch_micros(self.parse(value))
+        return cached
+
+    def column(self, records: List[Record], get: Callable[[Record], Any]) -> Any:
+        micros = self.micros
+        return np.fromiter(
+            (micros(get(record)) for record in records), dtype=np.int64, count=len(records)
+        )
+
+    def coalesced(
+        self, records: List[Record], getters: Sequence[Callable[[Record], Any]]
+    ) -> Any:
+        result = self.column(records, getters[0])
+        for get in getters[1:]:
+            missing = result == NAT
+            if not missing.any():
+                break
+            result = np.where(missing, self.column(records, get), result)
+        return result
+
+
+class _Moments:
+    """UTC datetime and its ISO string for an epoch-microsecond value, memoized."""
+
+    def __init__(self) -> None:
+        self._by_micros: Dict[int, Tuple[datetime, str]] = {}
+
+    def __call__(self, micros: int) -> Tuple[datetime, str]:
+        moment = self._by_micros.get(micros)
+        if moment is None:
+            value = EPOCH + timedelta(microseconds=micros)
+            moment = self._by_micros[micros] = (value, to_utc_iso(value))
+        return moment
+
+
+def _getters(paths: Sequence[FieldPath]) -> List[Callable[[Record], Any]]:
+    if not paths:
+        raise ValueError("date fallback chain must not be empty")
+    return [compile_path(path) for path in paths]
+
+
+def compile_columnar_normalizer(spec: SourceSpec) -> Normalizer:
+    if np is None:
+        raise RuntimeError("columnar normalization requires numpy")
+
+    emit = compile_row_emitter(spec)
+    get_period = compile_path(spec.period_path) if spec.period_path is not None else None
+    if get_period is None:
+        parse = DATE_PARSERS[spec.date_format]
+        start_getters = _getters(spec.start_paths)
+        final_getters = _getters(spec.final_paths)
+    get_closes_at = compile_path(spec.closes_at_path) if spec.closes_at_path else None
+    get_created_at = compile_path(spec.created_at_path) if spec.created_at_path else None
+    skip_ended = spec.skip_ended
+    skip_reversed = spec.skip_reversed
+
+    def normalize(
+        records: List[Record], now: Optional[datetime] = None
+    ) -> List[HackathonRecord]:
+        current_time = now or datetime.now(timezone.utc)
+        now_micros = to_epoch_micros(current_time)
+        count = len(records)
+        iso_columns = _DateColumns(parse_datetime)
+
+        if get_period is not None:
+            timelines = parse_many(
+                (str(get_period(record) or "") for record in records),
+                fallback_now=current_time,
+            )
+            start = np.fromiter(
+                (to_epoch_micros(t and t.start_date) for t in timelines), np.int64, count
+            )
+            final = np.fromiter(
+                (to_epoch_micros(t and t.final_submission_date) for t in timelines),
+                np.int64,
+                count,
+            )
+        else:
+            columns = iso_columns if parse is parse_datetime else _DateColumns(parse)
+            start = columns.coalesced(records, start_getters)
+            final = columns.coalesced(records, final_getters)
+
+        keep = (start != NAT) & (final != NAT)
+        if skip_reversed:
+            keep &= final >= start
+        if skip_ended:
+            keep &= final >= now_micros
+        if get_closes_at is not None:
+            closes_at = iso_columns.column(records, get_closes_at)
+            keep &= (closes_at == NAT) | (closes_at >= now_micros)
+        # Floor division maps epoch microseconds onto UTC calendar days.
+        days = np.maximum(
+            final // MICROSECONDS_PER_DAY - start // MICROSECONDS_PER_DAY, 0
+        )
+        created_at = (
+            iso_columns.column(records, get_created_at).tolist()
+            if get_created_at is not None
+            else None
+        )
+
+        organizer_counts = count_organizers(spec, records)
+        created_at_default = current_time.isoformat()
+        moment = _Moments()
+        start_list = start.tolist()
+        final_list = final.tolist()
+        days_list = days.tolist()
+        normalized_records: List[HackathonRecord] = []
+        for index in np.flatnonzero(keep).tolist():
+            created = created_at_default
+            if created_at is not None and created_at[index] != NAT:
+                created = moment(created_at[index])[1]
+            start_at, start_iso = moment(start_list[index])
+            final_at, final_iso = moment(final_list[index])
+            row = emit(
+                records[index],
+                start_iso,
+                final_iso,
+                days_list[index],
+                created,
+                organizer_counts,
+                start_at,
+                final_at,
+            )
+            if row is not None:
+                normalized_records.append(row)
+        return normalized_records
+
+    normalize.__name__ = normalize.__qualname__ = f"normalize_{spec.key}_hackathons_columnar"
+    return normalize
@@ -1,123 +1,162 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-import re
-import time
-import urllib.request
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
+from urllib.parse import urlsplit
+
+try:
+    from app.ingestion.embedded_json import NEXT_DATA_START, SCRIPT_END, find_embedded_slice
+    from app.ingestion.http_client import get_default_client, run_blocking
+    from app.ingestion.resilience import call_with_retries
+except ModuleNotFoundError:
+    from ingestion.embedded_json import (  # type: ignore[no-redef]
+        NEXT_DATA_START,
+        SCRIPT_END,
+        find_embedded_slice,
+    )
+    from ingestion.http_client import get_default_client, run_blocking  # type: ignore[no-redef]
+    from ingestion.resilience import call_with_retries  # type: ignore[no-redef]
 
 logger = logging.getLogger(__name__)
 
 DEVFOLIO_HACKATHONS_URL = "https://devfolio.co/hackathons"
+DEVFOLIO_HOST = urlsplit(DEVFOLIO_HACKATHONS_URL).hostname or ""
 DEFAULT_TIMEOUT_SECONDS = 30
-DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
 MAX_RETRIES = 2
-RETRY_BACKOFF_SECONDS = 2
-NEXT_DATA_PATTERN = re.compile(
-    r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-    flags=re.DOTALL,
-)
-
-
-def _iter_hackathon_candidates(value: Any) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
 
-    if isinstance(value, list):
-        for item in value:
-            results.extend(_iter_hackathon_candidates(item))
-        return results
 
-    if not isinstance(value, dict):
-        return results
-
-    uuid = str(value.get("uuid") or "").strip()
-    if uuid:
-        results.append(value)
-        return results
-
-    preferred_keys = (
-        "open_hackathons",
-        "featured_hackathons",
-        "hackathons",
-        "all_hackathons",
-    )
-    for key in preferred_keys:
-        nested = value.get(key)
-        if isinstance(nested, list):
-            results.extend(_iter_hackathon_candidates(nested))
+PREFERRED_CANDIDATE_KEYS = (
+    "open_hackathons",
+    "featured_hackathons",
+    "hackathons",
+    "all_hackathons",
+)
+# Where the hackathon lists live in __NEXT_DATA__; "*" fans out over a list.
+QUERY_DATA_PATH = ("props", "pageProps", "dehydratedState", "queries", "*", "state", "data")
+
+
+def _resolve_path(payload: Any, path: Sequence[str]) -> List[Any]:
+    nodes = [payload]
+    for step in path:
+        next_nodes: List[Any] = []
+        for node in nodes:
+            if step == "*":
+                if isinstance(node, list):
+                    next_nodes.extend(node)
+            elif isinstance(node, dict) and step in node:
+                next_nodes.append(node[step])
+        nodes = next_nodes
+    return nodes
+
+
+def _iter_hackathon_candidates(
+    value: Any,
+    seen_uuids: Optional[Set[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    # Explicit stack, so every node is visited once and deep payloads cannot
+    # hit the recursion limit. Children are pushed in reverse so they pop in
+    # document order, with the preferred hackathon lists ahead of other keys.
+    seen = set() if seen_uuids is None else seen_uuids
+    stack: List[Any] = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(item for item in reversed(node) if isinstance(item, (dict, list)))
+            continue
+        if not isinstance(node, dict):
+            continue
 
-    for nested in value.values():
-        if isinstance(nested, (dict, list)):
-            results.extend(_iter_hackathon_candidates(nested))
+        uuid = str(node.get("uuid") or "").strip()
+        if uuid:
+            if uuid not in seen:
+                seen.add(uuid)
+                yield node
+            continue
 
-    return results
+        for key in reversed(node):
+            nested = node[key]
+            if isinstance(nested, dict) or (
+                isinstance(nested, list) and key not in PREFERRED_CANDIDATE_KEYS
+            ):
+                stack.append(nested)
+        for key in reversed(PREFERRED_CANDIDATE_KEYS):
+            nested = node.get(key)
+            if isinstance(nested, list):
+                stack.append(nested)
 
 
 def extract_devfolio_hackathons_from_html(html: str) -> List[Dict[str, Any]]:
-    match = NEXT_DATA_PATTERN.search(html)
-    if not match:
+    next_data = find_embedded_slice(html, NEXT_DATA_START, SCRIPT_END)
+    if next_data is None:
         logger.warning("Devfolio: __NEXT_DATA__ script tag not found in HTML")
         return []
+    return extract_devfolio_hackathons_from_next_data(next_data)
+
 
+def extract_devfolio_hackathons_from_next_data(
+    next_data: Union[str, bytes],
+) -> List[Dict[str, Any]]:
     try:
-        payload = json.loads(match.group(1))
+        # Like the full-page decode this replaced, drop invalid UTF-8 bytes
+        # rather than the whole payload.
+        payload = json.loads(
+            next_data.decode("utf-8", errors="ignore")
+            if isinstance(next_data, bytes)
+            else next_data
+        )
     except Exception as exc:
         logger.error("Devfolio: failed to parse __NEXT_DATA__ JSON: %s", exc)
         return []
 
-    queries = (
-        payload.get("props", {})
-        .get("pageProps", {})
-        .get("dehydratedState", {})
-        .get("queries", [])
-    )
-    if not queries:
+    query_data = _resolve_path(payload, QUERY_DATA_PATH)
+    if not query_data:
         logger.warning("Devfolio: no queries found in __NEXT_DATA__ payload")
         return []
 
+    seen_uuids: Set[str] = set()
     records: List[Dict[str, Any]] = []
-    seen_uuids = set()
-    for query in queries:
-        if not isinstance(query, dict):
-            continue
-        data = query.get("state", {}).get("data", {})
-        for event in _iter_hackathon_candidates(data):
-            uuid = str(event.get("uuid") or "").strip()
-            if not uuid or uuid in seen_uuids:
-                continue
-            seen_uuids.add(uuid)
-            records.append(event)
+    for data in query_data:
+        records.extend(_iter_hackathon_candidates(data, seen_uuids))
 
     logger.info("Devfolio: extracted %d hackathons from HTML", len(records))
     return records
 
 
-def fetch_devfolio_hackathons(
+def _fetch_and_extract_devfolio(
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
 ) -> List[Dict[str, Any]]:
-    request = urllib.request.Request(
-        DEVFOLIO_HACKATHONS_URL,
-        headers={
-            "User-Agent": DEFAULT_USER_AGENT,
-            "Accept": "text/html",
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-    )
+    try:
+        # Only the __NEXT_DATA__ script is read and decoded; the stream stops
+        # as soon as it closes.
+        next_data = call_with_retries(
+            lambda: get_default_client().get_embedded(
+                DEVFOLIO_HACKATHONS_URL,
+                NEXT_DATA_START,
+                SCRIPT_END,
+                timeout_seconds=timeout_seconds,
+            ),
+            host=DEVFOLIO_HOST,
+            description="Devfolio",
+            max_attempts=MAX_RETRIES,
+        )
+    except Exception as exc:
+        logger.error("Devfolio: all %d attempts failed: %s", MAX_RETRIES, exc)
+        return []
+    if next_data is None:
+        logger.warning("Devfolio: __NEXT_DATA__ script tag not found in HTML")
+        return []
+    return extract_devfolio_hackathons_from_next_data(next_data)
+
 
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-                html = response.read().decode("utf-8", errors="ignore")
-            return extract_devfolio_hackathons_from_html(html)
-        except Exception as exc:
-            last_error = exc
-            logger.warning(
-                "Devfolio attempt %d/%d failed: %s", attempt, MAX_RETRIES, exc
-            )
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
-
-    logger.error("Devfolio: all %d attempts failed: %s", MAX_RETRIES, last_error)
-    return []
+async def fetch_devfolio_hackathons_async(
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> List[Dict[str, Any]]:
+    return await run_blocking(_fetch_and_extract_devfolio, timeout_seconds)
+
+
+def fetch_devfolio_hackathons(
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> List[Dict[str, Any]]:
+    return asyncio.run(fetch_devfolio_hackathons_async(timeout_seconds=timeout_seconds))
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import math
-import time
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from app.ingestion.crawl import SourceCrawl, UnchangedPageStreak
+    from app.ingestion.http_client import get_default_client, run_blocking
+    from app.ingestion.projection import FieldProjection, project_items
+    from app.ingestion.resilience import (
+        FailureBudget,
+        SOURCE_FATAL_ERRORS,
+        call_with_retries,
+    )
+except ModuleNotFoundError:
+    from ingestion.crawl import SourceCrawl, UnchangedPageStreak  # type: ignore[no-redef]
+    from ingestion.http_client import get_default_client, run_blocking  # type: ignore[no-redef]
+    from ingestion.projection import FieldProjection, project_items  # type: ignore[no-redef]
+    from ingestion.resilience import (  # type: ignore[no-redef]
+        FailureBudget,
+        SOURCE_FATAL_ERRORS,
+        call_with_retries,
+    )
 
 logger = logging.getLogger(__name__)
 
 DEVPOST_API_URL = "https://devpost.com/api/hackathons"
+DEVPOST_HOST = urllib.parse.urlsplit(DEVPOST_API_URL).hostname or ""
 DEFAULT_TIMEOUT_SECONDS = 30
-DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
 MAX_RETRIES = 2
-RETRY_BACKOFF_SECONDS = 2
+DEFAULT_MAX_IN_FLIGHT_PAGES = 4
+
+# Everything normalize_devpost_hackathons reads from a listing item.
+DEVPOST_ITEM_FIELDS: FieldProjection = {
+    "id": None,
+    "title": None,
+    "url": None,
+    "organization_name": None,
+    "submission_period_dates": None,
+    "analytics_identifier": None,
+    "prize_amount": None,
+    "displayed_location": {"icon": None, "location": None},
+    "themes": {"name": None},
+}
 
 
 def _build_url(challenge_type: str, page: int) -> str:
@@ -24,78 +54,329 @@ def _build_url(challenge_type: str, page: int) -> str:
     return f"{DEVPOST_API_URL}?{params}"
 
 
-def _fetch_json(url: str, timeout_seconds: int) -> Dict[str, Any]:
-    request = urllib.request.Request(
-        url,
-        headers={"User-Agent": DEFAULT_USER_AGENT, "Accept": "application/json"},
+def _fetch_json(
+    url: str,
+    timeout_seconds: int,
+    budget: Optional[FailureBudget] = None,
+) -> Dict[str, Any]:
+    return call_with_retries(
+        lambda: get_default_client().get_json(url, timeout_seconds=timeout_seconds),
+        host=DEVPOST_HOST,
+        description=f"Devpost fetch for {url[:80]}",
+        budget=budget,
+        max_attempts=MAX_RETRIES,
     )
 
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-                body = response.read().decode("utf-8", errors="ignore")
-            return json.loads(body)
-        except Exception as exc:
-            last_error = exc
+
+def _hackathons_in(payload: Any) -> List[Any]:
+    hackathons = payload.get("hackathons") if isinstance(payload, dict) else None
+    if not isinstance(hackathons, list):
+        return []
+    return project_items(hackathons, DEVPOST_ITEM_FIELDS)
+
+
+def _total_pages(payload: Dict[str, Any], first_page_size: int) -> Optional[int]:
+    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+    total_count = int(meta.get("total_count") or 0)
+    per_page = int(meta.get("per_page") or first_page_size or 1)
+    if total_count <= 0:
+        return None
+    return max(1, math.ceil(total_count / max(per_page, 1)))
+
+
+def _page_signature(payload: Dict[str, Any], hackathons: List[Any]) -> Tuple[Any, ...]:
+    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+    ids = sorted(
+        str(item.get("id")) for item in hackathons if isinstance(item, dict)
+    )
+    return (meta.get("total_count"), tuple(ids))
+
+
+async def _fetch_json_async(
+    url: str,
+    timeout_seconds: int,
+    budget: Optional[FailureBudget] = None,
+) -> Dict[str, Any]:
+    return await run_blocking(_fetch_json, url, timeout_seconds, budget)
+
+
+async def _fetch_page_payload(
+    challenge_type: str,
+    page: int,
+    timeout_seconds: int,
+    budget: FailureBudget,
+    crawl: SourceCrawl,
+) -> Dict[str, Any]:
+    key = f"{challenge_type}:{page}"
+    payload = crawl.resumed_page(key)
+    if payload is None:
+        url = _build_url(challenge_type=challenge_type, page=page)
+        payload = await _fetch_json_async(url, timeout_seconds=timeout_seconds, budget=budget)
+        crawl.checkpoint_page(key, payload)
+    return payload
+
+
+async def _fetch_page_hackathons(
+    challenge_type: str,
+    page: int,
+    timeout_seconds: int,
+    in_flight: asyncio.Semaphore,
+    budget: FailureBudget,
+    crawl: SourceCrawl,
+) -> List[Any]:
+    async with in_flight:
+        return _hackathons_in(
+            await _fetch_page_payload(challenge_type, page, timeout_seconds, budget, crawl)
+        )
+
+
+async def _fetch_planned_pages(
+    challenge_type: str,
+    pages: List[int],
+    timeout_seconds: int,
+    in_flight_limit: int,
+    budget: FailureBudget,
+    streak: UnchangedPageStreak,
+) -> Dict[int, Any]:
+    in_flight = asyncio.Semaphore(in_flight_limit)
+    # A full crawl fans every planned page out at once. A paced crawl goes one
+    # window at a time so it can stop on a deadline or a run of unchanged pages.
+    window = in_flight_limit if streak.crawl.paced else max(len(pages), 1)
+    results: Dict[int, Any] = {}
+    for start in range(0, len(pages), window):
+        if streak.crawl.out_of_time():
             logger.warning(
-                "Devpost fetch attempt %d/%d for %s failed: %s",
-                attempt, MAX_RETRIES, url[:80], exc,
+                "Devpost: deadline reached before %s page %d", challenge_type, pages[start]
+            )
+            break
+        batch = pages[start : start + window]
+        outcomes = await asyncio.gather(
+            *(
+                _fetch_page_hackathons(
+                    challenge_type, page, timeout_seconds, in_flight, budget, streak.crawl
+                )
+                for page in batch
+            ),
+            return_exceptions=True,
+        )
+        stop_after: Optional[int] = None
+        for page, outcome in zip(batch, outcomes):
+            results[page] = outcome
+            if isinstance(outcome, BaseException):
+                streak.reset()
+            elif streak.observe(outcome) and stop_after is None:
+                stop_after = page
+        if stop_after is not None and stop_after < pages[-1]:
+            logger.info(
+                "Devpost: %d unchanged %s pages in a row, stopping at page %d",
+                streak.length,
+                challenge_type,
+                stop_after,
             )
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+            streak.crawl.mark_partial(
+                f"incremental stop at {challenge_type} page {stop_after}", resumable=False
+            )
+            break
+    return results
+
 
-    logger.error("Devpost: all %d attempts failed: %s", MAX_RETRIES, last_error)
-    return []
+async def _walk_remaining_pages(
+    challenge_type: str,
+    page_cap: Optional[int],
+    timeout_seconds: int,
+    budget: FailureBudget,
+    streak: UnchangedPageStreak,
+) -> Dict[int, List[Any]]:
+    # Without meta.total_count there is nothing to plan against, so walk
+    # sequentially until an empty page like the API expects.
+    pages: Dict[int, List[Any]] = {}
+    page = 2
+    while page_cap is None or page <= page_cap:
+        if streak.crawl.out_of_time():
+            logger.warning(
+                "Devpost: deadline reached before %s page %d", challenge_type, page
+            )
+            break
+        try:
+            hackathons = _hackathons_in(
+                await _fetch_page_payload(
+                    challenge_type, page, timeout_seconds, budget, streak.crawl
+                )
+            )
+        except SOURCE_FATAL_ERRORS:
+            raise
+        except Exception as exc:
+            logger.error(
+                "Devpost: giving up on %s page %d: %s", challenge_type, page, exc
+            )
+            streak.crawl.mark_partial(f"{challenge_type} page {page} failed")
+            break
+        if len(hackathons) == 0:
+            logger.info(
+                "Devpost: no more results for %s at page %d", challenge_type, page
+            )
+            break
+        pages[page] = hackathons
+        if streak.observe(hackathons):
+            logger.info(
+                "Devpost: %d unchanged %s pages in a row, stopping at page %d",
+                streak.length,
+                challenge_type,
+                page,
+            )
+            streak.crawl.mark_partial(
+                f"incremental stop at {challenge_type} page {page}", resumable=False
+            )
+            break
+        page += 1
+    return pages
 
 
-def fetch_devpost_hackathons(
+async def fetch_devpost_hackathons_async(
     max_pages: int = 5,
     challenge_types: Sequence[str] = ("online", "in-person", "hybrid"),
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_PAGES,
+    crawl: Optional[SourceCrawl] = None,
 ) -> List[Dict[str, Any]]:
     page_cap = max_pages if max_pages > 0 else None
+    pages_by_key: Dict[Tuple[int, int], List[Any]] = {}
+    planned_pages: Dict[int, List[int]] = {}
+    unplanned_types: List[int] = []
+    seen_signatures: Dict[Tuple[Any, ...], str] = {}
+    unique_types = list(dict.fromkeys(challenge_types))
+    budget = FailureBudget("Devpost")
+    crawl = crawl or SourceCrawl("devpost")
+    streaks: Dict[int, UnchangedPageStreak] = {}
+
+    # Page 1 of every challenge type comes first: its meta sizes the crawl and
+    # lets us drop challenge types whose listing duplicates one already planned.
+    for type_index, challenge_type in enumerate(unique_types):
+        if crawl.out_of_time():
+            logger.warning("Devpost: deadline reached before %s page 1", challenge_type)
+            break
+        try:
+            payload = await _fetch_page_payload(
+                challenge_type, 1, timeout_seconds, budget, crawl
+            )
+        except SOURCE_FATAL_ERRORS:
+            raise
+        except Exception as exc:
+            logger.error("Devpost: giving up on %s page 1: %s", challenge_type, exc)
+            crawl.mark_partial(f"{challenge_type} page 1 failed")
+            continue
+
+        hackathons = _hackathons_in(payload)
+        if len(hackathons) == 0:
+            logger.info("Devpost: no more results for %s at page 1", challenge_type)
+            continue
+        pages_by_key[(type_index, 1)] = hackathons
+        streak = crawl.unchanged_streak()
+        page_one_unchanged = streak.observe(hackathons)
+
+        # Only whole duplicate listings are skipped: same total count and the
+        # same page-1 ids. A page's ids are unknown until it is fetched, so
+        # listings that merely overlap are still fetched in full and their
+        # shared events merged by id afterwards.
+        signature = _page_signature(payload, hackathons)
+        if signature in seen_signatures:
+            logger.info(
+                "Devpost: %s listing matches %s, skipping its remaining pages",
+                challenge_type,
+                seen_signatures[signature],
+            )
+            continue
+        seen_signatures[signature] = challenge_type
+
+        total_pages = _total_pages(payload, len(hackathons))
+        if page_one_unchanged and (total_pages is None or total_pages > 1):
+            if page_cap is None or page_cap > 1:
+                logger.info(
+                    "Devpost: %s page 1 is unchanged, stopping at page 1", challenge_type
+                )
+                crawl.mark_partial(
+                    f"incremental stop at {challenge_type} page 1", resumable=False
+                )
+            continue
+        streaks[type_index] = streak
+        if total_pages is None:
+            if page_cap is None or page_cap > 1:
+                unplanned_types.append(type_index)
+            continue
+        last_page = total_pages if page_cap is None else min(page_cap, total_pages)
+        if last_page >= 2:
+            planned_pages[type_index] = list(range(2, last_page + 1))
+
+    in_flight_limit = max(1, max_in_flight)
+    planned_types = list(planned_pages)
+    results = await asyncio.gather(
+        *(
+            _fetch_planned_pages(
+                unique_types[type_index],
+                planned_pages[type_index],
+                timeout_seconds,
+                in_flight_limit,
+                budget,
+                streaks[type_index],
+            )
+            for type_index in planned_types
+        )
+    )
+    fatal_error: Optional[BaseException] = None
+    for type_index, type_results in zip(planned_types, results):
+        challenge_type = unique_types[type_index]
+        for page, result in type_results.items():
+            if isinstance(result, SOURCE_FATAL_ERRORS):
+                fatal_error = fatal_error or result
+            elif isinstance(result, BaseException):
+                logger.error(
+                    "Devpost: giving up on %s page %d: %s", challenge_type, page, result
+                )
+                crawl.mark_partial(f"{challenge_type} page {page} failed")
+            else:
+                pages_by_key[(type_index, page)] = result
+    # A partial listing would make the pipeline deactivate every event on the
+    # pages we lost, so a dead host or an exhausted budget fails the source.
+    if fatal_error is not None:
+        raise fatal_error
+
+    for type_index in unplanned_types:
+        walked = await _walk_remaining_pages(
+            unique_types[type_index],
+            page_cap=page_cap,
+            timeout_seconds=timeout_seconds,
+            budget=budget,
+            streak=streaks[type_index],
+        )
+        for page, hackathons in walked.items():
+            pages_by_key[(type_index, page)] = hackathons
+
+    # Merge in (challenge type, page) order so the result does not depend on
+    # which page finished first.
     records_by_id: Dict[str, Dict[str, Any]] = {}
-    try:
-        for challenge_type in challenge_types:
-            page = 1
-            inferred_page_cap = page_cap
-            while True:
-                if inferred_page_cap is not None and page > inferred_page_cap:
-                    break
-                url = _build_url(challenge_type=challenge_type, page=page)
-                try:
-                    payload = _fetch_json(url, timeout_seconds=timeout_seconds)
-                except Exception as exc:
-                    logger.error(
-                        "Devpost: giving up on %s page %d: %s", challenge_type, page, exc
-                    )
-                    break
-
-                hackathons = payload.get("hackathons")
-                if not isinstance(hackathons, list) or len(hackathons) == 0:
-                    logger.info(
-                        "Devpost: no more results for %s at page %d", challenge_type, page
-                    )
-                    break
-
-                if page == 1 and inferred_page_cap is None:
-                    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
-                    total_count = int(meta.get("total_count") or 0)
-                    per_page = int(meta.get("per_page") or len(hackathons) or 1)
-                    if total_count > 0:
-                        inferred_page_cap = max(
-                            1, math.ceil(total_count / max(per_page, 1))
-                        )
-
-                for item in hackathons:
-                    if not isinstance(item, dict):
-                        continue
-                    key = str(item.get("id"))
-                    records_by_id[key] = item
-                page += 1
-    except Exception as exc:
-        logger.error("Devpost: unexpected error during fetch: %s", exc)
+    for key in sorted(pages_by_key):
+        for item in pages_by_key[key]:
+            if not isinstance(item, dict):
+                continue
+            records_by_id[str(item.get("id"))] = item
 
     logger.info("Devpost: fetched %d unique hackathons", len(records_by_id))
     return list(records_by_id.values())
+
+
+def fetch_devpost_hackathons(
+    max_pages: int = 5,
+    challenge_types: Sequence[str] = ("online", "in-person", "hybrid"),
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_PAGES,
+    crawl: Optional[SourceCrawl] = None,
+) -> List[Dict[str, Any]]:
+    return asyncio.run(
+        fetch_devpost_hackathons_async(
+            max_pages=max_pages,
+            challenge_types=challenge_types,
+            timeout_seconds=timeout_seconds,
+            max_in_flight=max_in_flight,
+            crawl=crawl,
+        )
+    )
@@ -1,41 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-import time
-import urllib.request
-from typing import Any, Dict, List
-from urllib.parse import urljoin, urlparse
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
+
+try:
+    from app.ingestion.http_client import get_default_client, run_blocking
+    from app.ingestion.resilience import call_with_retries
+except ModuleNotFoundError:
+    from ingestion.http_client import get_default_client, run_blocking  # type: ignore[no-redef]
+    from ingestion.resilience import call_with_retries  # type: ignore[no-redef]
 
 logger = logging.getLogger(__name__)
 
 HACKEREARTH_HACKATHONS_URL = "https://www.hackerearth.com/challenges/hackathon/"
+HACKEREARTH_HOST = urlsplit(HACKEREARTH_HACKATHONS_URL).hostname or ""
 DEFAULT_TIMEOUT_SECONDS = 30
-DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
 MAX_RETRIES = 2
-RETRY_BACKOFF_SECONDS = 2
-
-CARD_PATTERN = re.compile(
-    r'<div class="challenge-card-modern">\s*'
-    r'<a class="challenge-card-wrapper challenge-card-link"[^>]*href="(?P<url>[^"]+)"[^>]*>'
-    r'(?P<body>.*?)'
-    r"</a>.*?</div>\s*<script type=\"text/javascript\">(?P<script>.*?)</script>",
-    flags=re.DOTALL,
-)
 
-TITLE_PATTERN = re.compile(
-    r'<span class="challenge-list-title challenge-card-wrapper">\s*(?P<title>.*?)\s*</span>',
-    flags=re.DOTALL,
-)
-COUNTDOWN_ID_PATTERN = re.compile(r'id="countdown-(?P<countdown_id>\d+)"')
-ORGANIZER_PATTERN = re.compile(
-    r'<div class="company-details[^"]*">.*?</div>\s*(?P<organizer>[^<\n]+)',
-    flags=re.DOTALL,
-)
+CARD_CLASS = "challenge-card-modern"
+CARD_LINK_CLASSES = {"challenge-card-wrapper", "challenge-card-link"}
+TITLE_CLASSES = {"challenge-list-title", "challenge-card-wrapper"}
+COMPANY_DETAILS_CLASS = "company-details"
+COUNTDOWN_ID_PATTERN = re.compile(r"^countdown-(?P<countdown_id>\d+)$")
 SECONDS_PATTERN = re.compile(
     r"var seconds_left = (?P<target>\d+) - (?P<now>\d+);\s*"
-    r"var countdown_elem = \$\('#countdown-(?P<countdown_id>\d+)'\);",
-    flags=re.DOTALL,
+    r"var countdown_elem = \$\('#countdown-(?P<countdown_id>\d+)'\);"
 )
 
 
@@ -50,42 +43,152 @@ def _slug_from_url(url: str) -> str:
     return path.split("/")[-1]
 
 
+class _Card:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.title_parts: List[str] = []
+        self.organizer = ""
+        self.countdown_id = ""
+
+
+class _HackerEarthPageParser(HTMLParser):
+    """Single pass over the listing page.
+
+    Cards and countdown scripts are collected separately and joined on the
+    countdown id afterwards, so a card never has to search ahead for its
+    script and a missing ``</script>`` cannot trigger a rescan.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.cards: List[_Card] = []
+        self.countdowns: Dict[str, Tuple[int, int]] = {}
+        self._in_card_wrapper = False
+        self._card: Optional[_Card] = None
+        self._title_depth = 0
+        # Organizer text is the first text after the first </div> that
+        # follows the company-details opening tag.
+        self._organizer_state = ""
+        self._in_script = False
+        self._script_parts: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        classes = set(attributes.get("class", "").split())
+        if tag == "script":
+            self._in_script = True
+            self._script_parts = []
+            return
+        if tag == "div" and CARD_CLASS in classes:
+            self._in_card_wrapper = True
+            return
+
+        card = self._card
+        if card is None:
+            if tag == "a" and self._in_card_wrapper and CARD_LINK_CLASSES <= classes:
+                self._card = _Card(attributes.get("href", ""))
+                self._in_card_wrapper = False
+            return
+
+        if self._title_depth:
+            if tag == "span":
+                self._title_depth += 1
+        elif tag == "span" and TITLE_CLASSES <= classes and not card.title_parts:
+            self._title_depth = 1
+        if tag == "div" and not card.organizer and not self._organizer_state:
+            if any(name.startswith(COMPANY_DETAILS_CLASS) for name in classes):
+                self._organizer_state = "await_close"
+        if not card.countdown_id:
+            countdown_match = COUNTDOWN_ID_PATTERN.match(attributes.get("id", ""))
+            if countdown_match:
+                card.countdown_id = countdown_match.group("countdown_id")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            if self._in_script:
+                self._record_countdowns("".join(self._script_parts))
+            self._in_script = False
+            return
+        card = self._card
+        if card is None:
+            return
+        if tag == "span" and self._title_depth:
+            self._title_depth -= 1
+        elif tag == "div" and self._organizer_state == "await_close":
+            self._organizer_state = "capture"
+        elif tag == "a":
+            self._finish_card()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_script:
+            self._script_parts.append(data)
+            return
+        card = self._card
+        if card is None:
+            return
+        if self._title_depth:
+            card.title_parts.append(data)
+        if self._organizer_state == "capture":
+            text = data.lstrip()
+            if text:
+                card.organizer = text.split("\n", 1)[0]
+                self._organizer_state = "done"
+
+    def close(self) -> None:
+        super().close()
+        if self._in_script:
+            # HTMLParser holds back the body of a script that is never closed.
+            self._script_parts.append(self.rawdata)
+            self._record_countdowns("".join(self._script_parts))
+            self._in_script = False
+        if self._card is not None:
+            self._finish_card()
+
+    def _finish_card(self) -> None:
+        if self._card is not None:
+            self.cards.append(self._card)
+        self._card = None
+        self._title_depth = 0
+        self._organizer_state = ""
+
+    def _record_countdowns(self, script: str) -> None:
+        for match in SECONDS_PATTERN.finditer(script):
+            self.countdowns.setdefault(
+                match.group("countdown_id"),
+                (int(match.group("target")), int(match.group("now"))),
+            )
+
+
 def extract_hackerearth_hackathons_from_html(html_body: str) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    for match in CARD_PATTERN.finditer(html_body):
-        url = _strip_whitespace(match.group("url"))
-        body = match.group("body")
-        script = match.group("script")
+    parser = _HackerEarthPageParser()
+    parser.feed(html_body)
+    parser.close()
 
-        title_match = TITLE_PATTERN.search(body)
-        countdown_id_match = COUNTDOWN_ID_PATTERN.search(body)
-        seconds_match = SECONDS_PATTERN.search(script)
+    records: List[Dict[str, Any]] = []
+    for card in parser.cards:
+        url = _strip_whitespace(card.url)
+        title = _strip_whitespace("".join(card.title_parts))
+        countdown = parser.countdowns.get(card.countdown_id) if card.countdown_id else None
 
-        if not title_match or not countdown_id_match or not seconds_match:
+        if not title or countdown is None:
             logger.debug("HackerEarth: skipping card missing required fields at url=%s", url[:60])
             continue
-        if countdown_id_match.group("countdown_id") != seconds_match.group("countdown_id"):
-            continue
 
-        organizer_match = ORGANIZER_PATTERN.search(body)
-        organizer = (
-            _strip_whitespace(organizer_match.group("organizer"))
-            if organizer_match
-            else "Unknown Organizer"
-        )
+        organizer = _strip_whitespace(card.organizer) or "Unknown Organizer"
 
         slug = _slug_from_url(url)
         if not slug:
             continue
 
+        target, now = countdown
         records.append(
             {
                 "id": slug,
-                "title": _strip_whitespace(title_match.group("title")),
+                "title": title,
                 "url": urljoin(HACKEREARTH_HACKATHONS_URL, url),
                 "organizer": organizer,
-                "start_unix": int(seconds_match.group("now")),
-                "final_submission_unix": int(seconds_match.group("target")),
+                "start_unix": now,
+                "final_submission_unix": target,
             }
         )
 
@@ -93,31 +196,31 @@ def extract_hackerearth_hackathons_from_html(html_body: str) -> List[Dict[str, A
     return records
 
 
-def fetch_hackerearth_hackathons(
+def _fetch_and_extract_hackerearth(
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
 ) -> List[Dict[str, Any]]:
-    request = urllib.request.Request(
-        HACKEREARTH_HACKATHONS_URL,
-        headers={
-            "User-Agent": DEFAULT_USER_AGENT,
-            "Accept": "text/html",
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-    )
-
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-                html_body = response.read().decode("utf-8", errors="ignore")
-            return extract_hackerearth_hackathons_from_html(html_body)
-        except Exception as exc:
-            last_error = exc
-            logger.warning(
-                "HackerEarth attempt %d/%d failed: %s", attempt, MAX_RETRIES, exc
-            )
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+    try:
+        html_body = call_with_retries(
+            lambda: get_default_client().get_text(
+                HACKEREARTH_HACKATHONS_URL, timeout_seconds=timeout_seconds
+            ),
+            host=HACKEREARTH_HOST,
+            description="HackerEarth",
+            max_attempts=MAX_RETRIES,
+        )
+    except Exception as exc:
+        logger.error("HackerEarth: all %d attempts failed: %s", MAX_RETRIES, exc)
+        return []
+    return extract_hackerearth_hackathons_from_html(html_body)
 
-    logger.error("HackerEarth: all %d attempts failed: %s", MAX_RETRIES, last_error)
-    return []
+
+async def fetch_hackerearth_hackathons_async(
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> List[Dict[str, Any]]:
+    return await run_blocking(_fetch_and_extract_hackerearth, timeout_seconds)
+
+
+def fetch_hackerearth_hackathons(
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> List[Dict[str, Any]]:
+    return asyncio.run(fetch_hackerearth_hackathons_async(timeout_seconds=timeout_seconds))
@@ -1,33 +1,75 @@
 from __future__ import annotations
 
+import asyncio
 import html
 import json
 import logging
-import re
-import time
-import urllib.request
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    from app.ingestion.crawl import SourceCrawl
+    from app.ingestion.embedded_json import ATTRIBUTE_END, DATA_PAGE_START, find_embedded_slice
+    from app.ingestion.http_client import get_default_client, run_blocking
+    from app.ingestion.resilience import call_with_retries
+except ModuleNotFoundError:
+    from ingestion.crawl import SourceCrawl  # type: ignore[no-redef]
+    from ingestion.embedded_json import (  # type: ignore[no-redef]
+        ATTRIBUTE_END,
+        DATA_PAGE_START,
+        find_embedded_slice,
+    )
+    from ingestion.http_client import get_default_client, run_blocking  # type: ignore[no-redef]
+    from ingestion.resilience import call_with_retries  # type: ignore[no-redef]
 
 logger = logging.getLogger(__name__)
 
 MLH_SEASON_EVENTS_URL_TEMPLATE = "https://mlh.io/seasons/{season_year}/events"
+MLH_HOST = "mlh.io"
 DEFAULT_TIMEOUT_SECONDS = 30
-DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
 MAX_RETRIES = 2
-RETRY_BACKOFF_SECONDS = 2
-DATA_PAGE_PATTERN = re.compile(r'data-page="([^"]+)"', flags=re.DOTALL)
+DEFAULT_SEASON_WINDOW_DAYS = 45
+
+
+def mlh_seasons_to_fetch(
+    now: datetime,
+    season_year: Optional[int] = None,
+    window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+) -> List[int]:
+    # An explicit season is fetched on its own; otherwise the neighbouring
+    # season joins the current one within window_days of the year boundary.
+    if season_year:
+        return [season_year]
+    seasons = [now.year]
+    if window_days > 0:
+        window = timedelta(days=window_days)
+        if datetime(now.year + 1, 1, 1, tzinfo=timezone.utc) - now <= window:
+            seasons.append(now.year + 1)
+        if now - datetime(now.year, 1, 1, tzinfo=timezone.utc) < window:
+            seasons.append(now.year - 1)
+    return seasons
 
 
 def extract_mlh_upcoming_events_from_html(html_body: str) -> List[Dict[str, Any]]:
-    match = DATA_PAGE_PATTERN.search(html_body)
-    if not match:
+    data_page = find_embedded_slice(html_body, DATA_PAGE_START, ATTRIBUTE_END)
+    if not data_page:
         logger.warning("MLH: data-page attribute not found in HTML")
         return []
+    return extract_mlh_upcoming_events_from_data_page(data_page)
+
 
+def extract_mlh_upcoming_events_from_data_page(
+    data_page: Union[str, bytes],
+) -> List[Dict[str, Any]]:
     try:
-        decoded = html.unescape(match.group(1))
-        payload = json.loads(decoded)
+        text = (
+            data_page.decode("utf-8", errors="ignore")
+            if isinstance(data_page, bytes)
+            else data_page
+        )
+        # The attribute is HTML-escaped JSON; skip the unescape pass when
+        # there is nothing to unescape.
+        payload = json.loads(html.unescape(text) if "&" in text else text)
     except Exception as exc:
         logger.error("MLH: failed to parse data-page JSON: %s", exc)
         return []
@@ -42,34 +84,85 @@ def extract_mlh_upcoming_events_from_html(html_body: str) -> List[Dict[str, Any]
     return results
 
 
-def fetch_mlh_hackathons(
+def _fetch_and_extract_mlh(
+    season_year: int,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+) -> Optional[List[Dict[str, Any]]]:
+    # None means the season page could not be read, as opposed to a season
+    # without upcoming events.
+    url = MLH_SEASON_EVENTS_URL_TEMPLATE.format(season_year=season_year)
+    try:
+        data_page = call_with_retries(
+            lambda: get_default_client().get_embedded(
+                url, DATA_PAGE_START, ATTRIBUTE_END, timeout_seconds=timeout_seconds
+            ),
+            host=MLH_HOST,
+            description="MLH",
+            max_attempts=MAX_RETRIES,
+        )
+    except Exception as exc:
+        logger.error("MLH: all %d attempts failed: %s", MAX_RETRIES, exc)
+        return None
+    if not data_page:
+        logger.warning("MLH: data-page attribute not found in HTML")
+        return None
+    return extract_mlh_upcoming_events_from_data_page(data_page)
+
+
+async def fetch_mlh_hackathons_async(
     season_year: Optional[int] = None,
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+    now: Optional[datetime] = None,
+    crawl: Optional[SourceCrawl] = None,
 ) -> List[Dict[str, Any]]:
-    resolved_year = season_year or datetime.now(timezone.utc).year
-    url = MLH_SEASON_EVENTS_URL_TEMPLATE.format(season_year=resolved_year)
-    request = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": DEFAULT_USER_AGENT,
-            "Accept": "text/html",
-            "Accept-Language": "en-US,en;q=0.9",
-        },
+    crawl = crawl or SourceCrawl("mlh")
+    seasons = mlh_seasons_to_fetch(
+        now or datetime.now(timezone.utc), season_year, season_window_days
     )
+    # Season pages go through the shared client, so an unchanged extra season
+    # costs a conditional request that comes back 304.
+    per_season = await asyncio.gather(
+        *(
+            run_blocking(_fetch_and_extract_mlh, season, timeout_seconds)
+            for season in seasons
+        )
+    )
+
+    # The current season wins when an event is listed under two seasons.
+    events_by_id: Dict[str, Dict[str, Any]] = {}
+    for season, events in zip(seasons, per_season):
+        if events is None:
+            # The other season's events alone must not make the pipeline
+            # deactivate every event of the season that failed.
+            crawl.mark_partial(f"season {season} failed")
+            continue
+        for event in events:
+            key = str(event.get("id") or "").strip()
+            if key and key not in events_by_id:
+                events_by_id[key] = event
+    if len(seasons) > 1:
+        logger.info(
+            "MLH: merged %d events from seasons %s",
+            len(events_by_id),
+            ", ".join(str(season) for season in seasons),
+        )
+    return list(events_by_id.values())
+
 
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-                html_body = response.read().decode("utf-8", errors="ignore")
-            return extract_mlh_upcoming_events_from_html(html_body)
-        except Exception as exc:
-            last_error = exc
-            logger.warning(
-                "MLH attempt %d/%d failed: %s", attempt, MAX_RETRIES, exc
-            )
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
-
-    logger.error("MLH: all %d attempts failed: %s", MAX_RETRIES, last_error)
-    return []
+def fetch_mlh_hackathons(
+    season_year: Optional[int] = None,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+    now: Optional[datetime] = None,
+    crawl: Optional[SourceCrawl] = None,
+) -> List[Dict[str, Any]]:
+    return asyncio.run(
+        fetch_mlh_hackathons_async(
+            season_year=season_year,
+            timeout_seconds=timeout_seconds,
+            season_window_days=season_window_days,
+            now=now,
+            crawl=crawl,
+        )
+    )
@@ -1,78 +1,128 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import time
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    from app.ingestion.crawl import SourceCrawl
+    from app.ingestion.http_client import get_default_client, run_blocking
+    from app.ingestion.projection import FieldProjection, project_items
+    from app.ingestion.resilience import (
+        FailureBudget,
+        SOURCE_FATAL_ERRORS,
+        call_with_retries,
+    )
+except ModuleNotFoundError:
+    from ingestion.crawl import SourceCrawl  # type: ignore[no-redef]
+    from ingestion.http_client import get_default_client, run_blocking  # type: ignore[no-redef]
+    from ingestion.projection import FieldProjection, project_items  # type: ignore[no-redef]
+    from ingestion.resilience import (  # type: ignore[no-redef]
+        FailureBudget,
+        SOURCE_FATAL_ERRORS,
+        call_with_retries,
+    )
 
 logger = logging.getLogger(__name__)
 
 UNSTOP_SEARCH_URL = "https://api.unstop.com/api/public/opportunity/search-result"
+UNSTOP_HOST = urllib.parse.urlsplit(UNSTOP_SEARCH_URL).hostname or ""
 DEFAULT_TIMEOUT_SECONDS = 30
-DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
 MAX_RETRIES = 2
-RETRY_BACKOFF_SECONDS = 2
+
+# Everything normalize_unstop_hackathons reads from a search result item.
+UNSTOP_ITEM_FIELDS: FieldProjection = {
+    "id": None,
+    "title": None,
+    "seo_url": None,
+    "public_url": None,
+    "region": None,
+    "details": None,
+    "approved_date": None,
+    "updated_at": None,
+    "end_date": None,
+    "regnRequirements": {"start_regn_dt": None, "end_regn_dt": None},
+    "organisation": {"name": None},
+    "address_with_country_logo": {"city": None, "state": None, "country": {"name": None}},
+    "prizes": {
+        "cash": None,
+        "pre_placement_internship": None,
+        "pre_placement_opportunity": None,
+        "others": None,
+    },
+    "required_skills": {"skill_name": None, "skill": None},
+}
 
 
 def _fetch_page(
     page: int,
     per_page: int,
     timeout_seconds: int,
+    budget: Optional[FailureBudget] = None,
 ) -> Dict[str, Any]:
     query = urllib.parse.urlencode(
         {"opportunity": "hackathons", "page": str(page), "per_page": str(per_page)}
     )
     url = f"{UNSTOP_SEARCH_URL}?{query}"
-    request = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": DEFAULT_USER_AGENT,
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-    )
 
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-                body = response.read().decode("utf-8", errors="ignore")
-            return json.loads(body)
-        except Exception as exc:
-            last_error = exc
-            logger.warning(
-                "Unstop page %d attempt %d/%d failed: %s",
-                page, attempt, MAX_RETRIES, exc,
-            )
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_SECONDS * attempt)
-
-    logger.error("Unstop: all %d attempts failed: %s", MAX_RETRIES, last_error)
-    return {}
+    return call_with_retries(
+        lambda: get_default_client().get_json(
+            url,
+            headers={"Accept-Language": "en-US,en;q=0.9"},
+            timeout_seconds=timeout_seconds,
+        ),
+        host=UNSTOP_HOST,
+        description=f"Unstop page {page}",
+        budget=budget,
+        max_attempts=MAX_RETRIES,
+    )
 
 
-def fetch_unstop_hackathons(
+async def fetch_unstop_hackathons_async(
     max_pages: int = 15,
     per_page: int = 50,
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    crawl: Optional[SourceCrawl] = None,
 ) -> List[Dict[str, Any]]:
     page_cap = max_pages if max_pages > 0 else None
     items_by_id: Dict[str, Dict[str, Any]] = {}
+    budget = FailureBudget("Unstop")
+    crawl = crawl or SourceCrawl("unstop")
+    unchanged = crawl.unchanged_streak()
     try:
         page = 1
         while True:
             if page_cap is not None and page > page_cap:
                 break
+            if crawl.out_of_time():
+                logger.warning("Unstop: deadline reached before page %d", page)
+                break
+            checkpoint_key = f"{page}:{per_page}"
+            payload = crawl.resumed_page(checkpoint_key)
             try:
-                payload = _fetch_page(page=page, per_page=per_page, timeout_seconds=timeout_seconds)
+                if payload is None:
+                    # Pages stay sequential: last_page is only known once a page
+                    # arrives, and the blocking fetch runs off the event loop.
+                    payload = await run_blocking(
+                        _fetch_page,
+                        page=page,
+                        per_page=per_page,
+                        timeout_seconds=timeout_seconds,
+                        budget=budget,
+                    )
+                    if isinstance(payload, dict):
+                        crawl.checkpoint_page(checkpoint_key, payload)
+            except SOURCE_FATAL_ERRORS:
+                raise
             except Exception as exc:
                 logger.error("Unstop: giving up on page %d after retries: %s", page, exc)
+                crawl.mark_partial(f"page {page} failed")
                 break
 
             if not isinstance(payload, dict):
                 logger.error("Unstop: unexpected response type on page %d", page)
+                crawl.mark_partial(f"page {page} was malformed")
                 break
 
             data = payload.get("data", {})
@@ -81,6 +131,7 @@ def fetch_unstop_hackathons(
                 logger.info("Unstop: no items on page %d, stopping pagination", page)
                 break
 
+            items = project_items(items, UNSTOP_ITEM_FIELDS)
             for item in items:
                 if not isinstance(item, dict):
                     continue
@@ -89,12 +140,40 @@ def fetch_unstop_hackathons(
                     continue
                 items_by_id[key] = item
 
+            all_unchanged = unchanged.observe(items)
             last_page = int(data.get("last_page") or page)
             if page >= last_page:
                 break
+            if all_unchanged:
+                logger.info(
+                    "Unstop: %d unchanged pages in a row, stopping at page %d",
+                    unchanged.length,
+                    page,
+                )
+                crawl.mark_partial(f"incremental stop at page {page}", resumable=False)
+                break
             page += 1
+    except SOURCE_FATAL_ERRORS:
+        raise
     except Exception as exc:
         logger.error("Unstop: unexpected error during fetch: %s", exc)
+        crawl.mark_partial("unexpected error")
 
     logger.info("Unstop: fetched %d unique hackathons", len(items_by_id))
     return list(items_by_id.values())
+
+
+def fetch_unstop_hackathons(
+    max_pages: int = 15,
+    per_page: int = 50,
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+    crawl: Optional[SourceCrawl] = None,
+) -> List[Dict[str, Any]]:
+    return asyncio.run(
+        fetch_unstop_hackathons_async(
+            max_pages=max_pages,
+            per_page=per_page,
+            timeout_seconds=timeout_seconds,
+            crawl=crawl,
+        )
+    )
@@ -0,0 +1,283 @@
+"""Per-source crawl state shared between the pipeline and the connectors."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
+
+DEFAULT_UNCHANGED_PAGE_LIMIT = 2
+DEFAULT_FULL_CRAWL_INTERVAL_HOURS = 24.0
+DEFAULT_CHECKPOINT_MAX_AGE_HOURS = 12.0
+CHECKPOINT_MANIFEST_NAME = "manifest.json"
+
+
+def fingerprint_record(item: Mapping[str, Any]) -> str:
+    encoded = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class CrawlDeadline:
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self.expires_at = clock() + max(seconds, 0.0)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - self._clock(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self._clock() >= self.expires_at
+
+
+def _page_file_name(key: str) -> str:
+    safe = "".join(char if char.isalnum() or char in "-_" else "_" for char in key)
+    return f"page-{safe}.json"
+
+
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+class CrawlCheckpoint:
+    """Raw pages of one source's crawl, kept on disk until the crawl finishes."""
+
+    def __init__(self, directory: Path, source: str) -> None:
+        self.source = source
+        self.directory = directory / source
+        self._manifest: Dict[str, Any] = {"source": source, "pages": {}, "cursor": None}
+        self._resumed_pages: Dict[str, str] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / CHECKPOINT_MANIFEST_NAME
+
+    @property
+    def resumed_page_count(self) -> int:
+        return len(self._resumed_pages)
+
+    def load(self, now: datetime, max_age_hours: float = DEFAULT_CHECKPOINT_MAX_AGE_HOURS) -> int:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            updated_at = datetime.fromisoformat(str(manifest["updated_at"]))
+            pages = dict(manifest["pages"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+        # Listings shift as events open and close; an old checkpoint would
+        # splice stale pages into a fresh crawl.
+        if now - updated_at > timedelta(hours=max_age_hours):
+            self.clear()
+            return 0
+        self._manifest = manifest
+        self._resumed_pages = {str(key): str(name) for key, name in pages.items()}
+        return len(self._resumed_pages)
+
+    def resumed_page(self, key: str) -> Optional[Any]:
+        file_name = self._resumed_pages.get(key)
+        if file_name is None:
+            return None
+        try:
+            return json.loads((self.directory / file_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save_page(self, key: str, payload: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_name = _page_file_name(key)
+        _write_json_atomic(self.directory / file_name, payload)
+        self._manifest["pages"][key] = file_name
+        self._manifest["cursor"] = key
+        self._manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        _write_json_atomic(self.manifest_path, self._manifest)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._manifest = {"source": self.source, "pages": {}, "cursor": None}
+        self._resumed_pages = {}
+
+
+@dataclass
+class SourceCrawl:
+    source: str
+    known_fingerprints: Optional[Dict[str, str]] = None
+    unchanged_page_limit: int = DEFAULT_UNCHANGED_PAGE_LIMIT
+    complete: bool = True
+    stop_reason: str = ""
+    pages_fetched: int = 0
+    seen_fingerprints: Dict[str, str] = field(default_factory=dict)
+    deadline: Optional[CrawlDeadline] = None
+    checkpoint: Optional[CrawlCheckpoint] = None
+    resumable: bool = False
+
+    @property
+    def incremental(self) -> bool:
+        return self.known_fingerprints is not None
+
+    @property
+    def paced(self) -> bool:
+        # Paced crawls fetch pages a window at a time so they can stop early.
+        return self.incremental or self.deadline is not None
+
+    def out_of_time(self) -> bool:
+        if self.deadline is None or not self.deadline.expired:
+            return False
+        self.mark_partial("deadline reached")
+        return True
+
+    def mark_partial(self, reason: str, resumable: bool = True) -> None:
+        if self.complete:
+            self.complete = False
+            self.stop_reason = reason
+            self.resumable = resumable
+
+    def resumed_page(self, key: str) -> Optional[Any]:
+        if self.checkpoint is None:
+            return None
+        return self.checkpoint.resumed_page(key)
+
+    def checkpoint_page(self, key: str, payload: Any) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.save_page(key, payload)
+
+    def finish_checkpoint(self) -> None:
+        # Keep the pages only when a later run can pick up where this one stopped.
+        if self.checkpoint is None or (not self.complete and self.resumable):
+            return
+        self.checkpoint.clear()
+
+    def record_page(self, items: Iterable[Any], key_field: str = "id") -> bool:
+        """Remember a page's fingerprints; True when it holds only unchanged records."""
+        self.pages_fetched += 1
+        known = self.known_fingerprints or {}
+        unchanged = self.incremental
+        saw_record = False
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            key = str(item.get(key_field) or "")
+            if not key:
+                continue
+            saw_record = True
+            fingerprint = fingerprint_record(item)
+            self.seen_fingerprints[key] = fingerprint
+            if known.get(key) != fingerprint:
+                unchanged = False
+        return unchanged and saw_record
+
+    def unchanged_streak(self) -> "UnchangedPageStreak":
+        return UnchangedPageStreak(self)
+
+
+class UnchangedPageStreak:
+    """Tracks consecutive unchanged pages along one ordered page sequence."""
+
+    def __init__(self, crawl: SourceCrawl) -> None:
+        self.crawl = crawl
+        self.length = 0
+
+    def reset(self) -> None:
+        self.length = 0
+
+    def observe(self, items: Iterable[Any], key_field: str = "id") -> bool:
+        if self.crawl.record_page(items, key_field=key_field):
+            self.length += 1
+        else:
+            self.length = 0
+        return self.crawl.incremental and self.length >= max(
+            1, self.crawl.unchanged_page_limit
+        )
+
+
+def ensure_crawl_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS crawl_fingerprints (
+          source TEXT NOT NULL,
+          record_key TEXT NOT NULL,
+          fingerprint TEXT NOT NULL,
+          last_seen_at TEXT NOT NULL,
+          PRIMARY KEY (source, record_key)
+        );
+
+        CREATE TABLE IF NOT EXISTS crawl_runs (
+          source TEXT PRIMARY KEY,
+          last_full_crawl_at TEXT NOT NULL
+        );
+        """
+    )
+
+
+def load_incremental_crawls(
+    connection: sqlite3.Connection,
+    sources: Sequence[str],
+    now: datetime,
+    unchanged_page_limit: int = DEFAULT_UNCHANGED_PAGE_LIMIT,
+    full_crawl_interval_hours: float = DEFAULT_FULL_CRAWL_INTERVAL_HOURS,
+) -> Dict[str, SourceCrawl]:
+    crawls: Dict[str, SourceCrawl] = {}
+    last_full_by_source = dict(
+        connection.execute("SELECT source, last_full_crawl_at FROM crawl_runs").fetchall()
+    )
+    for source in sources:
+        crawl = SourceCrawl(source=source, unchanged_page_limit=unchanged_page_limit)
+        last_full_raw = last_full_by_source.get(source)
+        if last_full_raw:
+            last_full = datetime.fromisoformat(last_full_raw)
+            # Deletions are only noticed by walking every page, so fall back
+            # to a full crawl once the cadence has elapsed.
+            if now - last_full < timedelta(hours=full_crawl_interval_hours):
+                crawl.known_fingerprints = dict(
+                    connection.execute(
+                        "SELECT record_key, fingerprint FROM crawl_fingerprints WHERE source = ?",
+                        (source,),
+                    ).fetchall()
+                )
+        crawls[source] = crawl
+    return crawls
+
+
+def save_crawl_state(
+    connection: sqlite3.Connection,
+    crawls: Iterable[SourceCrawl],
+    finished_at: datetime,
+) -> None:
+    timestamp = finished_at.isoformat()
+    cursor = connection.cursor()
+    for crawl in crawls:
+        cursor.executemany(
+            """
+            INSERT INTO crawl_fingerprints (source, record_key, fingerprint, last_seen_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(source, record_key) DO UPDATE SET
+              fingerprint = excluded.fingerprint,
+              last_seen_at = excluded.last_seen_at
+            """,
+            [
+                (crawl.source, key, fingerprint, timestamp)
+                for key, fingerprint in crawl.seen_fingerprints.items()
+            ],
+        )
+        if not crawl.complete or crawl.pages_fetched == 0:
+            continue
+        # A complete walk saw every record, so anything not seen is gone.
+        cursor.execute(
+            "DELETE FROM crawl_fingerprints WHERE source = ? AND last_seen_at <> ?",
+            (crawl.source, timestamp),
+        )
+        cursor.execute(
+            """
+            INSERT INTO crawl_runs (source, last_full_crawl_at) VALUES (?, ?)
+            ON CONFLICT(source) DO UPDATE SET last_full_crawl_at = excluded.last_full_crawl_at
+            """,
+            (crawl.source, timestamp),
+        )
+    connection.commit()
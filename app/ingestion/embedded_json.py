@@ -0,0 +1,77 @@
+"""Locate JSON embedded in HTML pages without decoding the whole page."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+NEXT_DATA_START = b'<script id="__NEXT_DATA__" type="application/json">'
+SCRIPT_END = b"</script>"
+DATA_PAGE_START = b'data-page="'
+ATTRIBUTE_END = b'"'
+
+
+class EmbeddedSliceScanner:
+    def __init__(self, start_marker: bytes, end_marker: bytes) -> None:
+        if not start_marker or not end_marker:
+            raise ValueError("markers must not be empty")
+        self.start_marker = start_marker
+        self.end_marker = end_marker
+        self.done = False
+        self._started = False
+        # Before the start marker only a marker-sized tail is kept so a marker
+        # split across chunks is still found; after it, the slice itself.
+        self._buffer = bytearray()
+        self._search_from = 0
+
+    @property
+    def value(self) -> Optional[bytes]:
+        return bytes(self._buffer) if self.done else None
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.done or not chunk:
+            return self.done
+        view = memoryview(chunk)
+        if not self._started:
+            self._buffer += view
+            index = self._buffer.find(self.start_marker)
+            if index < 0:
+                keep = len(self.start_marker) - 1
+                if len(self._buffer) > keep:
+                    del self._buffer[: len(self._buffer) - keep]
+                return False
+            self._started = True
+            del self._buffer[: index + len(self.start_marker)]
+            self._search_from = 0
+        else:
+            self._buffer += view
+
+        index = self._buffer.find(self.end_marker, self._search_from)
+        if index < 0:
+            self._search_from = max(len(self._buffer) - len(self.end_marker) + 1, 0)
+            return False
+        del self._buffer[index:]
+        self.done = True
+        return True
+
+
+def scan_embedded_slice(
+    chunks: Iterable[bytes], start_marker: bytes, end_marker: bytes
+) -> Optional[bytes]:
+    scanner = EmbeddedSliceScanner(start_marker, end_marker)
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            break
+    return scanner.value
+
+
+def find_embedded_slice(document: str, start_marker: bytes, end_marker: bytes) -> Optional[str]:
+    # Whole-document variant for pages that are already decoded.
+    start = start_marker.decode("ascii")
+    start_index = document.find(start)
+    if start_index < 0:
+        return None
+    start_index += len(start)
+    end_index = document.find(end_marker.decode("ascii"), start_index)
+    if end_index < 0:
+        return None
+    return document[start_index:end_index]
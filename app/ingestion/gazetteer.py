@@ -0,0 +1,319 @@
+"""Offline gazetteer: city names to coordinates without a network call."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+Coordinates = Tuple[float, float]
+
+MAGIC = b"HHGZ"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+# latitude, longitude, population, country id, admin1 id
+PLACE_RECORD = struct.Struct("<ffIHH")
+# string offset, string length, place index
+NAME_RECORD = struct.Struct("<IHI")
+# string offset, string length, kind, id
+QUALIFIER_RECORD = struct.Struct("<IHBH")
+QUALIFIER_COUNTRY = 0
+QUALIFIER_ADMIN1 = 1
+NO_ADMIN1 = 0xFFFF
+COORDINATE_DIGITS = 4
+MAX_NAME_BYTES = 0xFFFF
+
+# Common ways listings name a country that GeoNames does not list.
+COUNTRY_ALIASES: Dict[str, str] = {
+    "usa": "US",
+    "u.s.a.": "US",
+    "u.s.": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uk": "GB",
+    "u.k.": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "wales": "GB",
+    "great britain": "GB",
+    "uae": "AE",
+    "south korea": "KR",
+}
+
+
+def normalize_place_name(text: str) -> str:
+    """Casefolded, accent-free, whitespace-collapsed form used as index key."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+@dataclass(frozen=True)
+class GazetteerPlace:
+    name: str
+    ascii_name: str
+    latitude: float
+    longitude: float
+    country_code: str
+    admin1_code: str
+    population: int
+    alternate_names: Tuple[str, ...] = ()
+
+
+def read_geonames_cities(lines: Iterable[str]) -> Iterator[GazetteerPlace]:
+    """Populated places (feature class ``P``) from a GeoNames cities dump."""
+    for line in lines:
+        columns = line.rstrip("\n").split("\t")
+        if len(columns) < 15 or columns[6] != "P":
+            continue
+        try:
+            latitude = float(columns[4])
+            longitude = float(columns[5])
+            population = int(columns[14] or 0)
+        except ValueError:
+            continue
+        yield GazetteerPlace(
+            name=columns[1],
+            ascii_name=columns[2],
+            latitude=latitude,
+            longitude=longitude,
+            country_code=columns[8].upper(),
+            admin1_code=columns[10],
+            population=max(population, 0),
+            alternate_names=tuple(name for name in columns[3].split(",") if name),
+        )
+
+
+def read_admin1_codes(lines: Iterable[str]) -> Dict[str, List[str]]:
+    """``"US.IL" -> ["Illinois", ...]`` from ``admin1CodesASCII.txt``."""
+    admin1: Dict[str, List[str]] = {}
+    for line in lines:
+        columns = line.rstrip("\n").split("\t")
+        if len(columns) < 3 or "." not in columns[0]:
+            continue
+        admin1[columns[0]] = [name for name in dict.fromkeys(columns[1:3]) if name]
+    return admin1
+
+
+def read_country_info(lines: Iterable[str]) -> Dict[str, List[str]]:
+    """``"IN" -> ["IND", "India"]`` from ``countryInfo.txt``."""
+    countries: Dict[str, List[str]] = {}
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        columns = line.rstrip("\n").split("\t")
+        if len(columns) < 5 or len(columns[0]) != 2:
+            continue
+        countries[columns[0].upper()] = [name for name in (columns[1], columns[4]) if name]
+    return countries
+
+
+def _is_index_alias(name: str) -> bool:
+    # Alternate names include airport codes, links and other scripts; only
+    # plain ASCII words are worth indexing.
+    if not name.isascii() or "/" in name or any(char.isdigit() for char in name):
+        return False
+    return not (len(name) <= 3 and name.isupper())
+
+
+def write_gazetteer(
+    path: Path,
+    places: Iterable[GazetteerPlace],
+    admin1_names: Optional[Mapping[str, List[str]]] = None,
+    country_names: Optional[Mapping[str, List[str]]] = None,
+    alternate_names: bool = True,
+) -> Dict[str, int]:
+    """Writes the binary index; returns its place/name/qualifier counts."""
+    admin1_names = admin1_names or {}
+    country_names = country_names or {}
+    country_ids: Dict[str, int] = {}
+    admin1_ids: Dict[str, int] = {}
+    place_rows: List[bytes] = []
+    names: Set[Tuple[bytes, int]] = set()
+    populations: List[int] = []
+
+    for place in places:
+        country_id = country_ids.setdefault(place.country_code, len(country_ids))
+        admin1_key = f"{place.country_code}.{place.admin1_code}"
+        admin1_id = NO_ADMIN1
+        if place.admin1_code:
+            admin1_id = admin1_ids.setdefault(admin1_key, len(admin1_ids))
+        if len(country_ids) > 0xFFFF or len(admin1_ids) >= NO_ADMIN1:
+            raise ValueError("too many countries or admin1 areas for the index format")
+        index = len(place_rows)
+        place_rows.append(
+            PLACE_RECORD.pack(
+                place.latitude,
+                place.longitude,
+                min(place.population, 0xFFFFFFFF),
+                country_id,
+                admin1_id,
+            )
+        )
+        populations.append(place.population)
+        candidates = [place.name, place.ascii_name]
+        if alternate_names:
+            candidates.extend(name for name in place.alternate_names if _is_index_alias(name))
+        for name in candidates:
+            key = normalize_place_name(name).encode("utf-8")
+            if key and len(key) <= MAX_NAME_BYTES:
+                names.add((key, index))
+
+    qualifiers: Set[Tuple[bytes, int, int]] = set()
+
+    def add_qualifier(text: str, kind: int, identifier: int) -> None:
+        key = normalize_place_name(text).encode("utf-8")
+        if key and len(key) <= MAX_NAME_BYTES:
+            qualifiers.add((key, kind, identifier))
+
+    for code, identifier in country_ids.items():
+        add_qualifier(code, QUALIFIER_COUNTRY, identifier)
+        for name in country_names.get(code, []):
+            add_qualifier(name, QUALIFIER_COUNTRY, identifier)
+    for alias, code in COUNTRY_ALIASES.items():
+        if code in country_ids:
+            add_qualifier(alias, QUALIFIER_COUNTRY, country_ids[code])
+    for key, identifier in admin1_ids.items():
+        code = key.split(".", 1)[1]
+        # Numeric admin1 codes ("16") would match house numbers and PIN codes.
+        if code.isalpha():
+            add_qualifier(code, QUALIFIER_ADMIN1, identifier)
+        for name in admin1_names.get(key, []):
+            add_qualifier(name, QUALIFIER_ADMIN1, identifier)
+
+    strings = bytearray()
+    offsets: Dict[bytes, int] = {}
+
+    def intern(key: bytes) -> int:
+        offset = offsets.get(key)
+        if offset is None:
+            offset = offsets[key] = len(strings)
+            strings.extend(key)
+        return offset
+
+    sorted_names = sorted(names, key=lambda item: (item[0], -populations[item[1]], item[1]))
+    name_rows = [NAME_RECORD.pack(intern(key), len(key), index) for key, index in sorted_names]
+    qualifier_rows = [
+        QUALIFIER_RECORD.pack(intern(key), len(key), kind, identifier)
+        for key, kind, identifier in sorted(qualifiers)
+    ]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A running pipeline may have the old index mapped; swap in the new one
+    # whole rather than rewriting it under the reader.
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                0,
+                len(place_rows),
+                len(name_rows),
+                len(qualifier_rows),
+                len(strings),
+            )
+        )
+        handle.write(b"".join(place_rows))
+        handle.write(b"".join(name_rows))
+        handle.write(b"".join(qualifier_rows))
+        handle.write(strings)
+    os.replace(temp_path, path)
+    return {"places": len(place_rows), "names": len(name_rows), "qualifiers": len(qualifier_rows)}
+
+
+class Gazetteer:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+        magic, version, _, places, names, qualifiers, strings_size = HEADER.unpack_from(
+            self._map, 0
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a gazetteer index (version {FORMAT_VERSION})")
+        self.place_count = places
+        self.name_count = names
+        self._places_at = HEADER.size
+        self._names_at = self._places_at + places * PLACE_RECORD.size
+        qualifiers_at = self._names_at + names * NAME_RECORD.size
+        self._strings_at = qualifiers_at + qualifiers * QUALIFIER_RECORD.size
+        if self._strings_at + strings_size > len(self._map):
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+
+        self._qualifiers: Dict[str, Set[Tuple[int, int]]] = {}
+        for position in range(qualifiers):
+            offset, length, kind, identifier = QUALIFIER_RECORD.unpack_from(
+                self._map, qualifiers_at + position * QUALIFIER_RECORD.size
+            )
+            key = self._string(offset, length).decode("utf-8")
+            self._qualifiers.setdefault(key, set()).add((kind, identifier))
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings_at + offset
+        return self._map[start : start + length]
+
+    def _name_at(self, position: int) -> Tuple[bytes, int]:
+        offset, length, place = NAME_RECORD.unpack_from(
+            self._map, self._names_at + position * NAME_RECORD.size
+        )
+        return self._string(offset, length), place
+
+    def _places_named(self, key: bytes) -> Iterator[int]:
+        low, high = 0, self.name_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_at(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self.name_count:
+            name, place = self._name_at(low)
+            if name != key:
+                return
+            yield place
+            low += 1
+
+    def _place(self, index: int) -> Tuple[float, float, int, int, int]:
+        return PLACE_RECORD.unpack_from(self._map, self._places_at + index * PLACE_RECORD.size)
+
+    def resolve(self, location_text: str) -> Optional[Coordinates]:
+        parts = [normalize_place_name(part) for part in location_text.split(",")]
+        parts = [part for part in parts if part]
+        for position, part in enumerate(parts):
+            qualifiers = [self._qualifiers.get(text, set()) for text in parts[position + 1 :]]
+            best: Optional[Tuple[int, Coordinates]] = None
+            for index in self._places_named(part.encode("utf-8")):
+                latitude, longitude, _, country_id, admin1_id = self._place(index)
+                score = sum(
+                    1
+                    for matches in qualifiers
+                    if (QUALIFIER_COUNTRY, country_id) in matches
+                    or (QUALIFIER_ADMIN1, admin1_id) in matches
+                )
+                # Names are stored most populous first, so ties keep the first.
+                if best is None or score > best[0]:
+                    best = (
+                        score,
+                        (round(latitude, COORDINATE_DIGITS), round(longitude, COORDINATE_DIGITS)),
+                    )
+            if best is None:
+                continue
+            # A qualified name whose qualifiers all disagree is probably a
+            # different place (a venue or street named after a city).
+            if qualifiers and best[0] == 0:
+                continue
+            return best[1]
+        return None
+
+    def close(self) -> None:
+        self._map.close()
@@ -0,0 +1,204 @@
+"""Deferred geocoding: publish listings first, place them on the map later."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from app.ingestion.crawl import CrawlDeadline
+    from app.ingestion.geocoding import LocationGeocoder
+    from app.ingestion.locations import canonical_location
+    from app.ingestion.record import HackathonRecord
+except ModuleNotFoundError:
+    from ingestion.crawl import CrawlDeadline  # type: ignore[no-redef]
+    from ingestion.geocoding import LocationGeocoder  # type: ignore[no-redef]
+    from ingestion.locations import canonical_location  # type: ignore[no-redef]
+    from ingestion.record import HackathonRecord  # type: ignore[no-redef]
+
+Coordinates = Tuple[float, float]
+
+RETRY_BASE_SECONDS = 15 * 60
+RETRY_MAX_SECONDS = 24 * 60 * 60
+MAX_ATTEMPTS = 8
+
+
+def ensure_backlog_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS geocode_backlog (
+          hackathon_id TEXT PRIMARY KEY,
+          location_text TEXT NOT NULL,
+          enqueued_at TEXT NOT NULL,
+          attempts INTEGER NOT NULL DEFAULT 0,
+          next_attempt_at TEXT NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_geocode_backlog_next_attempt_at
+          ON geocode_backlog(next_attempt_at);
+        """
+    )
+
+
+def prune_backlog(connection: sqlite3.Connection) -> int:
+    """Drop entries whose listing is gone, placed, online or has moved."""
+    cursor = connection.execute(
+        """
+        DELETE FROM geocode_backlog
+        WHERE NOT EXISTS (
+          SELECT 1 FROM hackathons
+          WHERE hackathons.id = geocode_backlog.hackathon_id
+            AND hackathons.is_active = 1
+            AND hackathons.format <> 'Online'
+            AND hackathons.latitude IS NULL
+            AND hackathons.location_text = geocode_backlog.location_text
+        )
+        """
+    )
+    return max(int(cursor.rowcount or 0), 0)
+
+
+def enqueue_geocodes(
+    connection: sqlite3.Connection,
+    records: Iterable[HackathonRecord],
+    now: datetime,
+) -> int:
+    """Queue the listings among ``records`` that are still unplaced in the database.
+
+    A listing already queued for the same location keeps its retry state.
+    """
+    stamp = now.isoformat()
+    changes_before = connection.total_changes
+    connection.executemany(
+        """
+        INSERT INTO geocode_backlog (hackathon_id, location_text, enqueued_at, attempts, next_attempt_at)
+        SELECT id, location_text, ?, 0, ? FROM hackathons
+        WHERE id = ? AND latitude IS NULL
+        ON CONFLICT(hackathon_id) DO UPDATE SET
+          location_text = excluded.location_text,
+          enqueued_at = excluded.enqueued_at,
+          attempts = 0,
+          next_attempt_at = excluded.next_attempt_at
+        WHERE geocode_backlog.location_text <> excluded.location_text
+        """,
+        [(stamp, stamp, record.id) for record in records],
+    )
+    return connection.total_changes - changes_before
+
+
+def _retry_delay_seconds(attempts: int) -> float:
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+def drain_backlog(
+    connection: sqlite3.Connection,
+    geocoder: LocationGeocoder,
+    now: Optional[datetime] = None,
+    max_locations: Optional[int] = None,
+    deadline: Optional[CrawlDeadline] = None,
+) -> Tuple[Dict[str, int], Dict[str, Coordinates]]:
+    """Geocode the due backlog entries and patch the rows they belong to.
+
+    Returns counts and the coordinates written, by hackathon id. Progress is
+    committed after every place, so an interrupted worker loses nothing.
+    """
+    current_time = now or datetime.now(timezone.utc)
+    summary = {"locations": 0, "placed": 0, "not_found": 0, "retried": 0, "dropped": 0}
+    summary["pruned"] = prune_backlog(connection)
+    connection.commit()
+
+    rows = connection.execute(
+        """
+        SELECT hackathon_id, location_text, attempts FROM geocode_backlog
+        WHERE next_attempt_at <= ?
+        ORDER BY enqueued_at, hackathon_id
+        """,
+        (current_time.isoformat(),),
+    ).fetchall()
+    by_place: Dict[str, List[Tuple[str, str, int]]] = {}
+    for hackathon_id, location_text, attempts in rows:
+        key = canonical_location(location_text)
+        if key is None:
+            connection.execute("DELETE FROM geocode_backlog WHERE hackathon_id = ?", (hackathon_id,))
+            summary["dropped"] += 1
+            continue
+        by_place.setdefault(key, []).append((hackathon_id, location_text, attempts))
+    connection.commit()
+
+    placed: Dict[str, Coordinates] = {}
+    for entries in by_place.values():
+        if max_locations is not None and summary["locations"] >= max_locations:
+            break
+        if deadline is not None and deadline.expired:
+            break
+        summary["locations"] += 1
+        location_text = entries[0][1]
+        coordinates = geocoder.geocode(location_text)
+        if coordinates is not None:
+            for hackathon_id, entry_text, _ in entries:
+                cursor = connection.execute(
+                    """
+                    UPDATE hackathons SET latitude = ?, longitude = ?
+                    WHERE id = ? AND location_text = ? AND latitude IS NULL
+                    """,
+                    (coordinates[0], coordinates[1], hackathon_id, entry_text),
+                )
+                if cursor.rowcount:
+                    placed[hackathon_id] = coordinates
+            connection.executemany(
+                "DELETE FROM geocode_backlog WHERE hackathon_id = ?",
+                [(hackathon_id,) for hackathon_id, _, _ in entries],
+            )
+            summary["placed"] += len(entries)
+        elif geocoder.was_deferred(location_text):
+            for hackathon_id, _, attempts in entries:
+                if attempts + 1 >= MAX_ATTEMPTS:
+                    connection.execute(
+                        "DELETE FROM geocode_backlog WHERE hackathon_id = ?", (hackathon_id,)
+                    )
+                    summary["dropped"] += 1
+                    continue
+                retry_at = current_time + timedelta(seconds=_retry_delay_seconds(attempts + 1))
+                connection.execute(
+                    """
+                    UPDATE geocode_backlog SET attempts = ?, next_attempt_at = ?
+                    WHERE hackathon_id = ?
+                    """,
+                    (attempts + 1, retry_at.isoformat(), hackathon_id),
+                )
+                summary["retried"] += 1
+        else:
+            connection.executemany(
+                "DELETE FROM geocode_backlog WHERE hackathon_id = ?",
+                [(hackathon_id,) for hackathon_id, _, _ in entries],
+            )
+            summary["not_found"] += len(entries)
+        connection.commit()
+
+    summary["remaining"] = int(
+        connection.execute("SELECT COUNT(*) FROM geocode_backlog").fetchone()[0]
+    )
+    return summary, placed
+
+
+def patch_json_coordinates(path: Path, placed: Dict[str, Coordinates]) -> int:
+    """Write ``placed`` into the JSON bootstrap file; returns records patched."""
+    if not placed or not path.is_file():
+        return 0
+    records = json.loads(path.read_text(encoding="utf-8"))
+    patched = 0
+    for record in records:
+        coordinates = placed.get(str(record.get("id") or ""))
+        if coordinates is None:
+            continue
+        record["coordinates"] = {"lat": coordinates[0], "lng": coordinates[1]}
+        patched += 1
+    if patched:
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text(json.dumps(records, indent=2, ensure_ascii=True), encoding="utf-8")
+        os.replace(temp_path, path)
+    return patched
@@ -0,0 +1,166 @@
+"""Persistent cache of Nominatim geocoding results."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+Coordinates = Tuple[float, float]
+
+DAY_SECONDS = 24 * 60 * 60
+DEFAULT_POSITIVE_TTL_SECONDS = 90 * DAY_SECONDS
+DEFAULT_NEGATIVE_TTL_SECONDS = 7 * DAY_SECONDS
+DEFAULT_BATCH_SIZE = 25
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class CachedGeocode:
+    """A cache hit; ``coordinates`` is ``None`` for a cached "no match"."""
+
+    coordinates: Optional[Coordinates]
+    stored_at: float
+
+
+def normalize_location_key(location_text: str) -> str:
+    return " ".join(location_text.lower().split())
+
+
+class GeocodeCache:
+    def __init__(
+        self,
+        path: Path,
+        positive_ttl_seconds: float = DEFAULT_POSITIVE_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.path = path
+        self.positive_ttl_seconds = max(0.0, positive_ttl_seconds)
+        self.negative_ttl_seconds = max(0.0, negative_ttl_seconds)
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._entries: Optional[Dict[str, CachedGeocode]] = None
+        self._pending: Dict[str, CachedGeocode] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS geocode_cache (
+                  location_key TEXT PRIMARY KEY,
+                  latitude REAL,
+                  longitude REAL,
+                  stored_at REAL NOT NULL
+                );
+                """
+            )
+            self._connection = connection
+        return self._connection
+
+    def _fresh(self, entry: CachedGeocode, now: float) -> bool:
+        ttl = (
+            self.negative_ttl_seconds
+            if entry.coordinates is None
+            else self.positive_ttl_seconds
+        )
+        return now - entry.stored_at < ttl
+
+    def _load_locked(self) -> Dict[str, CachedGeocode]:
+        if self._entries is None:
+            now = time.time()
+            oldest = now - max(self.positive_ttl_seconds, self.negative_ttl_seconds)
+            rows = self._connect().execute(
+                """
+                SELECT location_key, latitude, longitude, stored_at
+                FROM geocode_cache WHERE stored_at > ?
+                """,
+                (oldest,),
+            ).fetchall()
+            entries: Dict[str, CachedGeocode] = {}
+            for key, latitude, longitude, stored_at in rows:
+                coordinates = (
+                    None
+                    if latitude is None or longitude is None
+                    else (float(latitude), float(longitude))
+                )
+                entry = CachedGeocode(coordinates=coordinates, stored_at=float(stored_at))
+                if self._fresh(entry, now):
+                    entries[key] = entry
+            self._entries = entries
+        return self._entries
+
+    def lookup(self, location_text: str) -> Optional[CachedGeocode]:
+        key = normalize_location_key(location_text)
+        with self._lock:
+            entry = self._load_locked().get(key)
+        if entry is None or not self._fresh(entry, time.time()):
+            return None
+        return entry
+
+    def store(self, location_text: str, coordinates: Optional[Coordinates]) -> None:
+        key = normalize_location_key(location_text)
+        if not key:
+            return
+        entry = CachedGeocode(coordinates=coordinates, stored_at=time.time())
+        with self._lock:
+            self._load_locked()[key] = entry
+            self._pending[key] = entry
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> int:
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        if not self._pending:
+            return 0
+        rows = [
+            (
+                key,
+                None if entry.coordinates is None else entry.coordinates[0],
+                None if entry.coordinates is None else entry.coordinates[1],
+                entry.stored_at,
+            )
+            for key, entry in self._pending.items()
+        ]
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                """
+                INSERT INTO geocode_cache (location_key, latitude, longitude, stored_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(location_key) DO UPDATE SET
+                  latitude = excluded.latitude,
+                  longitude = excluded.longitude,
+                  stored_at = excluded.stored_at
+                WHERE excluded.stored_at >= geocode_cache.stored_at
+                """,
+                rows,
+            )
+            connection.execute(
+                "DELETE FROM geocode_cache WHERE stored_at <= ?",
+                (time.time() - max(self.positive_ttl_seconds, self.negative_ttl_seconds),),
+            )
+        self._pending.clear()
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None and not self._pending:
+                return
+            self._flush_locked()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._entries = None
@@ -1,8 +1,36 @@
 from __future__ import annotations
 
+import logging
 import os
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
 
+try:
+    from app.ingestion.gazetteer import Gazetteer
+    from app.ingestion.geocode_cache import GeocodeCache
+    from app.ingestion.keywords import KeywordMatcher
+    from app.ingestion.locations import canonical_location
+    from app.ingestion.rate_limit import HostGovernor
+except ModuleNotFoundError:
+    from ingestion.gazetteer import Gazetteer  # type: ignore[no-redef]
+    from ingestion.geocode_cache import GeocodeCache  # type: ignore[no-redef]
+    from ingestion.keywords import KeywordMatcher  # type: ignore[no-redef]
+    from ingestion.locations import canonical_location  # type: ignore[no-redef]
+    from ingestion.rate_limit import HostGovernor  # type: ignore[no-redef]
+
+# geopy errors that mean the provider wants lookups to slow down.
+try:
+    from geopy.exc import GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable  # type: ignore
+
+    THROTTLE_ERRORS: Tuple[type, ...] = (GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable)
+except ImportError:
+    THROTTLE_ERRORS = ()
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).resolve().parents[1] / "data" / "gazetteer.bin"
+NOMINATIM_HOST = "nominatim.openstreetmap.org"
 
 FALLBACK_COORDINATES: Dict[str, Tuple[float, float]] = {
     "delhi ncr": (28.6139, 77.2090),
@@ -16,13 +44,46 @@ FALLBACK_COORDINATES: Dict[str, Tuple[float, float]] = {
     "san francisco": (37.7749, -122.4194),
     "london": (51.5074, -0.1278),
 }
+# Earlier entries win when a location names several of these cities.
+FALLBACK_MATCHER = KeywordMatcher(FALLBACK_COORDINATES)
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path: Path) -> Optional[Gazetteer]:
+    if not path.is_file():
+        return None
+    try:
+        return Gazetteer(path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring offline gazetteer %s: %s", path, exc)
+        return None
+
+
+def default_gazetteer() -> Optional[Gazetteer]:
+    """The index built by scripts/build_gazetteer.py, if there is one."""
+    configured = os.getenv("HACKHUNT_GAZETTEER_PATH", "").strip()
+    return load_gazetteer(Path(configured) if configured else DEFAULT_GAZETTEER_PATH)
 
 
 class LocationGeocoder:
-    def __init__(self, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        enabled: bool = True,
+        cache: Optional[GeocodeCache] = None,
+        gazetteer: Optional[Gazetteer] = None,
+        governor: Optional[HostGovernor] = None,
+    ) -> None:
         disable_env = os.getenv("HACKHUNT_DISABLE_GEOCODING", "").strip().lower()
         self.enabled = enabled and disable_env not in {"1", "true", "yes"}
+        self.gazetteer = gazetteer if gazetteer is not None else default_gazetteer()
+        # Answers from earlier runs; read even when remote lookups are off.
+        self.persistent_cache = cache
+        # Paces remote lookups when set.
+        self.governor = governor
         self._cache: Dict[str, Optional[Tuple[float, float]]] = {}
+        # Keys left unanswered because remote lookups were switched off or
+        # failed; a later run or the backlog worker can still resolve them.
+        self.deferred: Set[str] = set()
         self._nominatim = None
 
         if self.enabled:
@@ -33,32 +94,69 @@ class LocationGeocoder:
             except Exception:
                 self._nominatim = None
 
+    @property
+    def remote_available(self) -> bool:
+        """Whether ``geocode`` may look places up at Nominatim."""
+        return self.enabled and self._nominatim is not None
+
     def geocode(self, location_text: str) -> Optional[Tuple[float, float]]:
-        normalized = location_text.strip().lower()
-        if not normalized or normalized in {"global", "online", "virtual"}:
+        # Spelling variants of one place share a key, so only the first of
+        # them costs a lookup.
+        normalized = canonical_location(location_text)
+        if normalized is None:
             return None
 
         if normalized in self._cache:
             return self._cache[normalized]
 
-        for key, value in FALLBACK_COORDINATES.items():
-            if key in normalized:
-                self._cache[normalized] = value
-                return value
+        # The gazetteer reads the qualifiers ("London, Ontario"); the
+        # fallback table only knows city names, so it answers last.
+        if self.gazetteer is not None:
+            coordinates = self.gazetteer.resolve(location_text)
+            if coordinates is not None:
+                self._cache[normalized] = coordinates
+                return coordinates
+
+        fallback = FALLBACK_MATCHER.first(normalized)
+        if fallback is not None:
+            self._cache[normalized] = fallback
+            return fallback
 
-        if not self.enabled or self._nominatim is None:
+        if self.persistent_cache is not None:
+            cached = self.persistent_cache.lookup(normalized)
+            if cached is not None:
+                self._cache[normalized] = cached.coordinates
+                return cached.coordinates
+
+        if not self.enabled:
+            self._cache[normalized] = None
+            self.deferred.add(normalized)
+            return None
+        if self._nominatim is None:
             self._cache[normalized] = None
             return None
 
+        if self.governor is not None:
+            self.governor.wait_for_token(NOMINATIM_HOST)
         try:
             result = self._nominatim.geocode(location_text, timeout=10)
-            if result is None:
-                self._cache[normalized] = None
-                return None
-            coordinates = (float(result.latitude), float(result.longitude))
-            self._cache[normalized] = coordinates
-            return coordinates
-        except Exception:
+        except Exception as exc:
+            # Errors are usually transient, so they are not persisted.
+            if self.governor is not None and isinstance(exc, THROTTLE_ERRORS):
+                self.governor.record_throttle(NOMINATIM_HOST, getattr(exc, "retry_after", None))
             self._cache[normalized] = None
+            self.deferred.add(normalized)
             return None
+        if self.governor is not None:
+            self.governor.record_success(NOMINATIM_HOST)
+        coordinates = (
+            None if result is None else (float(result.latitude), float(result.longitude))
+        )
+        self._cache[normalized] = coordinates
+        if self.persistent_cache is not None:
+            self.persistent_cache.store(normalized, coordinates)
+        return coordinates
 
+    def was_deferred(self, location_text: str) -> bool:
+        """Whether ``geocode`` left ``location_text`` for a later remote lookup."""
+        return canonical_location(location_text) in self.deferred
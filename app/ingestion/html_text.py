@@ -0,0 +1,40 @@
+"""Plain text out of listing HTML without regex passes over the whole body."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+try:
+    from app.ingestion.keywords import KeywordMatcher
+except ModuleNotFoundError:
+    from ingestion.keywords import KeywordMatcher  # type: ignore[no-redef]
+
+
+def iter_text_runs(html: str) -> Iterator[str]:
+    """The text between tags, in order."""
+    run_start = position = 0
+    while True:
+        open_at = html.find("<", position)
+        if open_at == -1 or open_at + 1 >= len(html):
+            break
+        if html[open_at + 1] == ">":
+            position = open_at + 1
+            continue
+        close_at = html.find(">", open_at + 1)
+        if close_at == -1:
+            break
+        yield html[run_start:open_at]
+        run_start = position = close_at + 1
+    yield html[run_start:]
+
+
+def contains_any(html: str, keywords: KeywordMatcher) -> bool:
+    """Whether the lowercased text of ``html`` contains any of ``keywords``.
+
+    Keywords must be lowercase and free of whitespace.
+    """
+    for run in iter_text_runs(html):
+        if run and keywords.any(run.lower()):
+            return True
+    return False
+
@@ -0,0 +1,156 @@
+"""On-disk conditional-GET cache for source pages.
+
+Bodies are stored per URL together with their ``ETag`` / ``Last-Modified``
+validators. The HTTP client replays those validators on the next request and
+serves the stored body when the origin answers ``304 Not Modified``. The cache
+is capped by stored size and evicts least-recently-used entries first.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    etag: str
+    last_modified: str
+    body: bytes
+
+
+class HttpCache:
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                  url TEXT PRIMARY KEY,
+                  etag TEXT NOT NULL,
+                  last_modified TEXT NOT NULL,
+                  body BLOB NOT NULL,
+                  stored_size INTEGER NOT NULL,
+                  stored_at REAL NOT NULL,
+                  last_access REAL NOT NULL
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_http_cache_last_access
+                  ON http_cache(last_access);
+                """
+            )
+            self._connection = connection
+        return self._connection
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE http_cache SET last_access = ? WHERE url = ?",
+                (time.time(), url),
+            )
+            connection.commit()
+        etag, last_modified, stored_body = row
+        return CachedResponse(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            body=zlib.decompress(stored_body),
+        )
+
+    def store(self, url: str, headers: Mapping[str, str], body: bytes) -> bool:
+        etag = headers.get("etag", "").strip()
+        last_modified = headers.get("last-modified", "").strip()
+        cache_control = headers.get("cache-control", "").lower()
+        if not etag and not last_modified:
+            return False
+        if "no-store" in cache_control:
+            return False
+
+        stored_body = zlib.compress(body)
+        if len(stored_body) > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                """
+                INSERT INTO http_cache (
+                  url, etag, last_modified, body, stored_size, stored_at, last_access
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                  etag = excluded.etag,
+                  last_modified = excluded.last_modified,
+                  body = excluded.body,
+                  stored_size = excluded.stored_size,
+                  stored_at = excluded.stored_at,
+                  last_access = excluded.last_access
+                """,
+                (url, etag, last_modified, stored_body, len(stored_body), now, now),
+            )
+            self._evict_locked(connection)
+            connection.commit()
+        return True
+
+    def _evict_locked(self, connection: sqlite3.Connection) -> None:
+        total = int(
+            connection.execute(
+                "SELECT COALESCE(SUM(stored_size), 0) FROM http_cache"
+            ).fetchone()[0]
+        )
+        if total <= self.max_bytes:
+            return
+        rows = connection.execute(
+            "SELECT url, stored_size FROM http_cache ORDER BY last_access ASC"
+        ).fetchall()
+        evicted = []
+        for url, stored_size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= int(stored_size)
+        connection.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COALESCE(SUM(stored_size), 0) FROM http_cache"
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
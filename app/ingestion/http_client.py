@@ -0,0 +1,546 @@
+"""Shared HTTP client for ingestion connectors.
+
+Keeps one pool of keep-alive connections per host, asks for compressed
+transfer and decodes it transparently, and applies a single timeout and
+User-Agent policy. Every response carries its own byte and latency counters,
+which are also aggregated per host on the client. When an ``HttpCache`` is
+attached, requests are made conditional and ``304`` answers are served from
+disk. Requests are paced per host by the shared ``HostGovernor``.
+
+``get_embedded`` streams a page instead of buffering it: the body is decoded
+chunk by chunk into an ``EmbeddedSliceScanner`` and the read stops as soon as
+the embedded JSON has been collected. The cache stores that slice under a
+per-marker variant of the URL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import http.client
+import json
+import logging
+import threading
+import time
+import urllib.parse
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+try:
+    from app.ingestion.http_cache import HttpCache, conditional_headers
+except ModuleNotFoundError:
+    from ingestion.http_cache import HttpCache, conditional_headers  # type: ignore[no-redef]
+
+try:
+    from app.ingestion.embedded_json import EmbeddedSliceScanner
+except ModuleNotFoundError:
+    from ingestion.embedded_json import EmbeddedSliceScanner  # type: ignore[no-redef]
+
+try:
+    from app.ingestion.rate_limit import HostGovernor, parse_retry_after
+except ModuleNotFoundError:
+    from ingestion.rate_limit import HostGovernor, parse_retry_after  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_USER_AGENT = "HackHuntBot/1.0 (+https://github.com)"
+DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+DEFAULT_MAX_IDLE_CONNECTIONS_PER_HOST = 8
+MAX_REDIRECTS = 5
+STREAM_CHUNK_SIZE = 64 * 1024
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+THROTTLE_STATUSES = {429, 503}
+# Errors that mean a pooled keep-alive connection was closed by the server
+# between requests; the request is replayed once on a fresh connection.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+PoolKey = Tuple[str, str, int]
+
+
+class HttpError(Exception):
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        reason: str,
+        retry_after_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(f"HTTP {status} {reason} for {url}")
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    wire_bytes: int
+    elapsed_seconds: float
+    from_cache: bool = False
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    connections_opened: int = 0
+    cache_hits: int = 0
+    throttled: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "wire_bytes": self.wire_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "connections_opened": self.connections_opened,
+            "throttled": self.throttled,
+        }
+
+
+@dataclass
+class HttpClientStats:
+    by_host: Dict[str, HostStats] = field(default_factory=dict)
+
+    def host(self, host: str) -> HostStats:
+        return self.by_host.setdefault(host, HostStats())
+
+    def totals(self) -> HostStats:
+        total = HostStats()
+        for stats in self.by_host.values():
+            total.requests += stats.requests
+            total.wire_bytes += stats.wire_bytes
+            total.decoded_bytes += stats.decoded_bytes
+            total.elapsed_seconds += stats.elapsed_seconds
+            total.connections_opened += stats.connections_opened
+            total.cache_hits += stats.cache_hits
+            total.throttled += stats.throttled
+        return total
+
+
+def decode_content(body: bytes, content_encoding: str) -> bytes:
+    encoding = content_encoding.strip().lower()
+    if not encoding or encoding == "identity":
+        return body
+    if encoding in {"gzip", "x-gzip"}:
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        # Servers disagree on whether "deflate" carries the zlib header.
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+class StreamDecoder:
+    def __init__(self, content_encoding: str) -> None:
+        encoding = content_encoding.strip().lower()
+        self._raw_deflate_fallback = False
+        if not encoding or encoding == "identity":
+            self._decompressor = None
+        elif encoding in {"gzip", "x-gzip"}:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+            self._raw_deflate_fallback = True
+        else:
+            raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._decompressor is None:
+            return chunk
+        try:
+            return self._decompressor.decompress(chunk)
+        except zlib.error:
+            if not self._raw_deflate_fallback:
+                raise
+            # Same header ambiguity as decode_content; only the first chunk
+            # can reveal it.
+            self._raw_deflate_fallback = False
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompressor.decompress(chunk)
+
+
+def embedded_cache_key(url: str, start_marker: bytes, end_marker: bytes) -> str:
+    digest = hashlib.sha1(start_marker + b"\0" + end_marker).hexdigest()[:12]
+    return f"{url}#embedded-{digest}"
+
+
+def _pool_key(parsed: urllib.parse.SplitResult) -> PoolKey:
+    scheme = parsed.scheme.lower()
+    if scheme not in {"http", "https"}:
+        raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+    default_port = 443 if scheme == "https" else 80
+    return (scheme, (parsed.hostname or "").lower(), parsed.port or default_port)
+
+
+def _request_target(parsed: urllib.parse.SplitResult) -> str:
+    path = parsed.path or "/"
+    return f"{path}?{parsed.query}" if parsed.query else path
+
+
+class HttpClient:
+    def __init__(
+        self,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_idle_connections_per_host: int = DEFAULT_MAX_IDLE_CONNECTIONS_PER_HOST,
+        cache: Optional[HttpCache] = None,
+        governor: Optional[HostGovernor] = None,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.cache = cache
+        self.governor = governor
+        self.user_agent = user_agent
+        self.max_idle_connections_per_host = max(0, max_idle_connections_per_host)
+        self.stats = HttpClientStats()
+        self._idle: Dict[PoolKey, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, key: PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        with self._lock:
+            self.stats.host(host).connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _checkout(self, key: PoolKey) -> Optional[http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _checkin(self, key: PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_connections_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _build_headers(self, headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+        merged = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        }
+        for name, value in (headers or {}).items():
+            merged[name] = value
+        return merged
+
+    def _send_once(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float,
+        read_body: bool = True,
+    ) -> Tuple[http.client.HTTPResponse, bytes, PoolKey, http.client.HTTPConnection]:
+        parsed = urllib.parse.urlsplit(url)
+        key = _pool_key(parsed)
+        target = _request_target(parsed)
+
+        connection = self._checkout(key)
+        reused = connection is not None
+        if connection is None:
+            connection = self._new_connection(key, timeout)
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        try:
+            connection.request("GET", target, headers=headers)
+            response = connection.getresponse()
+            raw_body = response.read() if read_body else b""
+        except STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+            connection = self._new_connection(key, timeout)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                raw_body = response.read() if read_body else b""
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            connection.close()
+            raise
+        return response, raw_body, key, connection
+
+    @contextmanager
+    def _governed(self, host: str) -> Iterator[None]:
+        if self.governor is None:
+            yield
+            return
+        with self.governor.slot(host):
+            yield
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> HttpResponse:
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        request_headers = self._build_headers(headers)
+        current_url = url
+
+        for _ in range(MAX_REDIRECTS + 1):
+            cached = self.cache.lookup(current_url) if self.cache is not None else None
+            hop_headers = dict(request_headers)
+            if cached is not None:
+                hop_headers.update(conditional_headers(cached))
+
+            host = (urllib.parse.urlsplit(current_url).hostname or "").lower()
+            with self._governed(host):
+                started = time.perf_counter()
+                response, raw_body, key, connection = self._send_once(
+                    current_url, hop_headers, timeout
+                )
+                elapsed = time.perf_counter() - started
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(key, connection)
+
+            response_headers = {
+                name.lower(): value for name, value in response.getheaders()
+            }
+            body = decode_content(raw_body, response_headers.get("content-encoding", ""))
+
+            with self._lock:
+                host_stats = self.stats.host(key[1])
+                host_stats.requests += 1
+                host_stats.wire_bytes += len(raw_body)
+                host_stats.decoded_bytes += len(body)
+                host_stats.elapsed_seconds += elapsed
+                if response.status == 304 and cached is not None:
+                    host_stats.cache_hits += 1
+                if response.status in THROTTLE_STATUSES:
+                    host_stats.throttled += 1
+
+            logger.debug(
+                "HTTP %d %s (%d bytes on wire, %d decoded, %.3fs)",
+                response.status, current_url[:120], len(raw_body), len(body), elapsed,
+            )
+
+            if response.status in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response_headers.get("retry-after"))
+                if self.governor is not None:
+                    self.governor.record_throttle(host, retry_after)
+                raise HttpError(current_url, response.status, response.reason, retry_after)
+            if self.governor is not None:
+                self.governor.record_success(host)
+            if response.status == 304 and cached is not None:
+                return HttpResponse(
+                    url=current_url,
+                    status=200,
+                    headers=response_headers,
+                    body=cached.body,
+                    wire_bytes=len(raw_body),
+                    elapsed_seconds=elapsed,
+                    from_cache=True,
+                )
+            if response.status in REDIRECT_STATUSES and response_headers.get("location"):
+                current_url = urllib.parse.urljoin(current_url, response_headers["location"])
+                continue
+            if response.status < 200 or response.status >= 300:
+                raise HttpError(current_url, response.status, response.reason)
+
+            if self.cache is not None:
+                self.cache.store(current_url, response_headers, body)
+            return HttpResponse(
+                url=current_url,
+                status=response.status,
+                headers=response_headers,
+                body=body,
+                wire_bytes=len(raw_body),
+                elapsed_seconds=elapsed,
+            )
+
+        raise HttpError(current_url, 310, "Too many redirects")
+
+    def get_embedded(
+        self,
+        url: str,
+        start_marker: bytes,
+        end_marker: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Optional[bytes]:
+        """Stream ``url`` and return the raw bytes between the two markers."""
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        request_headers = {"Accept": "text/html", "Accept-Language": "en-US,en;q=0.9"}
+        request_headers.update(headers or {})
+        request_headers = self._build_headers(request_headers)
+        current_url = url
+
+        for _ in range(MAX_REDIRECTS + 1):
+            cache_key = embedded_cache_key(current_url, start_marker, end_marker)
+            cached = self.cache.lookup(cache_key) if self.cache is not None else None
+            hop_headers = dict(request_headers)
+            if cached is not None:
+                hop_headers.update(conditional_headers(cached))
+
+            host = (urllib.parse.urlsplit(current_url).hostname or "").lower()
+            scanner = EmbeddedSliceScanner(start_marker, end_marker)
+            wire_bytes = 0
+            decoded_bytes = 0
+            with self._governed(host):
+                started = time.perf_counter()
+                response, _, key, connection = self._send_once(
+                    current_url, hop_headers, timeout, read_body=False
+                )
+                response_headers = {
+                    name.lower(): value for name, value in response.getheaders()
+                }
+                exhausted = False
+                try:
+                    if response.status == 200:
+                        decoder = StreamDecoder(response_headers.get("content-encoding", ""))
+                        while not scanner.done:
+                            chunk = response.read(STREAM_CHUNK_SIZE)
+                            if not chunk:
+                                exhausted = True
+                                break
+                            wire_bytes += len(chunk)
+                            decoded = decoder.decompress(chunk)
+                            decoded_bytes += len(decoded)
+                            scanner.feed(decoded)
+                    else:
+                        wire_bytes = len(response.read())
+                        exhausted = True
+                except Exception:
+                    connection.close()
+                    raise
+                elapsed = time.perf_counter() - started
+
+            # A half-read body leaves the connection mid-response; drop it.
+            if exhausted and not response.will_close:
+                self._checkin(key, connection)
+            else:
+                connection.close()
+
+            with self._lock:
+                host_stats = self.stats.host(key[1])
+                host_stats.requests += 1
+                host_stats.wire_bytes += wire_bytes
+                host_stats.decoded_bytes += decoded_bytes
+                host_stats.elapsed_seconds += elapsed
+                if response.status == 304 and cached is not None:
+                    host_stats.cache_hits += 1
+                if response.status in THROTTLE_STATUSES:
+                    host_stats.throttled += 1
+
+            logger.debug(
+                "HTTP %d %s (streamed %d bytes on wire, %d decoded, %.3fs)",
+                response.status, current_url[:120], wire_bytes, decoded_bytes, elapsed,
+            )
+
+            if response.status in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response_headers.get("retry-after"))
+                if self.governor is not None:
+                    self.governor.record_throttle(host, retry_after)
+                raise HttpError(current_url, response.status, response.reason, retry_after)
+            if self.governor is not None:
+                self.governor.record_success(host)
+            if response.status == 304 and cached is not None:
+                return cached.body
+            if response.status in REDIRECT_STATUSES and response_headers.get("location"):
+                current_url = urllib.parse.urljoin(current_url, response_headers["location"])
+                continue
+            if response.status != 200:
+                raise HttpError(current_url, response.status, response.reason)
+
+            value = scanner.value
+            if value is not None and self.cache is not None:
+                self.cache.store(cache_key, response_headers, value)
+            return value
+
+        raise HttpError(current_url, 310, "Too many redirects")
+
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Any:
+        request_headers = {"Accept": "application/json"}
+        request_headers.update(headers or {})
+        return self.get(url, headers=request_headers, timeout_seconds=timeout_seconds).json()
+
+    def get_text(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        request_headers = {"Accept": "text/html", "Accept-Language": "en-US,en;q=0.9"}
+        request_headers.update(headers or {})
+        return self.get(url, headers=request_headers, timeout_seconds=timeout_seconds).text()
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle = {}
+        for idle in pools:
+            for connection in idle:
+                connection.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient(governor=HostGovernor())
+        return _default_client
+
+
+def set_default_client(client: Optional[HttpClient]) -> Optional[HttpClient]:
+    global _default_client
+    with _default_client_lock:
+        previous = _default_client
+        _default_client = client
+    return previous
+
+
+async def run_blocking(call: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await blocking connector work without stalling the event loop.
+
+    The client is blocking, so this hands the call to a worker thread.
+    Connectors go through here rather than ``asyncio.to_thread`` so that a
+    native async transport only has to replace this one function.
+    """
+    return await asyncio.to_thread(call, *args, **kwargs)
@@ -0,0 +1,133 @@
+"""Multi-keyword matching shared by the geocoder and the transformers."""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Pattern, TypeVar
+
+V = TypeVar("V")
+
+# Below this many keywords, per-keyword scans beat one regex pass.
+SCAN_THRESHOLD = 32
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+# The keywords as one trie-shaped regex ("b(?:angalore|engaluru)|delhi"), so a
+# single pass over the text finds them all whatever the dictionary size.
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional suffixes make the regex prefer the longest keyword.
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class KeywordMatcher(Generic[V]):
+    def __init__(self, keywords: Mapping[str, V], whole_words: Iterable[str] = ()) -> None:
+        self.keywords: List[str] = [keyword for keyword in keywords if keyword]
+        self._values: List[V] = [keywords[keyword] for keyword in self.keywords]
+        self._index = {keyword: index for index, keyword in enumerate(self.keywords)}
+        self._whole_word = [False] * len(self.keywords)
+        for keyword in whole_words:
+            if not (_is_word_char(keyword[:1]) and _is_word_char(keyword[-1:])):
+                raise ValueError(
+                    f"whole-word keyword must start and end with a word character: {keyword!r}"
+                )
+            self._whole_word[self._index[keyword]] = True
+        self._plain = not any(self._whole_word)
+
+        self._pattern: Optional[Pattern[str]] = None
+        if len(self.keywords) >= SCAN_THRESHOLD:
+            self._pattern = re.compile(f"(?=({_trie_pattern(self.keywords)}))")
+            # Every keyword that is a prefix of a longer one also starts
+            # wherever the longer one does.
+            self._prefix_hits: Dict[str, List[int]] = {
+                keyword: [
+                    self._index[keyword[:length]]
+                    for length in range(1, len(keyword) + 1)
+                    if keyword[:length] in self._index
+                ]
+                for keyword in self.keywords
+            }
+
+    def _bounded(self, text: str, start: int, end: int) -> bool:
+        return (start == 0 or not _is_word_char(text[start - 1])) and (
+            end == len(text) or not _is_word_char(text[end])
+        )
+
+    def _scan_one(self, text: str, index: int) -> bool:
+        keyword = self.keywords[index]
+        if not self._whole_word[index]:
+            return keyword in text
+        start = text.find(keyword)
+        while start != -1:
+            if self._bounded(text, start, start + len(keyword)):
+                return True
+            start = text.find(keyword, start + 1)
+        return False
+
+    def _regex_hits(self, text: str) -> Iterator[int]:
+        """Keyword indices per occurrence, in text order (may repeat)."""
+        assert self._pattern is not None
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for index in self._prefix_hits[match.group(1)]:
+                if not self._whole_word[index] or self._bounded(
+                    text, start, start + len(self.keywords[index])
+                ):
+                    yield index
+
+    def _matched(self, text: str, first_only: bool = False) -> List[int]:
+        """Indices of the keywords found in ``text``, in dictionary order."""
+        if self._pattern is None:
+            matched = []
+            for index in range(len(self.keywords)):
+                if self._scan_one(text, index):
+                    matched.append(index)
+                    if first_only:
+                        break
+            return matched
+
+        found = set()
+        for index in self._regex_hits(text):
+            if first_only and index == 0:
+                return [0]
+            found.add(index)
+        matched = sorted(found)
+        return matched[:1] if first_only else matched
+
+    def hits(self, text: str) -> List[str]:
+        return [self.keywords[index] for index in self._matched(text)]
+
+    def values(self, text: str) -> List[V]:
+        """Values of the keywords found, in dictionary order (with repeats)."""
+        return [self._values[index] for index in self._matched(text)]
+
+    def first(self, text: str) -> Optional[V]:
+        """Value of the earliest keyword in dictionary order found in ``text``."""
+        if self._pattern is None and self._plain:
+            for keyword, value in zip(self.keywords, self._values):
+                if keyword in text:
+                    return value
+            return None
+        matched = self._matched(text, first_only=True)
+        return self._values[matched[0]] if matched else None
+
+    def any(self, text: str) -> bool:
+        if self._pattern is None:
+            return any(self._scan_one(text, index) for index in range(len(self.keywords)))
+        return next(self._regex_hits(text), None) is not None
@@ -0,0 +1,147 @@
+"""Canonical keys for free-form location text."""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from app.ingestion.gazetteer import normalize_place_name
+except ModuleNotFoundError:
+    from ingestion.gazetteer import normalize_place_name  # type: ignore[no-redef]
+
+PART_SEPARATORS = re.compile(r"[,;|]")
+TRAILING_POSTAL_CODE = re.compile(r"\s+\d{5,6}(?:-\d{4})?$")
+POSTAL_CODE = re.compile(r"^\d{5,6}(?:-\d{4})?$")
+PART_STRIP = " -–—()[]\"'"
+
+PLACEHOLDERS = frozenset(
+    {
+        "anywhere",
+        "everywhere",
+        "global",
+        "location tba",
+        "location tbd",
+        "n/a",
+        "na",
+        "none",
+        "null",
+        "online",
+        "remote",
+        "tba",
+        "tbd",
+        "to be announced",
+        "to be decided",
+        "unspecified",
+        "virtual",
+        "worldwide",
+    }
+)
+
+COUNTRY_ALIASES: Dict[str, str] = {
+    "us": "united states",
+    "usa": "united states",
+    "united states of america": "united states",
+    "america": "united states",
+    "uk": "united kingdom",
+    "england": "united kingdom",
+    "scotland": "united kingdom",
+    "wales": "united kingdom",
+    "great britain": "united kingdom",
+    "uae": "united arab emirates",
+    "republic of korea": "south korea",
+    "bharat": "india",
+}
+
+US_STATES: Dict[str, str] = {
+    "al": "alabama", "ak": "alaska", "az": "arizona", "ar": "arkansas", "ca": "california",
+    "co": "colorado", "ct": "connecticut", "de": "delaware", "dc": "district of columbia",
+    "fl": "florida", "ga": "georgia", "hi": "hawaii", "id": "idaho", "il": "illinois",
+    "in": "indiana", "ia": "iowa", "ks": "kansas", "ky": "kentucky", "la": "louisiana",
+    "me": "maine", "md": "maryland", "ma": "massachusetts", "mi": "michigan", "mn": "minnesota",
+    "ms": "mississippi", "mo": "missouri", "mt": "montana", "ne": "nebraska", "nv": "nevada",
+    "nh": "new hampshire", "nj": "new jersey", "nm": "new mexico", "ny": "new york",
+    "nc": "north carolina", "nd": "north dakota", "oh": "ohio", "ok": "oklahoma", "or": "oregon",
+    "pa": "pennsylvania", "ri": "rhode island", "sc": "south carolina", "sd": "south dakota",
+    "tn": "tennessee", "tx": "texas", "ut": "utah", "vt": "vermont", "va": "virginia",
+    "wa": "washington", "wv": "west virginia", "wi": "wisconsin", "wy": "wyoming",
+    "pr": "puerto rico",
+}
+
+CANADIAN_PROVINCES: Dict[str, str] = {
+    "ab": "alberta", "bc": "british columbia", "mb": "manitoba", "nb": "new brunswick",
+    "nl": "newfoundland and labrador", "ns": "nova scotia", "nt": "northwest territories",
+    "nu": "nunavut", "on": "ontario", "pe": "prince edward island", "qc": "quebec",
+    "sk": "saskatchewan", "yt": "yukon",
+}
+
+INDIAN_STATES = (
+    "andhra pradesh", "arunachal pradesh", "assam", "bihar", "chhattisgarh", "goa", "gujarat",
+    "haryana", "himachal pradesh", "jharkhand", "karnataka", "kerala", "madhya pradesh",
+    "maharashtra", "manipur", "meghalaya", "mizoram", "nagaland", "odisha", "punjab",
+    "rajasthan", "sikkim", "tamil nadu", "telangana", "tripura", "uttar pradesh",
+    "uttarakhand", "west bengal", "andaman and nicobar islands", "chandigarh",
+    "dadra and nagar haveli and daman and diu", "delhi", "jammu and kashmir", "ladakh",
+    "lakshadweep", "puducherry",
+)
+
+
+def _admin_areas() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, Tuple[str, str]]]:
+    codes: Dict[str, Tuple[str, str]] = {}
+    names: Dict[str, Tuple[str, str]] = {}
+    for table, country in ((US_STATES, "united states"), (CANADIAN_PROVINCES, "canada")):
+        for code, name in table.items():
+            codes[code] = names[name] = (name, country)
+    for name in INDIAN_STATES:
+        names[name] = (name, "india")
+    return codes, names
+
+
+# Admin area code or name -> (admin area name, its country).
+ADMIN_CODES, ADMIN_NAMES = _admin_areas()
+COUNTRIES = frozenset(COUNTRY_ALIASES.values()) | {
+    country for _, country in ADMIN_NAMES.values()
+}
+
+
+def _parts(text: str) -> List[str]:
+    parts: List[str] = []
+    for raw in PART_SEPARATORS.split(normalize_place_name(text).replace(".", "")):
+        part = TRAILING_POSTAL_CODE.sub("", raw.strip(PART_STRIP)).strip(PART_STRIP)
+        if part and not POSTAL_CODE.match(part):
+            parts.append(part)
+    return parts
+
+
+def _country(part: str) -> Optional[str]:
+    country = COUNTRY_ALIASES.get(part, part)
+    return country if country in COUNTRIES else None
+
+
+def canonical_location(text: str) -> Optional[str]:
+    """The cache key for ``text``, or None when it names no place."""
+    parts = [part for part in _parts(text) if part not in PLACEHOLDERS]
+    if not parts:
+        return None
+
+    places: List[str] = []
+    admin: Optional[Tuple[str, str]] = None
+    country: Optional[str] = None
+    for position, part in enumerate(parts):
+        named_country = _country(part)
+        if named_country is not None and (position > 0 or len(parts) > 1):
+            country = named_country
+            continue
+        # The first part is the place itself, even when it shares a name
+        # with a state ("New York, NY").
+        area = (ADMIN_CODES.get(part) or ADMIN_NAMES.get(part)) if position > 0 else None
+        if area is not None and admin is None:
+            admin = area
+            continue
+        if part not in places:
+            places.append(part)
+
+    if admin is not None:
+        country = country or admin[1]
+    ordered = places + ([admin[0]] if admin is not None else []) + ([country] if country else [])
+    return ", ".join(ordered)
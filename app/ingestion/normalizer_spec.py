@@ -0,0 +1,335 @@
+"""Declarative source mappings compiled into normalizer functions."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from app.ingestion.record import HackathonRecord
+    from app.ingestion.timeline_parser import parse_many
+except ModuleNotFoundError:
+    from ingestion.record import HackathonRecord  # type: ignore[no-redef]
+    from ingestion.timeline_parser import parse_many  # type: ignore[no-redef]
+
+FieldPath = Tuple[str, ...]
+Record = Dict[str, Any]
+Normalizer = Callable[..., List[HackathonRecord]]
+
+
+@dataclass(frozen=True)
+class TextField:
+    """``str(value or default)`` of the field at ``path``."""
+
+    path: FieldPath
+    default: str
+
+
+TextSource = Union[TextField, Callable[[Record], str]]
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    key: str
+    source_platform: str
+    id_path: FieldPath
+    title: TextSource
+    url: TextSource
+    format: Callable[[Record], str]
+    location_text: Callable[[Record, str], str]
+    # Dates come either from one free-text period (Devpost) or from fallback
+    # chains of start/final fields written as ISO strings or unix seconds.
+    start_paths: Sequence[FieldPath] = ()
+    final_paths: Sequence[FieldPath] = ()
+    date_format: str = "iso"
+    period_path: Optional[FieldPath] = None
+    # Records are dropped once this date (usually registration close) passes.
+    closes_at_path: Optional[FieldPath] = None
+    skip_ended: bool = False
+    skip_reversed: bool = False
+    # Whether a blank id drops the record; otherwise the raw value is used.
+    id_required: bool = True
+    themes: Optional[Callable[[Record], List[str]]] = None
+    prizes: Optional[Callable[[Record], List[str]]] = None
+    organizer_path: Optional[FieldPath] = None
+    created_at_path: Optional[FieldPath] = None
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+
+    normalized = text.replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(normalized)
+    except ValueError:
+        for format_hint in (
+            "%Y-%m-%d %H:%M:%S%z",
+            "%Y-%m-%d %H:%M:%S",
+            "%Y-%m-%d",
+        ):
+            try:
+                parsed = datetime.strptime(normalized, format_hint)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_unix_seconds(value: Any) -> Optional[datetime]:
+    try:
+        seconds = int(value)
+    except Exception:
+        return None
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+DATE_PARSERS: Dict[str, Callable[[Any], Optional[datetime]]] = {
+    "iso": parse_datetime,
+    "unix": parse_unix_seconds,
+}
+
+
+def to_utc_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def days_between(start_date: datetime, end_date: datetime) -> int:
+    return max((end_date.date() - start_date.date()).days, 0)
+
+
+def compile_path(path: FieldPath) -> Callable[[Record], Any]:
+    """Getter for a nested field; a non-dict along the way yields ``None``."""
+    if not path:
+        raise ValueError("field path must not be empty")
+    first = path[0]
+    if len(path) == 1:
+        return lambda record: record.get(first)
+    if len(path) == 2:
+        second = path[1]
+
+        def get_nested(record: Record) -> Any:
+            value = record.get(first)
+            return value.get(second) if isinstance(value, dict) else None
+
+        return get_nested
+    rest = path[1:]
+
+    def get_deep(record: Record) -> Any:
+        value = record.get(first)
+        for key in rest:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return get_deep
+
+
+def _compile_date_chain(
+    paths: Sequence[FieldPath], parse: Callable[[Any], Optional[datetime]]
+) -> Callable[[Record], Optional[datetime]]:
+    getters = [compile_path(path) for path in paths]
+    if not getters:
+        raise ValueError("date fallback chain must not be empty")
+    if len(getters) == 1:
+        only = getters[0]
+        return lambda record: parse(only(record))
+
+    def first_parsed(record: Record) -> Optional[datetime]:
+        for get in getters:
+            parsed = parse(get(record))
+            if parsed is not None:
+                return parsed
+        return None
+
+    return first_parsed
+
+
+DateRange = Optional[Tuple[datetime, datetime]]
+
+
+def _compile_dates(spec: SourceSpec) -> Callable[[List[Record], datetime], Iterable[DateRange]]:
+    if spec.period_path is not None:
+        get_period = compile_path(spec.period_path)
+
+        def period_dates(records: List[Record], current_time: datetime) -> Iterable[DateRange]:
+            # Periods repeat across a listing, so they are parsed as one batch.
+            timelines = parse_many(
+                (str(get_period(record) or "") for record in records),
+                fallback_now=current_time,
+            )
+            return (
+                None
+                if timeline is None
+                else (timeline.start_date, timeline.final_submission_date)
+                for timeline in timelines
+            )
+
+        return period_dates
+
+    parse = DATE_PARSERS[spec.date_format]
+    start_of = _compile_date_chain(spec.start_paths, parse)
+    final_of = _compile_date_chain(spec.final_paths, parse)
+
+    def field_dates(records: List[Record], current_time: datetime) -> Iterable[DateRange]:
+        for record in records:
+            start_date = start_of(record)
+            final_date = final_of(record) if start_date is not None else None
+            yield None if final_date is None else (start_date, final_date)
+
+    return field_dates
+
+
+def _compile_text(source: TextSource) -> Callable[[Record], str]:
+    if isinstance(source, TextField):
+        get = compile_path(source.path)
+        default = source.default
+        return lambda record: str(get(record) or default)
+    return source
+
+
+def _compile_id(spec: SourceSpec) -> Callable[[Record], str]:
+    get = compile_path(spec.id_path)
+    if spec.id_required:
+        return lambda record: str(get(record) or "").strip()
+    return lambda record: str(get(record))
+
+
+def _organizer_key(value: Any) -> str:
+    return str(value or "").strip().lower()
+
+
+def count_organizers(spec: SourceSpec, records: List[Record]) -> Counter:
+    if spec.organizer_path is None:
+        return Counter()
+    organizer_of = compile_path(spec.organizer_path)
+    return Counter(
+        key for key in (_organizer_key(organizer_of(record)) for record in records) if key
+    )
+
+
+RowEmitter = Callable[..., Optional[HackathonRecord]]
+
+
+def compile_row_emitter(spec: SourceSpec) -> RowEmitter:
+    """Builds the output row once dates are resolved; ``None`` drops the record."""
+    id_of = _compile_id(spec)
+    id_prefix = f"{spec.key}-"
+    id_required = spec.id_required
+    title_of = _compile_text(spec.title)
+    url_of = _compile_text(spec.url)
+    format_of = spec.format
+    location_of = spec.location_text
+    source_platform = spec.source_platform
+    themes_of = spec.themes or (lambda record: [])
+    prizes_of = spec.prizes or (lambda record: ["Unspecified"])
+    organizer_of = compile_path(spec.organizer_path) if spec.organizer_path else None
+
+    def emit(
+        record: Record,
+        start_date: str,
+        final_submission_date: str,
+        days_to_final: int,
+        created_at: str,
+        organizer_counts: Counter,
+        start_at: Optional[datetime] = None,
+        final_submission_at: Optional[datetime] = None,
+    ) -> Optional[HackathonRecord]:
+        identifier = id_of(record)
+        if id_required and not identifier:
+            return None
+        format_value = format_of(record)
+        organizer_past_events = 0
+        if organizer_of is not None:
+            organizer_name = _organizer_key(organizer_of(record))
+            organizer_past_events = max(organizer_counts.get(organizer_name, 1) - 1, 0)
+        return HackathonRecord(
+            id=id_prefix + identifier,
+            title=title_of(record),
+            url=url_of(record),
+            source_platform=source_platform,
+            format=format_value,
+            location_text=location_of(record, format_value),
+            start_date=start_date,
+            final_submission_date=final_submission_date,
+            days_to_final=days_to_final,
+            themes=themes_of(record),
+            organizer_past_events=organizer_past_events,
+            prizes=prizes_of(record),
+            created_at=created_at,
+            start_at=start_at,
+            final_submission_at=final_submission_at,
+        )
+
+    return emit
+
+
+def compile_normalizer(spec: SourceSpec) -> Normalizer:
+    dates_for = _compile_dates(spec)
+    emit = compile_row_emitter(spec)
+    closes_at_of = (
+        _compile_date_chain([spec.closes_at_path], parse_datetime)
+        if spec.closes_at_path is not None
+        else None
+    )
+    created_at_of = (
+        _compile_date_chain([spec.created_at_path], parse_datetime)
+        if spec.created_at_path is not None
+        else None
+    )
+    skip_ended = spec.skip_ended
+    skip_reversed = spec.skip_reversed
+
+    def normalize(
+        records: List[Record], now: Optional[datetime] = None
+    ) -> List[HackathonRecord]:
+        current_time = now or datetime.now(timezone.utc)
+        created_at_default = current_time.isoformat()
+        organizer_counts = count_organizers(spec, records)
+
+        normalized_records: List[HackathonRecord] = []
+        for record, date_range in zip(records, dates_for(records, current_time)):
+            if date_range is None:
+                continue
+            start_date, final_date = date_range
+            if skip_reversed and final_date < start_date:
+                continue
+            if skip_ended and final_date < current_time:
+                continue
+            if closes_at_of is not None:
+                closes_at = closes_at_of(record)
+                if closes_at is not None and closes_at < current_time:
+                    continue
+            created_at = created_at_default
+            if created_at_of is not None:
+                updated_at = created_at_of(record)
+                if updated_at is not None:
+                    created_at = updated_at.isoformat()
+
+            row = emit(
+                record,
+                to_utc_iso(start_date),
+                to_utc_iso(final_date),
+                days_between(start_date, final_date),
+                created_at,
+                organizer_counts,
+                start_date,
+                final_date,
+            )
+            if row is not None:
+                normalized_records.append(row)
+        return normalized_records
+
+    normalize.__name__ = normalize.__qualname__ = f"normalize_{spec.key}_hackathons"
+    return normalize
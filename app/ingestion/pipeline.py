@@ -1,20 +1,52 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 try:
-    from app.ingestion.connectors.devfolio import fetch_devfolio_hackathons
-    from app.ingestion.connectors.devpost import fetch_devpost_hackathons
-    from app.ingestion.connectors.hackerearth import fetch_hackerearth_hackathons
-    from app.ingestion.connectors.mlh import fetch_mlh_hackathons
-    from app.ingestion.connectors.unstop import fetch_unstop_hackathons
+    from app.ingestion.connectors.devfolio import fetch_devfolio_hackathons_async
+    from app.ingestion.connectors.devpost import fetch_devpost_hackathons_async
+    from app.ingestion.connectors.hackerearth import fetch_hackerearth_hackathons_async
+    from app.ingestion.connectors.mlh import (
+        DEFAULT_SEASON_WINDOW_DAYS,
+        fetch_mlh_hackathons_async,
+    )
+    from app.ingestion.connectors.unstop import fetch_unstop_hackathons_async
+    from app.ingestion.crawl import (
+        DEFAULT_FULL_CRAWL_INTERVAL_HOURS,
+        DEFAULT_UNCHANGED_PAGE_LIMIT,
+        CrawlCheckpoint,
+        CrawlDeadline,
+        SourceCrawl,
+        ensure_crawl_schema,
+        load_incremental_crawls,
+        save_crawl_state,
+    )
+    from app.ingestion.geocode_backlog import (
+        drain_backlog,
+        enqueue_geocodes,
+        ensure_backlog_schema,
+        patch_json_coordinates,
+        prune_backlog,
+    )
+    from app.ingestion.geocode_cache import (
+        DAY_SECONDS,
+        DEFAULT_NEGATIVE_TTL_SECONDS,
+        DEFAULT_POSITIVE_TTL_SECONDS,
+        GeocodeCache,
+    )
     from app.ingestion.geocoding import LocationGeocoder
+    from app.ingestion.http_cache import HttpCache
+    from app.ingestion.http_client import HttpClient, get_default_client, set_default_client
+    from app.ingestion.rate_limit import HostGovernor
+    from app.ingestion.record import FIELDS as RECORD_FIELDS
+    from app.ingestion.record import HackathonRecord
     from app.ingestion.transformers import (
         normalize_devfolio_hackathons,
         normalize_devpost_hackathons,
@@ -24,12 +56,47 @@ try:
     )
 except ModuleNotFoundError:
     # CI / GitHub Actions: repo root IS the app/ directory
-    from ingestion.connectors.devfolio import fetch_devfolio_hackathons  # type: ignore[no-redef]
-    from ingestion.connectors.devpost import fetch_devpost_hackathons  # type: ignore[no-redef]
-    from ingestion.connectors.hackerearth import fetch_hackerearth_hackathons  # type: ignore[no-redef]
-    from ingestion.connectors.mlh import fetch_mlh_hackathons  # type: ignore[no-redef]
-    from ingestion.connectors.unstop import fetch_unstop_hackathons  # type: ignore[no-redef]
+    from ingestion.connectors.devfolio import fetch_devfolio_hackathons_async  # type: ignore[no-redef]
+    from ingestion.connectors.devpost import fetch_devpost_hackathons_async  # type: ignore[no-redef]
+    from ingestion.connectors.hackerearth import fetch_hackerearth_hackathons_async  # type: ignore[no-redef]
+    from ingestion.connectors.mlh import (  # type: ignore[no-redef]
+        DEFAULT_SEASON_WINDOW_DAYS,
+        fetch_mlh_hackathons_async,
+    )
+    from ingestion.connectors.unstop import fetch_unstop_hackathons_async  # type: ignore[no-redef]
+    from ingestion.crawl import (  # type: ignore[no-redef]
+        DEFAULT_FULL_CRAWL_INTERVAL_HOURS,
+        DEFAULT_UNCHANGED_PAGE_LIMIT,
+        CrawlCheckpoint,
+        CrawlDeadline,
+        SourceCrawl,
+        ensure_crawl_schema,
+        load_incremental_crawls,
+        save_crawl_state,
+    )
+    from ingestion.geocode_backlog import (  # type: ignore[no-redef]
+        drain_backlog,
+        enqueue_geocodes,
+        ensure_backlog_schema,
+        patch_json_coordinates,
+        prune_backlog,
+    )
+    from ingestion.geocode_cache import (  # type: ignore[no-redef]
+        DAY_SECONDS,
+        DEFAULT_NEGATIVE_TTL_SECONDS,
+        DEFAULT_POSITIVE_TTL_SECONDS,
+        GeocodeCache,
+    )
     from ingestion.geocoding import LocationGeocoder  # type: ignore[no-redef]
+    from ingestion.http_cache import HttpCache  # type: ignore[no-redef]
+    from ingestion.http_client import (  # type: ignore[no-redef]
+        HttpClient,
+        get_default_client,
+        set_default_client,
+    )
+    from ingestion.rate_limit import HostGovernor  # type: ignore[no-redef]
+    from ingestion.record import FIELDS as RECORD_FIELDS  # type: ignore[no-redef]
+    from ingestion.record import HackathonRecord  # type: ignore[no-redef]
     from ingestion.transformers import (  # type: ignore[no-redef]
         normalize_devfolio_hackathons,
         normalize_devpost_hackathons,
@@ -42,6 +109,9 @@ except ModuleNotFoundError:
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DB_PATH = REPO_ROOT / "app" / "data" / "hackhunt.db"
 DEFAULT_JSON_OUTPUT_PATH = REPO_ROOT / "app" / "data" / "ingested_hackathons.json"
+DEFAULT_HTTP_CACHE_PATH = REPO_ROOT / "app" / "data" / "http_cache.db"
+DEFAULT_HTTP_CACHE_MAX_MB = 64
+DEFAULT_GEOCODE_CACHE_PATH = REPO_ROOT / "app" / "data" / "geocode_cache.db"
 SUPPORTED_SOURCES = ("devpost", "devfolio", "hackerearth", "unstop", "mlh")
 SOURCE_PLATFORM_BY_KEY = {
     "devpost": "Devpost",
@@ -50,6 +120,21 @@ SOURCE_PLATFORM_BY_KEY = {
     "unstop": "Unstop",
     "mlh": "MLH",
 }
+DEFAULT_SOURCE_CONCURRENCY = 1
+# Rough relative cost of one fetch; cheap single-page sources run first so a
+# deadline trims the long paginated crawls instead of whole sources.
+SOURCE_FETCH_COST = {
+    "devfolio": 1,
+    "hackerearth": 1,
+    "mlh": 1,
+    "unstop": 2,
+    "devpost": 3,
+}
+# Slices of a --deadline-seconds budget held back for work after fetching:
+# an in-flight request running into its timeout, geocoding, then the writes.
+DEADLINE_FETCH_RESERVE_SECONDS = 60.0
+DEADLINE_COMMIT_RESERVE_SECONDS = 15.0
+DEADLINE_MAX_RESERVE_FRACTION = 0.25
 
 
 def _ensure_schema(connection: sqlite3.Connection) -> None:
@@ -80,151 +165,151 @@ def _ensure_schema(connection: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_hackathons_created_at ON hackathons(created_at);
         """
     )
+    ensure_crawl_schema(connection)
+    ensure_backlog_schema(connection)
 
 
-def _upsert_records(connection: sqlite3.Connection, records: Iterable[Dict[str, object]]) -> int:
-    statement = """
-      INSERT INTO hackathons (
-        id,
-        title,
-        url,
-        source_platform,
-        format,
-        location_text,
-        latitude,
-        longitude,
-        start_date,
-        final_submission_date,
-        days_to_final,
-        themes,
-        organizer_past_events,
-        prizes,
-        created_at,
-        is_active
-      ) VALUES (
-        :id,
-        :title,
-        :url,
-        :source_platform,
-        :format,
-        :location_text,
-        :latitude,
-        :longitude,
-        :start_date,
-        :final_submission_date,
-        :days_to_final,
-        :themes,
-        :organizer_past_events,
-        :prizes,
-        :created_at,
-        1
-      )
+_UPSERT_COLUMNS = ", ".join(RECORD_FIELDS)
+_UPSERT_PLACEHOLDERS = ", ".join("?" for _ in RECORD_FIELDS)
+# A run that leaves a listing unplaced (geocoding off, deferred or failed)
+# keeps the coordinates an earlier run or the backlog worker found, as long
+# as the location text is unchanged.
+_KEEP_COORDINATES = (
+    "CASE WHEN excluded.{column} IS NULL AND excluded.location_text = hackathons.location_text "
+    "THEN hackathons.{column} ELSE excluded.{column} END"
+)
+_UPSERT_UPDATES = ",\n        ".join(
+    f"{column} = "
+    + (
+        _KEEP_COORDINATES.format(column=column)
+        if column in ("latitude", "longitude")
+        else f"excluded.{column}"
+    )
+    for column in RECORD_FIELDS
+    if column != "id"
+)
+UPSERT_STATEMENT = f"""
+      INSERT INTO hackathons ({_UPSERT_COLUMNS}, is_active)
+      VALUES ({_UPSERT_PLACEHOLDERS}, 1)
       ON CONFLICT(id) DO UPDATE SET
-        title = excluded.title,
-        url = excluded.url,
-        source_platform = excluded.source_platform,
-        format = excluded.format,
-        location_text = excluded.location_text,
-        latitude = excluded.latitude,
-        longitude = excluded.longitude,
-        start_date = excluded.start_date,
-        final_submission_date = excluded.final_submission_date,
-        days_to_final = excluded.days_to_final,
-        themes = excluded.themes,
-        organizer_past_events = excluded.organizer_past_events,
-        prizes = excluded.prizes,
-        created_at = excluded.created_at,
+        {_UPSERT_UPDATES},
         is_active = 1;
-    """
-    cursor = connection.cursor()
-    rows_written = 0
-    for record in records:
-        cursor.execute(
-            statement,
-            {
-                "id": record["id"],
-                "title": record["title"],
-                "url": record["url"],
-                "source_platform": record["source_platform"],
-                "format": record["format"],
-                "location_text": record["location_text"],
-                "latitude": record.get("latitude"),
-                "longitude": record.get("longitude"),
-                "start_date": record["start_date"],
-                "final_submission_date": record["final_submission_date"],
-                "days_to_final": int(record["days_to_final"]),
-                "themes": json.dumps(record.get("themes", [])),
-                "organizer_past_events": int(record.get("organizer_past_events", 0)),
-                "prizes": json.dumps(record.get("prizes", [])),
-                "created_at": record["created_at"],
-            },
-        )
-        rows_written += 1
+"""
+
+
+def _upsert_records(
+    connection: sqlite3.Connection, records: Iterable[Mapping[str, object]]
+) -> int:
+    rows = [HackathonRecord.coerce(record).to_db_params() for record in records]
+    connection.executemany(UPSERT_STATEMENT, rows)
     connection.commit()
-    return rows_written
+    return len(rows)
 
 
-def _serialize_for_json(records: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
-    serialized: List[Dict[str, object]] = []
-    for record in records:
-        serialized.append(
-            {
-                "id": record["id"],
-                "title": record["title"],
-                "url": record["url"],
-                "sourcePlatform": record["source_platform"],
-                "format": record["format"],
-                "locationText": record["location_text"],
-                "coordinates": (
-                    {
-                        "lat": record["latitude"],
-                        "lng": record["longitude"],
-                    }
-                    if record.get("latitude") is not None
-                    and record.get("longitude") is not None
-                    else None
-                ),
-                "startDate": record["start_date"],
-                "finalSubmissionDate": record["final_submission_date"],
-                "daysToFinal": record["days_to_final"],
-                "themes": record.get("themes", []),
-                "organizerPastEvents": record.get("organizer_past_events", 0),
-                "prizes": record.get("prizes", []),
-                "createdAt": record["created_at"],
-            }
-        )
-    return serialized
+def _load_active_records(
+    connection: sqlite3.Connection,
+    platforms: Sequence[str],
+    exclude_ids: Iterable[str],
+) -> List[HackathonRecord]:
+    if len(platforms) == 0:
+        return []
+    excluded = set(exclude_ids)
+    placeholders = ", ".join("?" for _ in platforms)
+    connection.row_factory = sqlite3.Row
+    try:
+        rows = connection.execute(
+            f"""
+            SELECT * FROM hackathons
+            WHERE is_active = 1 AND source_platform IN ({placeholders})
+            ORDER BY id
+            """,
+            list(platforms),
+        ).fetchall()
+    finally:
+        connection.row_factory = None
+    records: List[HackathonRecord] = []
+    for row in rows:
+        if row["id"] in excluded:
+            continue
+        record = {key: row[key] for key in row.keys() if key != "is_active"}
+        record["themes"] = json.loads(row["themes"] or "[]")
+        record["prizes"] = json.loads(row["prizes"] or "[]")
+        records.append(HackathonRecord.from_mapping(record))
+    return records
+
+
+def _serialize_for_json(records: Iterable[Mapping[str, object]]) -> List[Dict[str, object]]:
+    return [HackathonRecord.coerce(record).to_json() for record in records]
+
 
+def _apply_geocoding(
+    records: List[HackathonRecord],
+    enabled: bool,
+    deadline: Optional[CrawlDeadline] = None,
+    cache: Optional[GeocodeCache] = None,
+    defer: bool = False,
+) -> List[HackathonRecord]:
+    """Place ``records``; returns those left for a later remote lookup.
 
-def _apply_geocoding(records: List[Dict[str, object]], enabled: bool) -> None:
+    With ``defer`` only offline answers are used and every other location is
+    left for the geocoding backlog.
+    """
     if not enabled:
-        return
+        return []
+
+    geocoder = LocationGeocoder(enabled=True, cache=cache)
+    if defer:
+        geocoder.enabled = False
+    unplaced: List[HackathonRecord] = []
+    try:
+        for record in records:
+            if record.format == "Online":
+                continue
+            if deadline is not None and deadline.expired and geocoder.enabled:
+                # Out of time: keep the offline fallbacks and cached answers
+                # but stop remote lookups.
+                print("[WARNING] Ingestion deadline reached, skipping remote geocoding")
+                geocoder.enabled = False
+            coordinates = geocoder.geocode(record.location_text)
+            if coordinates is None:
+                unplaced.append(record)
+                continue
+            record.latitude = coordinates[0]
+            record.longitude = coordinates[1]
+    finally:
+        if cache is not None:
+            cache.flush()
+    return [record for record in unplaced if geocoder.was_deferred(record.location_text)]
 
-    geocoder = LocationGeocoder(enabled=True)
+
+def _restore_coordinates(
+    connection: sqlite3.Connection, records: Iterable[Mapping[str, object]]
+) -> None:
+    """Copy the coordinates the upsert kept into listings this run left unplaced."""
     for record in records:
-        format_value = str(record.get("format") or "")
-        if format_value == "Online":
-            continue
-        coordinates = geocoder.geocode(str(record.get("location_text") or ""))
-        if coordinates is None:
+        if record.get("format") == "Online" or record.get("latitude") is not None:
             continue
-        record["latitude"] = coordinates[0]
-        record["longitude"] = coordinates[1]
+        row = connection.execute(
+            "SELECT latitude, longitude FROM hackathons WHERE id = ? AND latitude IS NOT NULL",
+            (str(record.get("id") or ""),),
+        ).fetchone()
+        if row is not None:
+            record["latitude"], record["longitude"] = row  # type: ignore[index]
 
 
-def _dedupe_by_id(records: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    by_id: Dict[str, Dict[str, object]] = {}
+def _dedupe_by_id(records: Iterable[Mapping[str, object]]) -> List[HackathonRecord]:
+    by_id: Dict[str, HackathonRecord] = {}
     for record in records:
         identifier = str(record.get("id") or "")
         if not identifier:
             continue
-        by_id[identifier] = record
+        by_id[identifier] = HackathonRecord.coerce(record)
     return list(by_id.values())
 
 
 def _deactivate_stale_records(
     connection: sqlite3.Connection,
-    records: Sequence[Dict[str, object]],
+    records: Sequence[Mapping[str, object]],
     selected_sources: Sequence[str],
 ) -> int:
     selected_platforms = {
@@ -293,88 +378,233 @@ def _resolve_sources(raw_sources: Optional[str]) -> List[str]:
     return valid if valid else list(SUPPORTED_SOURCES)
 
 
-def ingest_all_sources(
+async def _fetch_and_normalize_source_async(
+    source: str,
+    max_pages: int,
+    mlh_season_year: Optional[int],
+    current_time: datetime,
+    crawl: SourceCrawl,
+    mlh_season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+) -> List[HackathonRecord]:
+    if source == "devpost":
+        return normalize_devpost_hackathons(
+            await fetch_devpost_hackathons_async(max_pages=max_pages, crawl=crawl),
+            now=current_time,
+        )
+    if source == "devfolio":
+        return normalize_devfolio_hackathons(
+            await fetch_devfolio_hackathons_async(),
+            now=current_time,
+        )
+    if source == "hackerearth":
+        return normalize_hackerearth_hackathons(
+            await fetch_hackerearth_hackathons_async(),
+            now=current_time,
+        )
+    if source == "unstop":
+        return normalize_unstop_hackathons(
+            await fetch_unstop_hackathons_async(max_pages=max_pages, crawl=crawl),
+            now=current_time,
+        )
+    if source == "mlh":
+        return normalize_mlh_hackathons(
+            await fetch_mlh_hackathons_async(
+                season_year=mlh_season_year,
+                season_window_days=mlh_season_window_days,
+                now=current_time,
+                crawl=crawl,
+            ),
+            now=current_time,
+        )
+    raise ValueError(f"Unsupported source: {source}")
+
+
+async def _ingest_source_isolated_async(
+    source: str,
+    max_pages: int,
+    mlh_season_year: Optional[int],
+    current_time: datetime,
+    source_slots: asyncio.Semaphore,
+    crawl: SourceCrawl,
+    mlh_season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+) -> List[HackathonRecord]:
+    async with source_slots:
+        if crawl.out_of_time():
+            print(
+                f"[WARNING] {SOURCE_PLATFORM_BY_KEY[source]} source skipped, "
+                "ingestion deadline reached"
+            )
+            return []
+        try:
+            return await _fetch_and_normalize_source_async(
+                source,
+                max_pages=max_pages,
+                mlh_season_year=mlh_season_year,
+                current_time=current_time,
+                crawl=crawl,
+                mlh_season_window_days=mlh_season_window_days,
+            )
+        except Exception as exc:
+            print(f"[WARNING] {SOURCE_PLATFORM_BY_KEY[source]} source failed, skipping: {exc}")
+            crawl.mark_partial(f"failed: {exc}")
+            return []
+
+
+def _drop_expired(
+    records: Iterable[HackathonRecord], current_time: datetime
+) -> List[HackathonRecord]:
+    # Drop events whose submission deadline has already passed; records with
+    # unparseable dates are kept (let downstream decide).
+    active = []
+    for record in records:
+        final_submission_at = record.final_submission_at
+        if final_submission_at is not None and final_submission_at < current_time:
+            continue
+        active.append(record)
+    return active
+
+
+async def ingest_all_sources_async(
     max_pages: int = 5,
     geocode: bool = True,
     sources: Optional[Sequence[str]] = None,
     mlh_season_year: Optional[int] = None,
-) -> List[Dict[str, object]]:
+    source_concurrency: int = DEFAULT_SOURCE_CONCURRENCY,
+    crawls: Optional[Mapping[str, SourceCrawl]] = None,
+    geocode_deadline: Optional[CrawlDeadline] = None,
+    mlh_season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+    geocode_cache: Optional[GeocodeCache] = None,
+) -> List[HackathonRecord]:
     current_time = datetime.now(timezone.utc)
     selected_sources = list(sources) if sources else list(SUPPORTED_SOURCES)
-    records: List[Dict[str, object]] = []
-
-    if "devpost" in selected_sources:
-        try:
-            records.extend(
-                normalize_devpost_hackathons(
-                    fetch_devpost_hackathons(max_pages=max_pages),
-                    now=current_time,
-                )
+    crawls = crawls or {}
+    # Results are always merged in SUPPORTED_SOURCES order so that
+    # _dedupe_by_id picks the same winner whether sources ran serially or not.
+    ordered_sources = [source for source in SUPPORTED_SOURCES if source in selected_sources]
+    # The semaphore admits waiters in order, so this is the fetch schedule.
+    fetch_order = sorted(ordered_sources, key=lambda source: SOURCE_FETCH_COST[source])
+    source_slots = asyncio.Semaphore(max(source_concurrency, 1))
+    per_source_records = await asyncio.gather(
+        *(
+            _ingest_source_isolated_async(
+                source,
+                max_pages=max_pages,
+                mlh_season_year=mlh_season_year,
+                current_time=current_time,
+                source_slots=source_slots,
+                crawl=crawls.get(source) or SourceCrawl(source),
+                mlh_season_window_days=mlh_season_window_days,
             )
-        except Exception as exc:
-            print(f"[WARNING] Devpost source failed, skipping: {exc}")
+            for source in fetch_order
+        )
+    )
+    records_by_source = dict(zip(fetch_order, per_source_records))
 
-    if "devfolio" in selected_sources:
-        try:
-            records.extend(
-                normalize_devfolio_hackathons(
-                    fetch_devfolio_hackathons(),
-                    now=current_time,
-                )
-            )
-        except Exception as exc:
-            print(f"[WARNING] Devfolio source failed, skipping: {exc}")
+    records: List[HackathonRecord] = []
+    for source in ordered_sources:
+        records.extend(records_by_source[source])
 
-    if "hackerearth" in selected_sources:
-        try:
-            records.extend(
-                normalize_hackerearth_hackathons(
-                    fetch_hackerearth_hackathons(),
-                    now=current_time,
-                )
-            )
-        except Exception as exc:
-            print(f"[WARNING] HackerEarth source failed, skipping: {exc}")
+    active = _drop_expired(_dedupe_by_id(records), current_time)
 
-    if "unstop" in selected_sources:
-        try:
-            records.extend(
-                normalize_unstop_hackathons(
-                    fetch_unstop_hackathons(max_pages=max_pages),
-                    now=current_time,
-                )
-            )
-        except Exception as exc:
-            print(f"[WARNING] Unstop source failed, skipping: {exc}")
+    await asyncio.to_thread(
+        _apply_geocoding, active, geocode, geocode_deadline, geocode_cache
+    )
+    return active
 
-    if "mlh" in selected_sources:
-        try:
-            records.extend(
-                normalize_mlh_hackathons(
-                    fetch_mlh_hackathons(season_year=mlh_season_year),
-                    now=current_time,
-                )
-            )
-        except Exception as exc:
-            print(f"[WARNING] MLH source failed, skipping: {exc}")
 
-    deduped = _dedupe_by_id(records)
+def ingest_all_sources(
+    max_pages: int = 5,
+    geocode: bool = True,
+    sources: Optional[Sequence[str]] = None,
+    mlh_season_year: Optional[int] = None,
+    source_concurrency: int = DEFAULT_SOURCE_CONCURRENCY,
+    crawls: Optional[Mapping[str, SourceCrawl]] = None,
+    geocode_deadline: Optional[CrawlDeadline] = None,
+    mlh_season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+    geocode_cache: Optional[GeocodeCache] = None,
+) -> List[HackathonRecord]:
+    return asyncio.run(
+        ingest_all_sources_async(
+            max_pages=max_pages,
+            geocode=geocode,
+            sources=sources,
+            mlh_season_year=mlh_season_year,
+            source_concurrency=source_concurrency,
+            crawls=crawls,
+            geocode_deadline=geocode_deadline,
+            mlh_season_window_days=mlh_season_window_days,
+            geocode_cache=geocode_cache,
+        )
+    )
 
-    # Drop events whose submission deadline has already passed
-    active = []
-    for record in deduped:
-        try:
-            fsd = datetime.fromisoformat(str(record.get("final_submission_date", "")))
-            if fsd.tzinfo is None:
-                fsd = fsd.replace(tzinfo=timezone.utc)
-            if fsd < current_time:
-                continue
-        except (ValueError, TypeError):
-            pass  # keep records with unparseable dates (let downstream decide)
-        active.append(record)
 
-    _apply_geocoding(active, enabled=geocode)
-    return active
+def _prepare_crawls(
+    db_path: Optional[Path],
+    sources: Sequence[str],
+    incremental: bool,
+    unchanged_page_limit: int,
+    full_crawl_interval_hours: float,
+    now: datetime,
+) -> Dict[str, SourceCrawl]:
+    if not incremental:
+        return {source: SourceCrawl(source) for source in sources}
+    if db_path is None:
+        print("[WARNING] Incremental mode needs the SQLite database; running a full crawl")
+        return {source: SourceCrawl(source) for source in sources}
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    try:
+        _ensure_schema(connection)
+        return load_incremental_crawls(
+            connection,
+            sources,
+            now=now,
+            unchanged_page_limit=unchanged_page_limit,
+            full_crawl_interval_hours=full_crawl_interval_hours,
+        )
+    finally:
+        connection.close()
+
+
+def _plan_deadlines(
+    deadline_seconds: Optional[float],
+) -> Tuple[Optional[CrawlDeadline], Optional[CrawlDeadline]]:
+    if deadline_seconds is None or deadline_seconds <= 0:
+        return None, None
+    max_reserve = deadline_seconds * DEADLINE_MAX_RESERVE_FRACTION
+    commit_reserve = min(DEADLINE_COMMIT_RESERVE_SECONDS, max_reserve)
+    fetch_reserve = min(DEADLINE_FETCH_RESERVE_SECONDS, max_reserve) + commit_reserve
+    return (
+        CrawlDeadline(deadline_seconds - fetch_reserve),
+        CrawlDeadline(deadline_seconds - commit_reserve),
+    )
+
+
+def _checkpoint_dir(db_path: Path) -> Path:
+    return db_path.parent / f"{db_path.stem}_checkpoints"
+
+
+def _attach_checkpoints(
+    crawls: Mapping[str, SourceCrawl],
+    db_path: Optional[Path],
+    resume: bool,
+    now: datetime,
+) -> int:
+    if db_path is None:
+        if resume:
+            print("[WARNING] Resuming needs the SQLite database path; starting from page 1")
+        return 0
+
+    resumed_pages = 0
+    for source, crawl in crawls.items():
+        checkpoint = CrawlCheckpoint(_checkpoint_dir(db_path), source)
+        if resume:
+            resumed_pages += checkpoint.load(now)
+        else:
+            checkpoint.clear()
+        crawl.checkpoint = checkpoint
+    return resumed_pages
 
 
 def run_pipeline(
@@ -384,20 +614,61 @@ def run_pipeline(
     geocode: bool,
     sources: Sequence[str],
     mlh_season_year: Optional[int],
-) -> Dict[str, int]:
+    source_concurrency: int = DEFAULT_SOURCE_CONCURRENCY,
+    incremental: bool = False,
+    unchanged_page_limit: int = DEFAULT_UNCHANGED_PAGE_LIMIT,
+    full_crawl_interval_hours: float = DEFAULT_FULL_CRAWL_INTERVAL_HOURS,
+    deadline_seconds: Optional[float] = None,
+    resume: bool = False,
+    mlh_season_window_days: int = DEFAULT_SEASON_WINDOW_DAYS,
+    geocode_cache: Optional[GeocodeCache] = None,
+    defer_geocoding: bool = False,
+) -> Dict[str, Any]:
+    started_at = datetime.now(timezone.utc)
+    if defer_geocoding and db_path is None:
+        print("[WARNING] Deferred geocoding needs the SQLite database; geocoding inline")
+        defer_geocoding = False
+    fetch_deadline, geocode_deadline = _plan_deadlines(deadline_seconds)
+    crawls = _prepare_crawls(
+        db_path,
+        sources,
+        incremental=incremental,
+        unchanged_page_limit=unchanged_page_limit,
+        full_crawl_interval_hours=full_crawl_interval_hours,
+        now=started_at,
+    )
+    for crawl in crawls.values():
+        crawl.deadline = fetch_deadline
+    resumed_pages = _attach_checkpoints(crawls, db_path, resume=resume, now=started_at)
     records = ingest_all_sources(
         max_pages=max_pages,
-        geocode=geocode,
+        geocode=False,
         sources=sources,
         mlh_season_year=mlh_season_year,
+        source_concurrency=source_concurrency,
+        crawls=crawls,
+        mlh_season_window_days=mlh_season_window_days,
     )
-    summary = {
+    # Locations the run could not place without a remote lookup go to the
+    # geocoding backlog instead of holding up the writes below.
+    pending_geocodes = _apply_geocoding(
+        records, geocode, geocode_deadline, geocode_cache, defer=defer_geocoding
+    )
+    # Sources that stopped early did not see every listing, so their missing
+    # events must neither be deactivated nor dropped from the JSON output.
+    partial_sources = [source for source in sources if not crawls[source].complete]
+    complete_sources = [source for source in sources if crawls[source].complete]
+    summary: Dict[str, Any] = {
         "fetched": len(records),
         "written_to_db": 0,
         "written_to_json": 0,
         "deactivated_in_db": 0,
+        "queued_geocodes": 0,
+        "partial_sources": partial_sources,
+        "resumed_pages": resumed_pages,
     }
 
+    carried_over: List[HackathonRecord] = []
     if db_path is not None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         connection = sqlite3.connect(db_path)
@@ -406,15 +677,36 @@ def run_pipeline(
             summary["deactivated_in_db"] = _deactivate_stale_records(
                 connection=connection,
                 records=records,
-                selected_sources=sources,
+                selected_sources=complete_sources,
             )
             summary["written_to_db"] = _upsert_records(connection, records)
+            _restore_coordinates(connection, records)
+            summary["queued_geocodes"] = enqueue_geocodes(connection, pending_geocodes, started_at)
+            prune_backlog(connection)
+            connection.commit()
+            save_crawl_state(
+                connection,
+                [crawls[source] for source in sources],
+                finished_at=started_at,
+            )
+            # Only drop checkpoints once their pages are safely in the database.
+            for source in sources:
+                crawls[source].finish_checkpoint()
+            if json_output_path is not None:
+                carried_over = _drop_expired(
+                    _load_active_records(
+                        connection,
+                        platforms=[SOURCE_PLATFORM_BY_KEY[source] for source in partial_sources],
+                        exclude_ids=[str(record["id"]) for record in records],
+                    ),
+                    started_at,
+                )
         finally:
             connection.close()
 
     if json_output_path is not None:
         json_output_path.parent.mkdir(parents=True, exist_ok=True)
-        json_records = _serialize_for_json(records)
+        json_records = _serialize_for_json([*records, *carried_over])
         json_output_path.write_text(
             json.dumps(json_records, indent=2, ensure_ascii=True), encoding="utf-8"
         )
@@ -423,6 +715,44 @@ def run_pipeline(
     return summary
 
 
+def _add_geocode_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--geocode-cache-path",
+        type=Path,
+        default=Path(
+            os.getenv("HACKHUNT_GEOCODE_CACHE_PATH", str(DEFAULT_GEOCODE_CACHE_PATH))
+        ),
+        help="On-disk cache of geocoding results shared across runs.",
+    )
+    parser.add_argument(
+        "--geocode-cache-ttl-days",
+        type=float,
+        default=float(
+            os.getenv(
+                "HACKHUNT_GEOCODE_CACHE_TTL_DAYS",
+                str(DEFAULT_POSITIVE_TTL_SECONDS / DAY_SECONDS),
+            )
+        ),
+        help="How long found coordinates are reused before being looked up again.",
+    )
+    parser.add_argument(
+        "--geocode-negative-ttl-days",
+        type=float,
+        default=float(
+            os.getenv(
+                "HACKHUNT_GEOCODE_NEGATIVE_TTL_DAYS",
+                str(DEFAULT_NEGATIVE_TTL_SECONDS / DAY_SECONDS),
+            )
+        ),
+        help="How long a location the geocoder could not find is left alone.",
+    )
+    parser.add_argument(
+        "--no-geocode-cache",
+        action="store_true",
+        help="Look every location up again instead of reusing earlier results.",
+    )
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="HackHunt ingestion pipeline runner")
     parser.add_argument(
@@ -440,6 +770,70 @@ def _parse_args() -> argparse.Namespace:
             "Supported: devpost,devfolio,hackerearth,unstop,mlh"
         ),
     )
+    parser.add_argument(
+        "--source-concurrency",
+        type=int,
+        default=int(
+            os.getenv(
+                "HACKHUNT_INGEST_SOURCE_CONCURRENCY", str(DEFAULT_SOURCE_CONCURRENCY)
+            )
+        ),
+        help=(
+            "Number of sources to fetch and normalize in parallel "
+            "(1 runs them one after another)."
+        ),
+    )
+    parser.add_argument(
+        "--deadline-seconds",
+        type=float,
+        default=float(os.getenv("HACKHUNT_INGEST_DEADLINE_SECONDS", "0")),
+        help=(
+            "Wall-clock budget for the whole run (0 means none). Fetching stops "
+            "early enough to commit what was gathered; unfinished sources are "
+            "reported as partial and none of their events are deactivated."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=os.getenv("HACKHUNT_INGEST_RESUME", "").lower() in {"1", "true", "yes"},
+        help=(
+            "Continue from the page checkpoints an interrupted run left next to "
+            "the database instead of starting every source from page 1."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=os.getenv("HACKHUNT_INGEST_INCREMENTAL", "").lower() in {"1", "true", "yes"},
+        help=(
+            "Stop paginating Devpost/Unstop after a run of pages whose records are "
+            "all known and unchanged since the last run."
+        ),
+    )
+    parser.add_argument(
+        "--unchanged-page-limit",
+        type=int,
+        default=int(
+            os.getenv(
+                "HACKHUNT_INGEST_UNCHANGED_PAGE_LIMIT", str(DEFAULT_UNCHANGED_PAGE_LIMIT)
+            )
+        ),
+        help="Consecutive unchanged pages after which an incremental crawl stops.",
+    )
+    parser.add_argument(
+        "--full-crawl-hours",
+        type=float,
+        default=float(
+            os.getenv(
+                "HACKHUNT_INGEST_FULL_CRAWL_HOURS", str(DEFAULT_FULL_CRAWL_INTERVAL_HOURS)
+            )
+        ),
+        help=(
+            "Run a full crawl of a source when its last one is older than this, "
+            "so deleted events are still noticed in incremental mode."
+        ),
+    )
     parser.add_argument(
         "--mlh-season-year",
         type=int,
@@ -450,6 +844,17 @@ def _parse_args() -> argparse.Namespace:
         ),
         help="MLH season year to ingest (defaults to current UTC year).",
     )
+    parser.add_argument(
+        "--mlh-season-window-days",
+        type=int,
+        default=int(
+            os.getenv("HACKHUNT_MLH_SEASON_WINDOW_DAYS", str(DEFAULT_SEASON_WINDOW_DAYS))
+        ),
+        help=(
+            "Also fetch the adjacent MLH season when this close to the turn of the "
+            "year (0 fetches only the current season; ignored with --mlh-season-year)."
+        ),
+    )
     parser.add_argument(
         "--db-path",
         type=Path,
@@ -462,6 +867,34 @@ def _parse_args() -> argparse.Namespace:
         default=DEFAULT_JSON_OUTPUT_PATH,
         help="JSON output path for app bootstrap ingestion data.",
     )
+    parser.add_argument(
+        "--http-cache-path",
+        type=Path,
+        default=Path(os.getenv("HACKHUNT_HTTP_CACHE_PATH", str(DEFAULT_HTTP_CACHE_PATH))),
+        help="On-disk conditional-GET cache for source pages.",
+    )
+    parser.add_argument(
+        "--http-cache-max-mb",
+        type=int,
+        default=int(os.getenv("HACKHUNT_HTTP_CACHE_MAX_MB", str(DEFAULT_HTTP_CACHE_MAX_MB))),
+        help="Size cap for the HTTP cache; least recently used pages are evicted first.",
+    )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Always download source pages in full instead of revalidating cached copies.",
+    )
+    _add_geocode_cache_arguments(parser)
+    parser.add_argument(
+        "--defer-geocoding",
+        action="store_true",
+        default=os.getenv("HACKHUNT_DEFER_GEOCODING", "").lower() in {"1", "true", "yes"},
+        help=(
+            "Only place locations offline (fallbacks, gazetteer, cache) and queue the "
+            "rest for the geocode-backlog worker, so the writes never wait on the "
+            "geocoding provider. Needs the SQLite database."
+        ),
+    )
     parser.add_argument(
         "--disable-geocoding",
         action="store_true",
@@ -480,17 +913,52 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _configure_http_client(args: argparse.Namespace) -> None:
+    cache = None
+    if not args.no_http_cache:
+        cache = HttpCache(
+            args.http_cache_path,
+            max_bytes=max(args.http_cache_max_mb, 0) * 1024 * 1024,
+        )
+    set_default_client(HttpClient(cache=cache, governor=HostGovernor()))
+
+
+def _geocode_cache(args: argparse.Namespace) -> Optional[GeocodeCache]:
+    if args.no_geocode_cache:
+        return None
+    return GeocodeCache(
+        args.geocode_cache_path,
+        positive_ttl_seconds=args.geocode_cache_ttl_days * DAY_SECONDS,
+        negative_ttl_seconds=args.geocode_negative_ttl_days * DAY_SECONDS,
+    )
+
+
 def main() -> None:
     args = _parse_args()
+    _configure_http_client(args)
     selected_sources = _resolve_sources(args.sources)
-    summary = run_pipeline(
-        max_pages=max(0, args.max_pages),
-        db_path=None if args.skip_db else args.db_path,
-        json_output_path=None if args.skip_json else args.json_output,
-        geocode=not args.disable_geocoding,
-        sources=selected_sources,
-        mlh_season_year=args.mlh_season_year,
-    )
+    geocode_cache = None if args.disable_geocoding else _geocode_cache(args)
+    try:
+        summary = run_pipeline(
+            max_pages=max(0, args.max_pages),
+            db_path=None if args.skip_db else args.db_path,
+            json_output_path=None if args.skip_json else args.json_output,
+            geocode=not args.disable_geocoding,
+            sources=selected_sources,
+            mlh_season_year=args.mlh_season_year,
+            source_concurrency=max(1, args.source_concurrency),
+            incremental=args.incremental,
+            unchanged_page_limit=max(1, args.unchanged_page_limit),
+            full_crawl_interval_hours=max(0.0, args.full_crawl_hours),
+            deadline_seconds=args.deadline_seconds if args.deadline_seconds > 0 else None,
+            resume=args.resume,
+            mlh_season_window_days=max(0, args.mlh_season_window_days),
+            geocode_cache=geocode_cache,
+            defer_geocoding=args.defer_geocoding,
+        )
+    finally:
+        if geocode_cache is not None:
+            geocode_cache.close()
     print(
         json.dumps(
             {
@@ -500,10 +968,79 @@ def main() -> None:
                 "written_to_db": summary["written_to_db"],
                 "written_to_json": summary["written_to_json"],
                 "deactivated_in_db": summary["deactivated_in_db"],
+                "queued_geocodes": summary["queued_geocodes"],
+                "partial_sources": summary["partial_sources"],
+                "resumed_pages": summary["resumed_pages"],
+                "http": get_default_client().stats.totals().as_dict(),
             }
         )
     )
 
 
+def _parse_backlog_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HackHunt deferred geocoding worker")
+    parser.add_argument(
+        "--db-path",
+        type=Path,
+        default=Path(os.getenv("HACKHUNT_DB_PATH", str(DEFAULT_DB_PATH))),
+        help="SQLite database holding the hackathons and their geocoding backlog.",
+    )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        default=DEFAULT_JSON_OUTPUT_PATH,
+        help="JSON bootstrap file whose coordinates are patched along with the database.",
+    )
+    parser.add_argument(
+        "--skip-json",
+        action="store_true",
+        help="Only patch the database.",
+    )
+    parser.add_argument(
+        "--max-locations",
+        type=int,
+        default=0,
+        help="Stop after this many distinct places (0 means everything that is due).",
+    )
+    parser.add_argument(
+        "--deadline-seconds",
+        type=float,
+        default=float(os.getenv("HACKHUNT_GEOCODE_BACKLOG_DEADLINE_SECONDS", "0")),
+        help="Stop taking new places after this many seconds (0 means no limit).",
+    )
+    _add_geocode_cache_arguments(parser)
+    return parser.parse_args()
+
+
+def geocode_backlog_main() -> None:
+    args = _parse_backlog_args()
+    if not args.db_path.is_file():
+        raise SystemExit(f"No database at {args.db_path}; nothing to geocode")
+
+    geocode_cache = _geocode_cache(args)
+    # The governor holds lookups to the provider's published rate limit.
+    geocoder = LocationGeocoder(enabled=True, cache=geocode_cache, governor=HostGovernor())
+    if not geocoder.remote_available:
+        if geocode_cache is not None:
+            geocode_cache.close()
+        raise SystemExit("Remote geocoding is unavailable (disabled, or geopy is not installed)")
+
+    connection = sqlite3.connect(args.db_path)
+    try:
+        _ensure_schema(connection)
+        summary, placed = drain_backlog(
+            connection,
+            geocoder,
+            max_locations=args.max_locations if args.max_locations > 0 else None,
+            deadline=CrawlDeadline(args.deadline_seconds) if args.deadline_seconds > 0 else None,
+        )
+    finally:
+        connection.close()
+        if geocode_cache is not None:
+            geocode_cache.close()
+    patched_json = 0 if args.skip_json else patch_json_coordinates(args.json_output, placed)
+    print(json.dumps({"status": "ok", **summary, "patched_json": patched_json}))
+
+
 if __name__ == "__main__":
     main()
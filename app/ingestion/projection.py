@@ -0,0 +1,24 @@
+"""Trim decoded API items down to the fields their normalizer reads."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Mapping, Optional
+
+FieldProjection = Mapping[str, Optional["FieldProjection"]]
+
+
+def project_fields(value: Any, projection: FieldProjection) -> Any:
+    if isinstance(value, dict):
+        projected = {}
+        for field, nested in projection.items():
+            if field in value:
+                item = value[field]
+                projected[field] = item if nested is None else project_fields(item, nested)
+        return projected
+    if isinstance(value, list):
+        return [project_fields(item, projection) for item in value]
+    return value
+
+
+def project_items(items: Iterable[Any], projection: FieldProjection) -> List[Any]:
+    return [project_fields(item, projection) for item in items]
@@ -0,0 +1,141 @@
+"""Per-host request governor shared by every connector."""
+
+from __future__ import annotations
+
+import email.utils
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    requests_per_second: float
+    burst: int
+    max_in_flight: int
+
+
+DEFAULT_HOST_POLICY = HostPolicy(requests_per_second=2.0, burst=2, max_in_flight=2)
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    "devpost.com": HostPolicy(requests_per_second=4.0, burst=4, max_in_flight=4),
+    "api.unstop.com": HostPolicy(requests_per_second=2.0, burst=2, max_in_flight=2),
+    "devfolio.co": HostPolicy(requests_per_second=1.0, burst=1, max_in_flight=1),
+    "www.hackerearth.com": HostPolicy(requests_per_second=1.0, burst=1, max_in_flight=1),
+    "mlh.io": HostPolicy(requests_per_second=1.0, burst=2, max_in_flight=2),
+    # Nominatim's usage policy allows one request per second.
+    "nominatim.openstreetmap.org": HostPolicy(requests_per_second=1.0, burst=1, max_in_flight=1),
+}
+MIN_RATE_FRACTION = 0.125
+RECOVERY_FRACTION = 0.1
+DEFAULT_THROTTLE_PAUSE_SECONDS = 5.0
+MAX_THROTTLE_PAUSE_SECONDS = 120.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    if value is None:
+        return None
+    text = value.strip()
+    if not text:
+        return None
+    if text.isdigit():
+        return float(text)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    current_time = now or datetime.now(timezone.utc)
+    return max((retry_at - current_time).total_seconds(), 0.0)
+
+
+class _HostState:
+    def __init__(self, policy: HostPolicy, now: float) -> None:
+        self.policy = policy
+        self.rate = policy.requests_per_second
+        self.tokens = float(policy.burst)
+        self.updated_at = now
+        self.blocked_until = 0.0
+        self.in_flight = threading.BoundedSemaphore(max(1, policy.max_in_flight))
+
+    def refill(self, now: float) -> None:
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(float(self.policy.burst), self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+
+class HostGovernor:
+    def __init__(
+        self,
+        policies: Optional[Mapping[str, HostPolicy]] = None,
+        default_policy: HostPolicy = DEFAULT_HOST_POLICY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policies = dict(HOST_POLICIES if policies is None else policies)
+        self.default_policy = default_policy
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            policy = self.policies.get(host, self.default_policy)
+            state = _HostState(policy, self._clock())
+            self._hosts[host] = state
+        return state
+
+    def current_rate(self, host: str) -> float:
+        with self._lock:
+            return self._state(host).rate
+
+    def wait_for_token(self, host: str) -> None:
+        while True:
+            with self._lock:
+                state = self._state(host)
+                now = self._clock()
+                state.refill(now)
+                if now < state.blocked_until:
+                    delay = state.blocked_until - now
+                elif state.tokens >= 1.0:
+                    state.tokens -= 1.0
+                    return
+                else:
+                    delay = (1.0 - state.tokens) / state.rate
+            self._sleep(delay)
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        with self._lock:
+            in_flight = self._state(host).in_flight
+        with in_flight:
+            self.wait_for_token(host)
+            yield
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            state = self._state(host)
+            target = state.policy.requests_per_second
+            if state.rate < target:
+                state.rate = min(target, state.rate + target * RECOVERY_FRACTION)
+
+    def record_throttle(self, host: str, retry_after_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            state = self._state(host)
+            now = self._clock()
+            state.refill(now)
+            floor = state.policy.requests_per_second * MIN_RATE_FRACTION
+            state.rate = max(floor, state.rate / 2)
+            state.tokens = 0.0
+            pause = (
+                DEFAULT_THROTTLE_PAUSE_SECONDS
+                if retry_after_seconds is None
+                else retry_after_seconds
+            )
+            pause = min(max(pause, 0.0), MAX_THROTTLE_PAUSE_SECONDS)
+            state.blocked_until = max(state.blocked_until, now + pause)
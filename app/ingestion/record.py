@@ -0,0 +1,256 @@
+"""Slotted record type passed between the pipeline stages.
+
+A normalized hackathon used to be a 15-key dict. ``HackathonRecord`` keeps
+the same fields in ``__slots__`` and still reads like a mapping
+(``record["id"]``, ``record.get("latitude")``), so code written against dicts
+keeps working. Values that repeat across a crawl (platform, format, location,
+theme and prize lists) are interned, so thousands of records share one copy.
+The parsed start and final-submission datetimes are kept next to their ISO
+strings; the pipeline never has to parse them back. ``to_db_params()`` and
+``to_json()`` build the SQLite parameters and JSON object straight from the
+slots.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+FIELDS = (
+    "id",
+    "title",
+    "url",
+    "source_platform",
+    "format",
+    "location_text",
+    "latitude",
+    "longitude",
+    "start_date",
+    "final_submission_date",
+    "days_to_final",
+    "themes",
+    "organizer_past_events",
+    "prizes",
+    "created_at",
+)
+_FIELD_SET = frozenset(FIELDS)
+# ISO string field -> slot caching its parsed datetime.
+_PARSED_SLOTS = {"start_date": "_start_at", "final_submission_date": "_final_submission_at"}
+# Marks a datetime slot that has not been parsed yet (None means unparseable).
+_UNPARSED: Any = object()
+
+INTERN_POOL_SIZE = 4096
+_interned_lists: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def intern_text(value: Any) -> str:
+    return sys.intern(value if type(value) is str else str(value))
+
+
+def intern_list(values: Optional[Iterable[Any]]) -> Tuple[str, ...]:
+    """Shared tuple for a theme or prize list; equal lists map to one object."""
+    key = tuple(intern_text(value) for value in values or ())
+    shared = _interned_lists.get(key)
+    if shared is not None:
+        return shared
+    if len(_interned_lists) < INTERN_POOL_SIZE:
+        _interned_lists[key] = key
+    return key
+
+
+@lru_cache(maxsize=INTERN_POOL_SIZE)
+def _encode_list(values: Tuple[str, ...]) -> str:
+    return json.dumps(list(values))
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class HackathonRecord(Mapping):
+    __slots__ = FIELDS + tuple(_PARSED_SLOTS.values())
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        url: str,
+        source_platform: str,
+        format: str,
+        location_text: str,
+        start_date: str,
+        final_submission_date: str,
+        days_to_final: int,
+        created_at: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        themes: Iterable[str] = (),
+        organizer_past_events: int = 0,
+        prizes: Iterable[str] = (),
+        start_at: Optional[datetime] = None,
+        final_submission_at: Optional[datetime] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.url = url
+        self.source_platform = intern_text(source_platform)
+        self.format = intern_text(format)
+        self.location_text = intern_text(location_text)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.start_date = start_date
+        self.final_submission_date = final_submission_date
+        self.days_to_final = days_to_final
+        self.themes = intern_list(themes)
+        self.organizer_past_events = organizer_past_events
+        self.prizes = intern_list(prizes)
+        self.created_at = created_at
+        self._start_at = _UNPARSED if start_at is None else start_at
+        self._final_submission_at = (
+            _UNPARSED if final_submission_at is None else final_submission_at
+        )
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> "HackathonRecord":
+        return cls(
+            id=values["id"],
+            title=values["title"],
+            url=values["url"],
+            source_platform=values["source_platform"],
+            format=values["format"],
+            location_text=values["location_text"],
+            start_date=values["start_date"],
+            final_submission_date=values["final_submission_date"],
+            days_to_final=values["days_to_final"],
+            created_at=values["created_at"],
+            latitude=values.get("latitude"),
+            longitude=values.get("longitude"),
+            themes=values.get("themes") or (),
+            organizer_past_events=values.get("organizer_past_events") or 0,
+            prizes=values.get("prizes") or (),
+        )
+
+    @classmethod
+    def coerce(cls, value: Mapping[str, Any]) -> "HackathonRecord":
+        return value if isinstance(value, cls) else cls.from_mapping(value)
+
+    @property
+    def start_at(self) -> Optional[datetime]:
+        if self._start_at is _UNPARSED:
+            self._start_at = _parse_iso(self.start_date)
+        return self._start_at
+
+    @property
+    def final_submission_at(self) -> Optional[datetime]:
+        """Parsed ``final_submission_date``; ``None`` when it is unparseable."""
+        if self._final_submission_at is _UNPARSED:
+            self._final_submission_at = _parse_iso(self.final_submission_date)
+        return self._final_submission_at
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        if key in ("themes", "prizes"):
+            value = intern_list(value)
+        setattr(self, key, value)
+        parsed_slot = _PARSED_SLOTS.get(key)
+        if parsed_slot is not None:
+            setattr(self, parsed_slot, _UNPARSED)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HackathonRecord):
+            return self.values_tuple() == other.values_tuple()
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"HackathonRecord(id={self.id!r}, title={self.title!r})"
+
+    def values_tuple(self) -> Tuple[Any, ...]:
+        return (
+            self.id,
+            self.title,
+            self.url,
+            self.source_platform,
+            self.format,
+            self.location_text,
+            self.latitude,
+            self.longitude,
+            self.start_date,
+            self.final_submission_date,
+            self.days_to_final,
+            self.themes,
+            self.organizer_past_events,
+            self.prizes,
+            self.created_at,
+        )
+
+    def to_db_params(self) -> Tuple[Any, ...]:
+        """Positional parameters in ``FIELDS`` order for the hackathons upsert."""
+        return (
+            self.id,
+            self.title,
+            self.url,
+            self.source_platform,
+            self.format,
+            self.location_text,
+            self.latitude,
+            self.longitude,
+            self.start_date,
+            self.final_submission_date,
+            int(self.days_to_final),
+            _encode_list(self.themes),
+            int(self.organizer_past_events),
+            _encode_list(self.prizes),
+            self.created_at,
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """The camelCase object written to the JSON output."""
+        latitude = self.latitude
+        longitude = self.longitude
+        return {
+            "id": self.id,
+            "title": self.title,
+            "url": self.url,
+            "sourcePlatform": self.source_platform,
+            "format": self.format,
+            "locationText": self.location_text,
+            "coordinates": (
+                {"lat": latitude, "lng": longitude}
+                if latitude is not None and longitude is not None
+                else None
+            ),
+            "startDate": self.start_date,
+            "finalSubmissionDate": self.final_submission_date,
+            "daysToFinal": self.days_to_final,
+            "themes": self.themes,
+            "organizerPastEvents": self.organizer_past_events,
+            "prizes": self.prizes,
+            "createdAt": self.created_at,
+        }
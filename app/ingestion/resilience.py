@@ -0,0 +1,209 @@
+"""Shared retry, circuit-breaker and failure-budget policy for connectors."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE_SECONDS = 1.0
+DEFAULT_BACKOFF_CAP_SECONDS = 20.0
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 3
+DEFAULT_BREAKER_COOLDOWN_SECONDS = 60.0
+DEFAULT_BREAKER_TRIAL_WAIT_SECONDS = 60.0
+DEFAULT_SOURCE_FAILURE_BUDGET = 6
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, host: str, retry_in_seconds: float) -> None:
+        super().__init__(
+            f"Circuit open for {host}; retry in {max(retry_in_seconds, 0.0):.0f}s"
+        )
+        self.host = host
+        self.retry_in_seconds = retry_in_seconds
+
+
+class CircuitTrialPending(Exception):
+    def __init__(self, host: str) -> None:
+        super().__init__(f"Trial request to {host} is still in flight")
+        self.host = host
+
+
+class FailureBudgetExceeded(Exception):
+    def __init__(self, source: str, failures: int) -> None:
+        super().__init__(f"{source} exhausted its failure budget after {failures} failures")
+        self.source = source
+        self.failures = failures
+
+
+# Errors that mean the whole source should be abandoned rather than the page.
+SOURCE_FATAL_ERRORS = (CircuitOpenError, FailureBudgetExceeded)
+
+
+def is_retryable(exc: Exception) -> bool:
+    # HTTP errors carry a status; client errors other than throttling will not
+    # go away by asking again. Everything else (timeouts, resets) is transient.
+    status = getattr(exc, "status", None)
+    if isinstance(status, int):
+        return status >= 500 or status == 429
+    return not isinstance(exc, SOURCE_FATAL_ERRORS)
+
+
+def backoff_delay(
+    attempt: int,
+    base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS,
+    cap_seconds: float = DEFAULT_BACKOFF_CAP_SECONDS,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    ceiling = min(cap_seconds, base_seconds * (2 ** max(attempt - 1, 0)))
+    return ceiling * rng()
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        trial_wait_seconds: float = DEFAULT_BREAKER_TRIAL_WAIT_SECONDS,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.trial_wait_seconds = trial_wait_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_trial = False
+        self._lock = threading.Lock()
+        self._trial_done = threading.Condition(self._lock)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at >= self.cooldown_seconds:
+                return "half-open"
+            return "open"
+
+    def before_call(self, host: str) -> None:
+        give_up_at = time.monotonic() + self.trial_wait_seconds
+        with self._lock:
+            while True:
+                if self._opened_at is None:
+                    return
+                waited = self._clock() - self._opened_at
+                if waited < self.cooldown_seconds:
+                    raise CircuitOpenError(host, self.cooldown_seconds - waited)
+                # Half-open: let exactly one trial request through.
+                if not self._half_open_trial:
+                    self._half_open_trial = True
+                    return
+                # Concurrent callers go ahead once the trial succeeds and see
+                # the circuit open again if it fails. A trial that outlasts the
+                # wait fails only this call, not the whole source.
+                remaining = give_up_at - time.monotonic()
+                if remaining <= 0:
+                    raise CircuitTrialPending(host)
+                self._trial_done.wait(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open_trial = False
+            self._trial_done.notify_all()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._half_open_trial or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._half_open_trial = False
+            self._trial_done.notify_all()
+
+
+class FailureBudget:
+    def __init__(self, source: str, max_failures: int = DEFAULT_SOURCE_FAILURE_BUDGET) -> None:
+        self.source = source
+        self.max_failures = max(1, max_failures)
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        with self._lock:
+            return self.failures >= self.max_failures
+
+    def check(self) -> None:
+        if self.exhausted:
+            raise FailureBudgetExceeded(self.source, self.failures)
+
+    def charge(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[host] = breaker
+        return breaker
+
+
+def reset_breakers() -> None:
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def call_with_retries(
+    operation: Callable[[], T],
+    host: str,
+    description: str,
+    budget: Optional[FailureBudget] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    breaker: Optional[CircuitBreaker] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    circuit = breaker or get_breaker(host)
+    last_error: Optional[Exception] = None
+    for attempt in range(1, max_attempts + 1):
+        if budget is not None:
+            budget.check()
+        circuit.before_call(host)
+        try:
+            result = operation()
+        except Exception as exc:
+            last_error = exc
+            retryable = is_retryable(exc)
+            if retryable:
+                circuit.record_failure()
+            else:
+                circuit.record_success()
+            if budget is not None:
+                budget.charge()
+            logger.warning(
+                "%s attempt %d/%d failed: %s", description, attempt, max_attempts, exc
+            )
+            if not retryable:
+                raise
+            if attempt < max_attempts:
+                sleep(backoff_delay(attempt))
+            continue
+        circuit.record_success()
+        return result
+
+    raise last_error if last_error is not None else RuntimeError(description)
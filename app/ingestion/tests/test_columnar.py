@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from app.ingestion.columnar import NUMPY_AVAILABLE, compile_columnar_normalizer
+from app.ingestion.normalizer_spec import compile_normalizer
+from app.ingestion.transformers import SOURCE_SPECS, normalize_batch
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+RECORDS = {
+    "devpost": [
+        {"id": 1, "title": "A", "submission_period_dates": "Feb 27 - Mar 01, 2026"},
+        {"id": 2, "title": "B", "submission_period_dates": "Feb 01 - 20, 2026"},
+        {"id": 3, "title": "C", "submission_period_dates": "TBA"},
+    ],
+    "devfolio": [
+        {
+            "uuid": "open",
+            "settings": {"reg_starts_at": "2026-02-20T10:00:00Z", "reg_ends_at": "2026-03-05"},
+            "ends_at": "2026-03-10T18:30:00+05:30",
+        },
+        {"uuid": "fallback", "starts_at": "2026-02-28 09:15:00", "ends_at": "2026-03-02"},
+        {
+            "uuid": "closed",
+            "settings": {"reg_starts_at": "2026-02-01", "reg_ends_at": "2026-02-10"},
+            "ends_at": "2026-03-10",
+        },
+        {"uuid": "", "starts_at": "2026-02-28", "ends_at": "2026-03-02"},
+        {"uuid": "undated", "ends_at": "not a date"},
+    ],
+    "unstop": [
+        {
+            "id": 10,
+            "updated_at": "2026-02-25T10:00:00.250000+05:30",
+            "end_date": "2026-03-20T11:00:00+05:30",
+            "organisation": {"name": "NFSU"},
+            "regnRequirements": {"start_regn_dt": "2026-02-24T00:00:00+05:30"},
+        },
+        {"id": 11, "approved_date": "2026-02-20", "regnRequirements": {"end_regn_dt": "2026-03-15"}},
+        {"id": 12, "updated_at": "2026-02-20", "end_date": "2026-03-20", "organisation": {"name": "nfsu"}},
+    ],
+    "mlh": [
+        {"id": "m1", "starts_at": "2026-03-02T10:00:00Z", "ends_at": "2026-03-03T10:00:00Z"},
+        {"id": "m2", "starts_at": "2026-02-02T10:00:00Z", "ends_at": "2026-02-03T10:00:00Z"},
+    ],
+    "hackerearth": [
+        {"id": "h1", "organizer": "Acme", "start_unix": 1772000000, "final_submission_unix": "1773000000"},
+        {"id": "h2", "start_unix": 1773000000, "final_submission_unix": 1772500000},
+        {"id": "h3", "start_unix": "soon", "final_submission_unix": 1773000000},
+    ],
+}
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy is not installed")
+class ColumnarNormalizerTests(unittest.TestCase):
+    def test_matches_row_normalizer_for_every_source(self) -> None:
+        for source, spec in SOURCE_SPECS.items():
+            with self.subTest(source=source):
+                records = RECORDS[source]
+                expected = compile_normalizer(spec)(records, now=NOW)
+
+                self.assertTrue(expected)
+                self.assertEqual(compile_columnar_normalizer(spec)(records, now=NOW), expected)
+                self.assertEqual(normalize_batch(source, records, now=NOW), expected)
+
+    def test_handles_empty_batch(self) -> None:
+        self.assertEqual(normalize_batch("unstop", [], now=NOW), [])
+
+
+class NormalizeBatchFallbackTests(unittest.TestCase):
+    def test_uses_row_normalizer_without_numpy(self) -> None:
+        with patch("app.ingestion.transformers._COLUMNAR_NORMALIZERS", {}):
+            normalized = normalize_batch("mlh", RECORDS["mlh"], now=NOW)
+
+        self.assertEqual([record["id"] for record in normalized], ["mlh-m1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
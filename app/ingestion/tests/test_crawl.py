@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from app.ingestion.connectors.unstop import fetch_unstop_hackathons
+from app.ingestion.crawl import CrawlCheckpoint, CrawlDeadline, SourceCrawl
+
+
+def _unstop_page(page: int, last_page: int = 4) -> dict:
+    return {"data": {"data": [{"id": page}], "last_page": last_page}}
+
+
+class CrawlCheckpointTests(unittest.TestCase):
+    def test_round_trips_pages_through_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint = CrawlCheckpoint(Path(temp_dir), "devpost")
+            checkpoint.save_page("online:1", {"hackathons": [{"id": 1}]})
+            checkpoint.save_page("online:2", {"hackathons": [{"id": 2}]})
+
+            reloaded = CrawlCheckpoint(Path(temp_dir), "devpost")
+            loaded = reloaded.load(datetime.now(timezone.utc))
+
+            self.assertEqual(loaded, 2)
+            self.assertEqual(reloaded.resumed_page("online:2"), {"hackathons": [{"id": 2}]})
+            self.assertIsNone(reloaded.resumed_page("online:3"))
+
+    def test_discards_stale_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint = CrawlCheckpoint(Path(temp_dir), "unstop")
+            checkpoint.save_page("1:50", _unstop_page(1))
+
+            reloaded = CrawlCheckpoint(Path(temp_dir), "unstop")
+            loaded = reloaded.load(
+                datetime.now(timezone.utc) + timedelta(days=2), max_age_hours=12
+            )
+
+            self.assertEqual(loaded, 0)
+            self.assertFalse(reloaded.directory.exists())
+
+    def test_finish_keeps_checkpoint_only_for_resumable_stops(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            interrupted = SourceCrawl(
+                "unstop", checkpoint=CrawlCheckpoint(Path(temp_dir), "unstop")
+            )
+            interrupted.checkpoint_page("1:50", _unstop_page(1))
+            interrupted.mark_partial("deadline reached")
+            interrupted.finish_checkpoint()
+
+            stopped = SourceCrawl(
+                "devpost", checkpoint=CrawlCheckpoint(Path(temp_dir), "devpost")
+            )
+            stopped.checkpoint_page("online:1", {"hackathons": []})
+            stopped.mark_partial("incremental stop at online page 1", resumable=False)
+            stopped.finish_checkpoint()
+
+            self.assertTrue((Path(temp_dir) / "unstop").exists())
+            self.assertFalse((Path(temp_dir) / "devpost").exists())
+
+    def test_resumed_unstop_crawl_only_fetches_missing_pages(self) -> None:
+        now = [0.0]
+
+        def fake_fetch_page(page, per_page, timeout_seconds, budget=None):
+            now[0] += 10.0
+            return _unstop_page(page)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = SourceCrawl(
+                "unstop",
+                deadline=CrawlDeadline(15.0, clock=lambda: now[0]),
+                checkpoint=CrawlCheckpoint(Path(temp_dir), "unstop"),
+            )
+            with patch(
+                "app.ingestion.connectors.unstop._fetch_page",
+                side_effect=fake_fetch_page,
+            ):
+                first_records = fetch_unstop_hackathons(max_pages=0, crawl=first)
+            first.finish_checkpoint()
+
+            checkpoint = CrawlCheckpoint(Path(temp_dir), "unstop")
+            checkpoint.load(datetime.now(timezone.utc))
+            second = SourceCrawl("unstop", checkpoint=checkpoint)
+            with patch(
+                "app.ingestion.connectors.unstop._fetch_page",
+                side_effect=fake_fetch_page,
+            ) as mock_fetch_page:
+                second_records = fetch_unstop_hackathons(max_pages=0, crawl=second)
+            second.finish_checkpoint()
+
+            self.assertEqual([record["id"] for record in first_records], [1, 2])
+            self.assertFalse(first.complete)
+            self.assertEqual([record["id"] for record in second_records], [1, 2, 3, 4])
+            self.assertEqual(
+                [call.kwargs["page"] for call in mock_fetch_page.call_args_list], [3, 4]
+            )
+            self.assertTrue(second.complete)
+            self.assertFalse((Path(temp_dir) / "unstop").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
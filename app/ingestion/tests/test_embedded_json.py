@@ -0,0 +1,53 @@
+import unittest
+
+from app.ingestion.embedded_json import (
+    ATTRIBUTE_END,
+    DATA_PAGE_START,
+    NEXT_DATA_START,
+    SCRIPT_END,
+    EmbeddedSliceScanner,
+    find_embedded_slice,
+    scan_embedded_slice,
+)
+
+
+def _chunked(data: bytes, size: int):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+class EmbeddedSliceTests(unittest.TestCase):
+    def test_finds_markers_split_across_chunks(self) -> None:
+        page = b"<html>" + b"x" * 300 + NEXT_DATA_START + b'{"a": "</scrip"}' + SCRIPT_END + b"tail"
+
+        for size in (1, 3, 7, 64, len(page)):
+            with self.subTest(size=size):
+                value = scan_embedded_slice(_chunked(page, size), NEXT_DATA_START, SCRIPT_END)
+                self.assertEqual(value, b'{"a": "</scrip"}')
+
+    def test_reports_done_before_rest_of_page(self) -> None:
+        scanner = EmbeddedSliceScanner(DATA_PAGE_START, ATTRIBUTE_END)
+
+        self.assertFalse(scanner.feed(b'<div id="app" data-page="{&quot;props'))
+        self.assertTrue(scanner.feed(b'&quot;: {}}"></div>'))
+        self.assertEqual(scanner.value, b"{&quot;props&quot;: {}}")
+        self.assertTrue(scanner.feed(b"ignored"))
+
+    def test_returns_none_when_slice_never_closes(self) -> None:
+        self.assertIsNone(scan_embedded_slice([b"<html>no data</html>"], NEXT_DATA_START, SCRIPT_END))
+        self.assertIsNone(
+            scan_embedded_slice([NEXT_DATA_START + b'{"open": true'], NEXT_DATA_START, SCRIPT_END)
+        )
+
+    def test_find_embedded_slice_matches_scanner(self) -> None:
+        page = '<p>é</p><div data-page="{&quot;x&quot;: 1}">'
+
+        self.assertEqual(find_embedded_slice(page, DATA_PAGE_START, ATTRIBUTE_END), "{&quot;x&quot;: 1}")
+        self.assertEqual(
+            scan_embedded_slice(_chunked(page.encode("utf-8"), 5), DATA_PAGE_START, ATTRIBUTE_END),
+            b"{&quot;x&quot;: 1}",
+        )
+        self.assertIsNone(find_embedded_slice(page, NEXT_DATA_START, SCRIPT_END))
+
+
+if __name__ == "__main__":
+    unittest.main()
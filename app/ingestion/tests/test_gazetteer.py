@@ -0,0 +1,125 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from app.ingestion.gazetteer import (
+    Gazetteer,
+    read_admin1_codes,
+    read_country_info,
+    read_geonames_cities,
+    write_gazetteer,
+)
+from app.ingestion.geocoding import LocationGeocoder, load_gazetteer
+
+
+def _city(geonameid: int, name: str, ascii_name: str, alternates: str, lat: float, lng: float,
+          country: str, admin1: str, population: int) -> str:
+    return "\t".join(
+        [str(geonameid), name, ascii_name, alternates, str(lat), str(lng), "P", "PPL", country, "",
+         admin1, "", "", "", str(population), "", "0", "UTC", "2024-01-01"]
+    )
+
+
+CITIES = [
+    _city(1, "Paris", "Paris", "Lutece,Parigi", 48.85341, 2.3488, "FR", "11", 2138551),
+    _city(2, "Paris", "Paris", "", 33.66094, -95.55551, "US", "TX", 24782),
+    _city(3, "Bengaluru", "Bengaluru", "Bangalore,BLR,ಬೆಂಗಳೂರು", 12.97194, 77.59369, "IN", "19", 8443675),
+    _city(4, "Urbana", "Urbana", "", 40.11059, -88.20727, "US", "IL", 42014),
+    _city(5, "Urbana", "Urbana", "", 40.10839, -83.75243, "US", "OH", 11513),
+    _city(6, "Zürich", "Zurich", "", 47.36667, 8.55, "CH", "ZH", 341730),
+    _city(8, "London", "London", "", 51.50853, -0.12574, "GB", "ENG", 8961989),
+    _city(9, "London", "London", "", 42.98339, -81.23304, "CA", "08", 346765),
+    "7\tLake Nowhere\tLake Nowhere\t\t1.0\t2.0\tH\tLK\tUS\t\tTX\t\t\t\t0\t\t0\tUTC\t2024-01-01",
+]
+ADMIN1 = [
+    "FR.11\tÎle-de-France\tIle-de-France\t3012874",
+    "US.TX\tTexas\tTexas\t4736286",
+    "US.IL\tIllinois\tIllinois\t4896861",
+    "US.OH\tOhio\tOhio\t5165418",
+    "IN.19\tKarnataka\tKarnataka\t1267701",
+    "CH.ZH\tZurich\tZurich\t2657895",
+    "GB.ENG\tEngland\tEngland\t6269131",
+    "CA.08\tOntario\tOntario\t6093943",
+]
+COUNTRIES = [
+    "#ISO\tISO3\tISO-Numeric\tfips\tCountry",
+    "FR\tFRA\t250\tFR\tFrance",
+    "US\tUSA\t840\tUS\tUnited States",
+    "IN\tIND\t356\tIN\tIndia",
+    "CH\tCHE\t756\tSZ\tSwitzerland",
+    "GB\tGBR\t826\tUK\tUnited Kingdom",
+    "CA\tCAN\t124\tCA\tCanada",
+]
+
+
+class GazetteerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name) / "gazetteer.bin"
+        self.counts = write_gazetteer(
+            self.path,
+            read_geonames_cities(CITIES),
+            admin1_names=read_admin1_codes(ADMIN1),
+            country_names=read_country_info(COUNTRIES),
+        )
+        self.gazetteer = Gazetteer(self.path)
+
+    def tearDown(self) -> None:
+        self.gazetteer.close()
+        self._temp_dir.cleanup()
+
+    def test_indexes_populated_places_only(self) -> None:
+        self.assertEqual(self.counts["places"], 8)
+        self.assertIsNone(self.gazetteer.resolve("Lake Nowhere"))
+
+    def test_disambiguates_by_admin1_and_country(self) -> None:
+        self.assertEqual(self.gazetteer.resolve("Paris"), (48.8534, 2.3488))
+        self.assertEqual(self.gazetteer.resolve("Paris, Texas"), (33.6609, -95.5555))
+        self.assertEqual(self.gazetteer.resolve("Paris, TX, USA"), (33.6609, -95.5555))
+        self.assertEqual(self.gazetteer.resolve("Paris, France"), (48.8534, 2.3488))
+        self.assertEqual(self.gazetteer.resolve("Urbana, Ohio"), (40.1084, -83.7524))
+        self.assertEqual(self.gazetteer.resolve("Urbana, IL, United States"), (40.1106, -88.2073))
+
+    def test_matches_alternate_names_accents_and_venue_prefixes(self) -> None:
+        self.assertEqual(self.gazetteer.resolve("bangalore,  karnataka"), (12.9719, 77.5937))
+        self.assertEqual(self.gazetteer.resolve("ZURICH, Switzerland"), (47.3667, 8.55))
+        self.assertEqual(self.gazetteer.resolve("Zürich"), (47.3667, 8.55))
+        self.assertEqual(
+            self.gazetteer.resolve("Indian Institute of Science, Bengaluru, Karnataka, India"),
+            (12.9719, 77.5937),
+        )
+        # Airport codes and other scripts are not indexed as alternates.
+        self.assertIsNone(self.gazetteer.resolve("BLR"))
+
+    def test_rejects_names_whose_qualifiers_disagree(self) -> None:
+        self.assertIsNone(self.gazetteer.resolve("Paris, Ontario"))
+        self.assertIsNone(self.gazetteer.resolve("Karnataka, India"))
+        self.assertIsNone(self.gazetteer.resolve(""))
+
+    def test_rejects_files_that_are_not_an_index(self) -> None:
+        broken = Path(self._temp_dir.name) / "broken.bin"
+        broken.write_bytes(self.path.read_bytes()[:-5])
+        with self.assertRaises(ValueError):
+            Gazetteer(broken)
+        self.assertIsNone(load_gazetteer(broken))
+        short = Path(self._temp_dir.name) / "short.bin"
+        short.write_bytes(self.path.read_bytes()[:10])
+        self.assertIsNone(load_gazetteer(short))
+        self.assertIsNone(load_gazetteer(Path(self._temp_dir.name) / "missing.bin"))
+
+    def test_geocoder_resolves_locally_before_going_to_the_network(self) -> None:
+        geocoder = LocationGeocoder(enabled=True, gazetteer=self.gazetteer)
+        geocoder._nominatim = Mock()
+        self.assertEqual(geocoder.geocode("Urbana, Illinois"), (40.1106, -88.2073))
+        self.assertEqual(geocoder.geocode("Bengaluru, Karnataka"), (12.9719, 77.5937))
+        # The gazetteer answers before the city-name fallbacks, which only
+        # know one London.
+        self.assertEqual(geocoder.geocode("London, Ontario"), (42.9834, -81.233))
+        geocoder.gazetteer = None
+        self.assertEqual(geocoder.geocode("London, England"), (51.5074, -0.1278))
+        geocoder._nominatim.geocode.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import Mock, patch
+
+from app.ingestion.geocode_backlog import drain_backlog, patch_json_coordinates
+from app.ingestion.geocoding import LocationGeocoder
+from app.ingestion.pipeline import _ensure_schema, run_pipeline
+from app.ingestion.record import HackathonRecord
+
+FUTURE = "2099-03-01T00:00:00+00:00"
+
+
+def _records() -> List[HackathonRecord]:
+    def record(identifier: str, format_value: str, location_text: str) -> HackathonRecord:
+        return HackathonRecord.from_mapping(
+            {
+                "id": identifier,
+                "title": f"Event {identifier}",
+                "url": f"https://mlh.io/events/{identifier}",
+                "source_platform": "MLH",
+                "format": format_value,
+                "location_text": location_text,
+                "start_date": FUTURE,
+                "final_submission_date": FUTURE,
+                "days_to_final": 30,
+                "created_at": FUTURE,
+                "themes": [],
+                "prizes": ["Unspecified"],
+            }
+        )
+
+    return [
+        record("mlh-1", "Offline", "Lawrence, KS"),
+        record("mlh-2", "Offline", "Lawrence , Kansas"),
+        record("mlh-3", "Offline", "Pune, Maharashtra"),
+        record("mlh-4", "Online", "Global"),
+    ]
+
+
+def _geocoder(nominatim: Mock, enabled: bool = True) -> LocationGeocoder:
+    geocoder = LocationGeocoder(enabled=enabled, gazetteer=None)
+    geocoder.gazetteer = None
+    geocoder._nominatim = nominatim
+    return geocoder
+
+
+class GeocodeBacklogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._temp_dir.name) / "hackhunt.db"
+        self.json_path = Path(self._temp_dir.name) / "ingested.json"
+        self.nominatim = Mock()
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _run(self, defer_geocoding: bool = True) -> dict:
+        with patch("app.ingestion.pipeline.ingest_all_sources", return_value=_records()), patch(
+            "app.ingestion.pipeline.LocationGeocoder",
+            side_effect=lambda **kwargs: _geocoder(self.nominatim, kwargs["enabled"]),
+        ):
+            return run_pipeline(
+                max_pages=1,
+                db_path=self.db_path,
+                json_output_path=self.json_path,
+                geocode=True,
+                sources=["mlh"],
+                mlh_season_year=None,
+                defer_geocoding=defer_geocoding,
+            )
+
+    def _coordinates(self) -> dict:
+        return {
+            record["id"]: record["coordinates"]
+            for record in json.loads(self.json_path.read_text(encoding="utf-8"))
+        }
+
+    def _drain(self, nominatim: Mock, later: timedelta = timedelta()) -> tuple:
+        connection = sqlite3.connect(self.db_path)
+        try:
+            return drain_backlog(connection, _geocoder(nominatim), now=datetime.now(timezone.utc) + later)
+        finally:
+            connection.close()
+
+    def test_publishes_first_and_patches_coordinates_later(self) -> None:
+        summary = self._run()
+        self.nominatim.geocode.assert_not_called()
+        self.assertEqual(summary["queued_geocodes"], 2)
+        self.assertEqual(
+            self._coordinates(),
+            {"mlh-1": None, "mlh-2": None, "mlh-3": {"lat": 18.5204, "lng": 73.8567}, "mlh-4": None},
+        )
+
+        worker = Mock()
+        worker.geocode.return_value = SimpleNamespace(latitude=38.97, longitude=-95.24)
+        counts, placed = self._drain(worker)
+        # Both spellings of Lawrence cost a single lookup.
+        worker.geocode.assert_called_once_with("Lawrence, KS", timeout=10)
+        self.assertEqual((counts["locations"], counts["placed"], counts["remaining"]), (1, 2, 0))
+        self.assertEqual(patch_json_coordinates(self.json_path, placed), 2)
+        self.assertEqual(self._coordinates()["mlh-2"], {"lat": 38.97, "lng": -95.24})
+
+        # A later run that again cannot place them keeps what the worker found.
+        summary = self._run()
+        self.assertEqual(summary["queued_geocodes"], 0)
+        self.assertEqual(self._coordinates()["mlh-1"], {"lat": 38.97, "lng": -95.24})
+
+    def test_retries_failed_lookups_with_backoff_and_drops_unknown_places(self) -> None:
+        self._run()
+        failing = Mock()
+        failing.geocode.side_effect = TimeoutError("rate limited")
+        counts, placed = self._drain(failing)
+        self.assertEqual((counts["retried"], counts["remaining"], placed), (2, 2, {}))
+
+        counts, _ = self._drain(failing, later=timedelta(minutes=5))
+        self.assertEqual(counts["locations"], 0)
+
+        unknown = Mock()
+        unknown.geocode.return_value = None
+        counts, _ = self._drain(unknown, later=timedelta(hours=1))
+        self.assertEqual((counts["not_found"], counts["remaining"]), (2, 0))
+
+    def test_inline_geocoding_queues_only_lookups_that_failed(self) -> None:
+        self.nominatim.geocode.side_effect = TimeoutError("down")
+        summary = self._run(defer_geocoding=False)
+        self.assertEqual(summary["queued_geocodes"], 2)
+
+        connection = sqlite3.connect(self.db_path)
+        try:
+            _ensure_schema(connection)
+            queued = connection.execute("SELECT hackathon_id FROM geocode_backlog ORDER BY 1").fetchall()
+        finally:
+            connection.close()
+        self.assertEqual(queued, [("mlh-1",), ("mlh-2",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
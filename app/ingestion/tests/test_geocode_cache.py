@@ -0,0 +1,105 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from app.ingestion.geocode_cache import DAY_SECONDS, GeocodeCache
+from app.ingestion.geocoding import LocationGeocoder
+from app.ingestion.locations import canonical_location
+
+NOW = 1_780_000_000.0
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name) / "geocode_cache.db"
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _cache(self, **kwargs: object) -> GeocodeCache:
+        cache = GeocodeCache(self.path, **kwargs)  # type: ignore[arg-type]
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_writes_back_in_batches_and_persists(self) -> None:
+        writer = self._cache(batch_size=2)
+        writer.store("Pune,  Maharashtra", (18.52, 73.85))
+        self.assertIsNone(self._cache().lookup("Pune, Maharashtra"))
+
+        writer.store("Nowhere Town", None)
+        reader = self._cache()
+        self.assertEqual(reader.lookup("pune, maharashtra").coordinates, (18.52, 73.85))
+        self.assertIsNone(reader.lookup("NOWHERE town").coordinates)
+        self.assertIsNone(reader.lookup("Atlantis"))
+
+        writer.store("Urbana, IL", (40.11, -88.21))
+        self.assertIsNone(self._cache().lookup("Urbana, IL"))
+        writer.close()
+        self.assertEqual(self._cache().lookup("Urbana, IL").coordinates, (40.11, -88.21))
+
+    def test_negative_answers_expire_before_found_coordinates(self) -> None:
+        with patch("app.ingestion.geocode_cache.time.time", return_value=NOW):
+            cache = self._cache(positive_ttl_seconds=30 * DAY_SECONDS, negative_ttl_seconds=DAY_SECONDS)
+            cache.store("Pune", (18.52, 73.85))
+            cache.store("Nowhere Town", None)
+            cache.flush()
+
+        with patch("app.ingestion.geocode_cache.time.time", return_value=NOW + 2 * DAY_SECONDS):
+            self.assertIsNotNone(cache.lookup("Pune"))
+            self.assertIsNone(cache.lookup("Nowhere Town"))
+            self.assertIsNone(self._cache(negative_ttl_seconds=DAY_SECONDS).lookup("Nowhere Town"))
+
+        with patch("app.ingestion.geocode_cache.time.time", return_value=NOW + 31 * DAY_SECONDS):
+            self.assertIsNone(cache.lookup("Pune"))
+
+    def test_concurrent_writers_keep_the_newest_answer(self) -> None:
+        first = self._cache()
+        second = self._cache()
+        with patch("app.ingestion.geocode_cache.time.time", return_value=NOW):
+            first.store("Pune", None)
+        with patch("app.ingestion.geocode_cache.time.time", return_value=NOW + 60):
+            second.store("Pune", (18.52, 73.85))
+            second.flush()
+            first.flush()
+            self.assertEqual(self._cache().lookup("Pune").coordinates, (18.52, 73.85))
+
+
+class GeocoderCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache = GeocodeCache(Path(self._temp_dir.name) / "geocode_cache.db")
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self._temp_dir.cleanup()
+
+    def _geocoder(self, nominatim: Mock) -> LocationGeocoder:
+        geocoder = LocationGeocoder(enabled=True, cache=self.cache)
+        geocoder._nominatim = nominatim
+        return geocoder
+
+    def test_reuses_answers_from_earlier_runs(self) -> None:
+        nominatim = Mock()
+        nominatim.geocode.side_effect = [SimpleNamespace(latitude="40.11", longitude="-88.21"), None]
+        first_run = self._geocoder(nominatim)
+        self.assertEqual(first_run.geocode("Urbana, IL"), (40.11, -88.21))
+        self.assertIsNone(first_run.geocode("Nowhere Town"))
+
+        second_run = self._geocoder(Mock())
+        second_run.enabled = False
+        self.assertEqual(second_run.geocode("Urbana,  IL"), (40.11, -88.21))
+        self.assertIsNone(second_run.geocode("Nowhere Town"))
+        self.assertEqual(nominatim.geocode.call_count, 2)
+
+    def test_does_not_persist_lookup_errors(self) -> None:
+        nominatim = Mock()
+        nominatim.geocode.side_effect = TimeoutError("rate limited")
+        self.assertIsNone(self._geocoder(nominatim).geocode("Urbana, IL"))
+        self.assertIsNone(self.cache.lookup(canonical_location("Urbana, IL")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from app.ingestion.html_text import contains_any, iter_text_runs
+from app.ingestion.keywords import KeywordMatcher
+from app.ingestion.transformers import _derive_unstop_format
+
+IN_PERSON = KeywordMatcher({"offline": True, "in-person": True})
+OFFLINE = KeywordMatcher({"offline": True})
+
+class HtmlTextTests(unittest.TestCase):
+    def test_splits_text_on_tags_like_the_old_regex(self) -> None:
+        self.assertEqual(list(iter_text_runs("<p>Hi <b>there</b></p>")), ["", "Hi ", "there", "", ""])
+        # "<>" and a trailing "<" without ">" are text, not tags.
+        self.assertEqual(list(iter_text_runs("a<>b<c")), ["a<>b<c"])
+
+    def test_contains_any_stops_at_first_match_and_ignores_markup(self) -> None:
+        self.assertTrue(contains_any("<p>Finals are <b>IN-PERSON</b></p>", IN_PERSON))
+        self.assertFalse(contains_any("<span class='offline'>Remote</span>", OFFLINE))
+        # A tag reads as a space, so it breaks a word apart.
+        self.assertFalse(contains_any("off<b>line</b>", OFFLINE))
+
+    def test_unstop_format_reads_details_only_for_online_listings(self) -> None:
+        details = "<p>Round 2 is an <b>offline</b> event</p>"
+        self.assertEqual(_derive_unstop_format({"region": "online", "details": details}), "Hybrid")
+        self.assertEqual(_derive_unstop_format({"region": "online", "details": "<p>Remote</p>"}), "Online")
+        self.assertEqual(_derive_unstop_format({"region": "offline", "details": None}), "Offline")
+        self.assertEqual(_derive_unstop_format({"region": "", "details": "<i>campus</i>"}), "Offline")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.ingestion.http_cache import HttpCache, conditional_headers
+
+
+class HttpCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "http_cache.db"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_stores_body_with_validators(self) -> None:
+        cache = HttpCache(self.path)
+        try:
+            stored = cache.store(
+                "https://example.com/a",
+                {"etag": '"v1"', "last-modified": "Mon, 02 Mar 2026 10:00:00 GMT"},
+                b"<html>a</html>",
+            )
+            entry = cache.lookup("https://example.com/a")
+        finally:
+            cache.close()
+
+        self.assertTrue(stored)
+        assert entry is not None
+        self.assertEqual(entry.body, b"<html>a</html>")
+        self.assertEqual(
+            conditional_headers(entry),
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 02 Mar 2026 10:00:00 GMT",
+            },
+        )
+
+    def test_skips_responses_without_validators_or_marked_no_store(self) -> None:
+        cache = HttpCache(self.path)
+        try:
+            self.assertFalse(cache.store("https://example.com/a", {}, b"body"))
+            self.assertFalse(
+                cache.store(
+                    "https://example.com/b",
+                    {"etag": '"v1"', "cache-control": "private, no-store"},
+                    b"body",
+                )
+            )
+            self.assertIsNone(cache.lookup("https://example.com/a"))
+        finally:
+            cache.close()
+
+    def test_evicts_least_recently_used_entries_over_size_cap(self) -> None:
+        cache = HttpCache(self.path)
+        try:
+            cache.store("https://example.com/a", {"etag": "a"}, b"a" * 10)
+            entry_size = cache.total_bytes()
+            cache.max_bytes = entry_size * 2
+            cache.store("https://example.com/b", {"etag": "b"}, b"b" * 10)
+            cache.lookup("https://example.com/a")
+            cache.store("https://example.com/c", {"etag": "c"}, b"c" * 10)
+
+            self.assertIsNotNone(cache.lookup("https://example.com/a"))
+            self.assertIsNone(cache.lookup("https://example.com/b"))
+            self.assertIsNotNone(cache.lookup("https://example.com/c"))
+        finally:
+            cache.close()
+
+    def test_persists_across_instances(self) -> None:
+        first = HttpCache(self.path)
+        first.store("https://example.com/a", {"etag": "a"}, b"persisted")
+        first.close()
+
+        second = HttpCache(self.path)
+        try:
+            entry = second.lookup("https://example.com/a")
+        finally:
+            second.close()
+
+        assert entry is not None
+        self.assertEqual(entry.body, b"persisted")
+
+
+if __name__ == "__main__":
+    unittest.main()
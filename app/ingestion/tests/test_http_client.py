@@ -0,0 +1,190 @@
+import asyncio
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from app.ingestion.embedded_json import NEXT_DATA_START, SCRIPT_END
+from app.ingestion.http_cache import HttpCache
+from app.ingestion.http_client import HttpClient, HttpError, decode_content, run_blocking
+from app.ingestion.rate_limit import HostGovernor
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        return
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        self.server.seen_headers.append(dict(self.headers))
+        if self.path == "/embedded":
+            if self.headers.get("If-None-Match") == '"e1"':
+                self._send(304, headers={"ETag": '"e1"'})
+            else:
+                self._send(
+                    200, self.server.embedded_body, {"Content-Encoding": "gzip", "ETag": '"e1"'}
+                )
+        elif self.path == "/json":
+            body = gzip.compress(json.dumps({"hello": "world" * 50}).encode("utf-8"))
+            self._send(200, body, {"Content-Encoding": "gzip"})
+        elif self.path == "/page":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304, headers={"ETag": '"v1"'})
+            else:
+                self._send(200, b"<html>page</html>", {"ETag": '"v1"'})
+        elif self.path == "/busy":
+            self._send(429, b"slow down", {"Retry-After": "7"})
+        elif self.path == "/moved":
+            self._send(302, headers={"Location": "/json"})
+        else:
+            self._send(404, b"missing")
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # A client that stops reading a streamed body resets the connection.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class HttpClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = _Server(("127.0.0.1", 0), _Handler)
+        self.server.seen_headers = []
+        self.server.embedded_body = gzip.compress(
+            b"<html><body>"
+            + NEXT_DATA_START
+            + b'{"props": {"page": 1}}'
+            + SCRIPT_END
+            + os.urandom(1024 * 1024).hex().encode("ascii")
+            + b"</body></html>"
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = HttpClient(timeout_seconds=5)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_decodes_gzip_and_reuses_connection(self) -> None:
+        first = self.client.get_json(f"{self.base_url}/json")
+        second = self.client.get_json(f"{self.base_url}/json")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["hello"], "world" * 50)
+        stats = self.client.stats.host("127.0.0.1")
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.connections_opened, 1)
+        self.assertLess(stats.wire_bytes, stats.decoded_bytes)
+        self.assertEqual(self.server.seen_headers[0]["Accept-Encoding"], "gzip, deflate")
+        self.assertTrue(self.server.seen_headers[0]["User-Agent"].startswith("HackHuntBot"))
+
+    def test_follows_redirects(self) -> None:
+        response = self.client.get(f"{self.base_url}/moved")
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.url.endswith("/json"))
+
+    def test_raises_http_error_for_non_success_status(self) -> None:
+        with self.assertRaises(HttpError) as context:
+            self.client.get(f"{self.base_url}/missing")
+
+        self.assertEqual(context.exception.status, 404)
+
+    def test_serves_not_modified_responses_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = HttpClient(
+                timeout_seconds=5, cache=HttpCache(Path(temp_dir) / "http_cache.db")
+            )
+            try:
+                first = client.get(f"{self.base_url}/page")
+                second = client.get(f"{self.base_url}/page")
+            finally:
+                client.close()
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.body, b"<html>page</html>")
+        self.assertEqual(self.server.seen_headers[1]["If-None-Match"], '"v1"')
+        self.assertEqual(client.stats.host("127.0.0.1").cache_hits, 1)
+
+    def test_reports_throttling_to_governor(self) -> None:
+        governor = HostGovernor()
+        client = HttpClient(timeout_seconds=5, governor=governor)
+        try:
+            with self.assertRaises(HttpError) as context:
+                client.get(f"{self.base_url}/busy")
+        finally:
+            client.close()
+
+        self.assertEqual(context.exception.status, 429)
+        self.assertEqual(context.exception.retry_after_seconds, 7.0)
+        self.assertLess(
+            governor.current_rate("127.0.0.1"),
+            governor.default_policy.requests_per_second,
+        )
+        self.assertEqual(client.stats.host("127.0.0.1").throttled, 1)
+
+    def test_decodes_raw_and_zlib_deflate(self) -> None:
+        payload = b"deflated body"
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_body = raw.compress(payload) + raw.flush()
+
+        self.assertEqual(decode_content(zlib.compress(payload), "deflate"), payload)
+        self.assertEqual(decode_content(raw_body, "deflate"), payload)
+
+    def test_streams_embedded_slice_and_stops_reading(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client = HttpClient(
+                timeout_seconds=5, cache=HttpCache(Path(temp_dir) / "http_cache.db")
+            )
+            try:
+                first = client.get_embedded(
+                    f"{self.base_url}/embedded", NEXT_DATA_START, SCRIPT_END
+                )
+                second = client.get_embedded(
+                    f"{self.base_url}/embedded", NEXT_DATA_START, SCRIPT_END
+                )
+            finally:
+                client.close()
+
+        self.assertEqual(json.loads(first), {"props": {"page": 1}})
+        self.assertEqual(second, first)
+        self.assertEqual(self.server.seen_headers[1]["If-None-Match"], '"e1"')
+        stats = client.stats.host("127.0.0.1")
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertLess(stats.wire_bytes, len(self.server.embedded_body) // 4)
+
+    def test_embedded_slice_is_none_without_marker(self) -> None:
+        value = self.client.get_embedded(f"{self.base_url}/page", NEXT_DATA_START, SCRIPT_END)
+
+        self.assertIsNone(value)
+
+    def test_run_blocking_keeps_blocking_calls_off_the_event_loop(self) -> None:
+        async def main():
+            return threading.get_ident(), await run_blocking(threading.get_ident)
+
+        loop_thread, call_thread = asyncio.run(main())
+        self.assertNotEqual(loop_thread, call_thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
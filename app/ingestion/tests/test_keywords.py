@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+
+from app.ingestion import keywords
+from app.ingestion.keywords import KeywordMatcher
+from app.ingestion.transformers import _derive_devpost_format, _derive_devpost_prize_categories
+
+
+def _both_strategies(mapping, whole_words=()):
+    scanned = KeywordMatcher(mapping, whole_words=whole_words)
+    with patch.object(keywords, "SCAN_THRESHOLD", 1):
+        compiled = KeywordMatcher(mapping, whole_words=whole_words)
+    return scanned, compiled
+
+
+class KeywordMatcherTests(unittest.TestCase):
+    def test_reports_overlapping_and_prefix_keywords_in_dictionary_order(self) -> None:
+        mapping = {"delhi ncr": 1, "new delhi": 2, "delhi": 3, "del": 4, "goa": 5}
+        for matcher in _both_strategies(mapping):
+            self.assertEqual(matcher.hits("hack in new delhi ncr"), ["delhi ncr", "new delhi", "delhi", "del"])
+            self.assertEqual(matcher.first("delhi, india"), 3)
+            self.assertEqual(matcher.first("new delhi"), 2)
+            self.assertIsNone(matcher.first("mumbai"))
+            self.assertTrue(matcher.any("goa"))
+            self.assertFalse(matcher.any(""))
+
+    def test_whole_word_keywords_need_word_boundaries(self) -> None:
+        mapping = {"job": "Job/Internship", "swag": "Swag", "merch": "Swag"}
+        for matcher in _both_strategies(mapping, whole_words=["job"]):
+            self.assertEqual(matcher.values("jobs fair with merch"), ["Swag"])
+            self.assertEqual(matcher.values("a job_ or a job! and swag"), ["Job/Internship", "Swag"])
+            self.assertEqual(matcher.hits("blowjobjob job"), ["job"])
+        with self.assertRaises(ValueError):
+            KeywordMatcher({"c++": 1}, whole_words=["c++"])
+
+    def test_devpost_derivations_keep_their_keyword_rules(self) -> None:
+        self.assertEqual(
+            _derive_devpost_prize_categories({"title": "Jobs & Merch Hack", "analytics_identifier": "internship"}),
+            ["Swag", "Job/Internship"],
+        )
+        self.assertEqual(_derive_devpost_prize_categories({"title": "Find a job", "analytics_identifier": ""}), ["Job/Internship"])
+        self.assertEqual(
+            _derive_devpost_format({"displayed_location": {"icon": "map-marker", "location": "Virtual"}}), "Online"
+        )
+        self.assertEqual(
+            _derive_devpost_format({"displayed_location": {"icon": "map-marker", "location": "Austin, TX"}}), "Offline"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from app.ingestion.geocoding import LocationGeocoder
+from app.ingestion.locations import canonical_location
+
+
+class CanonicalLocationTests(unittest.TestCase):
+    def test_folds_spelling_variants_of_one_place(self) -> None:
+        for text in ("Lawrence , Kansas", "Lawrence, KS", "LAWRENCE, Kansas, U.S.A.", "lawrence; ks 66045"):
+            self.assertEqual(canonical_location(text), "lawrence, kansas, united states")
+        self.assertEqual(canonical_location("Waterloo, ON, Canada"), canonical_location("Waterloo, Ontario"))
+        self.assertEqual(canonical_location("Jaipur , Rajasthan"), "jaipur, rajasthan, india")
+        self.assertEqual(canonical_location("Košice, Košice Region"), "kosice, kosice region")
+
+    def test_orders_place_admin_area_and_country(self) -> None:
+        self.assertEqual(canonical_location("India, Bengaluru, Karnataka"), "bengaluru, karnataka, india")
+        self.assertEqual(canonical_location("New York, NY"), "new york, new york, united states")
+        self.assertEqual(canonical_location("New York, New York, USA"), "new york, new york, united states")
+        self.assertEqual(
+            canonical_location("Union, 1075 Morris Ave, Union, NJ 07083"),
+            "union, 1075 morris ave, new jersey, united states",
+        )
+        self.assertEqual(canonical_location("India"), "india")
+
+    def test_placeholders_have_no_key(self) -> None:
+        for text in ("", "Location TBD", "Everywhere, Worldwide", "Unspecified", "Global", " Online "):
+            self.assertIsNone(canonical_location(text))
+        self.assertEqual(canonical_location("Online, India"), "india")
+
+    def test_geocoder_looks_up_each_place_once(self) -> None:
+        geocoder = LocationGeocoder(enabled=True, gazetteer=None)
+        geocoder.gazetteer = None
+        geocoder._nominatim = Mock()
+        geocoder._nominatim.geocode.return_value = Mock(latitude=38.97, longitude=-95.24)
+        self.assertEqual(geocoder.geocode("Lawrence , Kansas"), (38.97, -95.24))
+        self.assertEqual(geocoder.geocode("Lawrence, KS"), (38.97, -95.24))
+        self.assertIsNone(geocoder.geocode("Location TBD"))
+        geocoder._nominatim.geocode.assert_called_once_with("Lawrence , Kansas", timeout=10)
+
+    def test_geocoder_defers_when_remote_lookups_are_off(self) -> None:
+        geocoder = LocationGeocoder(enabled=False, gazetteer=None)
+        geocoder.gazetteer = None
+        self.assertFalse(geocoder.remote_available)
+        self.assertIsNone(geocoder.geocode("Lawrence, KS"))
+        self.assertTrue(geocoder.was_deferred("Lawrence , Kansas"))
+
+    def test_geocoder_backs_off_only_when_throttled(self) -> None:
+        geocoder = LocationGeocoder(enabled=True, gazetteer=None, governor=Mock())
+        geocoder.gazetteer = None
+        geocoder._nominatim = Mock()
+        geocoder._nominatim.geocode.side_effect = [ValueError("bad response"), TimeoutError("slow")]
+        with patch("app.ingestion.geocoding.THROTTLE_ERRORS", (TimeoutError,)):
+            self.assertIsNone(geocoder.geocode("Lawrence, KS"))
+            geocoder.governor.record_throttle.assert_not_called()
+            self.assertIsNone(geocoder.geocode("Ames, Iowa"))
+        geocoder.governor.record_throttle.assert_called_once()
+        self.assertTrue(geocoder.was_deferred("Lawrence, KS") and geocoder.was_deferred("Ames, Iowa"))
+
+
+if __name__ == "__main__":
+    unittest.main()
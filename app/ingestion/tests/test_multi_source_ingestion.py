@@ -1,16 +1,25 @@
 import html
 import json
+import time
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 from app.ingestion.connectors.devpost import fetch_devpost_hackathons
-from app.ingestion.connectors.devfolio import extract_devfolio_hackathons_from_html
-from app.ingestion.connectors.hackerearth import (
-    extract_hackerearth_hackathons_from_html,
+from app.ingestion.connectors.devfolio import (
+    _iter_hackathon_candidates,
+    extract_devfolio_hackathons_from_html,
+    extract_devfolio_hackathons_from_next_data,
+)
+from app.ingestion.connectors.hackerearth import extract_hackerearth_hackathons_from_html
+from app.ingestion.connectors.mlh import (
+    extract_mlh_upcoming_events_from_html,
+    fetch_mlh_hackathons,
+    mlh_seasons_to_fetch,
 )
-from app.ingestion.connectors.mlh import extract_mlh_upcoming_events_from_html
 from app.ingestion.connectors.unstop import fetch_unstop_hackathons
+from app.ingestion.crawl import CrawlDeadline, SourceCrawl, fingerprint_record
 from app.ingestion.transformers import (
     normalize_devfolio_hackathons,
     normalize_hackerearth_hackathons,
@@ -19,6 +28,25 @@ from app.ingestion.transformers import (
 )
 
 
+HACKEREARTH_CARD_TEMPLATE = """
+<div class="challenge-card-modern">
+  <a class="challenge-card-wrapper challenge-card-link" href="/challenges/hackathon/event-{index}/">
+    <span class="challenge-list-title challenge-card-wrapper">Event {index}</span>
+    <div class="company-details ellipsis"><div class="inline-block company-image"></div> Org {index}</div>
+    <div id="countdown-{index}" class="countdown hidden"></div>
+  </a>
+</div>
+<script type="text/javascript">
+  var seconds_left = 1772400000 - 1772300000;
+  var countdown_elem = $('#countdown-{index}');
+</script>
+"""
+
+
+def _hackerearth_page(card_count: int) -> str:
+    return "".join(HACKEREARTH_CARD_TEMPLATE.format(index=index) for index in range(card_count))
+
+
 class MultiSourceIngestionTests(unittest.TestCase):
     def test_extracts_devfolio_hackathons_from_next_data(self) -> None:
         payload = {
@@ -86,6 +114,43 @@ class MultiSourceIngestionTests(unittest.TestCase):
 
         self.assertEqual([item["uuid"] for item in records], ["x"])
 
+    def test_devfolio_next_data_bytes_skip_invalid_utf8(self) -> None:
+        payload = {
+            "props": {
+                "pageProps": {
+                    "dehydratedState": {
+                        "queries": [{"state": {"data": {"open_hackathons": [{"uuid": "x", "name": "X Hack"}]}}}]
+                    }
+                }
+            }
+        }
+        next_data = json.dumps(payload).encode("utf-8").replace(b"X Hack", b"X \xff Hack")
+
+        records = extract_devfolio_hackathons_from_next_data(next_data)
+
+        self.assertEqual([(item["uuid"], item["name"]) for item in records], [("x", "X  Hack")])
+
+    def test_devfolio_walker_prefers_hackathon_lists_and_visits_once(self) -> None:
+        shared = {"uuid": "a", "name": "A"}
+        data = {
+            "extra": [{"uuid": "z"}],
+            "open_hackathons": [shared],
+            "featured_hackathons": [shared, {"uuid": "b"}],
+        }
+
+        records = list(_iter_hackathon_candidates(data))
+
+        self.assertEqual([item["uuid"] for item in records], ["a", "b", "z"])
+
+    def test_devfolio_walker_survives_deep_nesting(self) -> None:
+        data: dict = {"uuid": "deep"}
+        for _ in range(5000):
+            data = {"wrapper": [data]}
+
+        records = list(_iter_hackathon_candidates(data))
+
+        self.assertEqual([item["uuid"] for item in records], ["deep"])
+
     def test_extracts_mlh_events_from_inertia_data_page(self) -> None:
         payload = {
             "props": {
@@ -103,6 +168,52 @@ class MultiSourceIngestionTests(unittest.TestCase):
         self.assertEqual(len(records), 2)
         self.assertEqual(records[0]["id"], "1")
 
+    def test_mlh_fetches_adjacent_season_near_year_boundary(self) -> None:
+        self.assertEqual(
+            mlh_seasons_to_fetch(datetime(2026, 12, 10, tzinfo=timezone.utc)), [2026, 2027]
+        )
+        self.assertEqual(
+            mlh_seasons_to_fetch(datetime(2027, 1, 5, tzinfo=timezone.utc)), [2027, 2026]
+        )
+        self.assertEqual(mlh_seasons_to_fetch(datetime(2026, 6, 1, tzinfo=timezone.utc)), [2026])
+        self.assertEqual(
+            mlh_seasons_to_fetch(datetime(2026, 12, 10, tzinfo=timezone.utc), window_days=0),
+            [2026],
+        )
+        self.assertEqual(
+            mlh_seasons_to_fetch(datetime(2026, 12, 10, tzinfo=timezone.utc), season_year=2025),
+            [2025],
+        )
+
+    def test_mlh_merges_seasons_and_dedupes_by_event_id(self) -> None:
+        seasons = {
+            2026: [{"id": "1", "name": "Current"}, {"id": "2", "name": "Both"}],
+            2027: [{"id": "2", "name": "Both (next)"}, {"id": "3", "name": "Next"}],
+        }
+
+        with patch(
+            "app.ingestion.connectors.mlh._fetch_and_extract_mlh",
+            side_effect=lambda season, timeout_seconds: seasons[season],
+        ) as mock_fetch:
+            records = fetch_mlh_hackathons(now=datetime(2026, 12, 20, tzinfo=timezone.utc))
+
+        self.assertEqual([record["name"] for record in records], ["Current", "Both", "Next"])
+        self.assertEqual(sorted(call.args[0] for call in mock_fetch.call_args_list), [2026, 2027])
+
+    def test_mlh_failed_current_season_marks_crawl_partial(self) -> None:
+        seasons = {2026: None, 2027: [{"id": "3", "name": "Next"}]}
+        crawl = SourceCrawl("mlh")
+
+        with patch(
+            "app.ingestion.connectors.mlh._fetch_and_extract_mlh",
+            side_effect=lambda season, timeout_seconds: seasons[season],
+        ):
+            records = fetch_mlh_hackathons(now=datetime(2026, 12, 20, tzinfo=timezone.utc), crawl=crawl)
+
+        self.assertEqual([record["name"] for record in records], ["Next"])
+        self.assertFalse(crawl.complete)
+        self.assertEqual(crawl.stop_reason, "season 2026 failed")
+
     def test_extracts_hackerearth_cards_and_countdowns(self) -> None:
         html_body = """
         <div class="challenge-card-modern">
@@ -128,6 +239,37 @@ class MultiSourceIngestionTests(unittest.TestCase):
         self.assertEqual(records[0]["organizer"], "Acme Labs")
         self.assertEqual(records[0]["final_submission_unix"], 1772400000)
 
+    def test_hackerearth_pairs_countdowns_even_without_closing_script(self) -> None:
+        html_body = _hackerearth_page(3)
+        html_body = html_body[: html_body.rindex("</script>")]
+
+        records = extract_hackerearth_hackathons_from_html(html_body)
+
+        self.assertEqual([record["id"] for record in records], ["event-0", "event-1", "event-2"])
+        self.assertEqual(
+            records[2]["url"], "https://www.hackerearth.com/challenges/hackathon/event-2/"
+        )
+
+    def test_hackerearth_extraction_scales_linearly(self) -> None:
+        # Cards without their countdown script and one script that is never
+        # closed: what sent the old card regex scanning to the end of the page
+        # once per card.
+        card = HACKEREARTH_CARD_TEMPLATE[: HACKEREARTH_CARD_TEMPLATE.index("<script")]
+
+        def seconds(card_count: int) -> float:
+            html_body = "".join(card.format(index=index) for index in range(card_count))
+            html_body += "<script>var seconds_left = 1772400000 - 1772300000;"
+            timings = []
+            for _ in range(3):
+                started = time.perf_counter()
+                records = extract_hackerearth_hackathons_from_html(html_body)
+                timings.append(time.perf_counter() - started)
+            self.assertEqual(records, [])
+            return min(timings)
+
+        # 8x the page; quadratic rescanning would take ~64x as long.
+        self.assertLess(seconds(2000), 24 * seconds(250))
+
     def test_fetches_all_unstop_pages_when_max_pages_is_zero(self) -> None:
         with patch("app.ingestion.connectors.unstop._fetch_page") as mock_fetch_page:
             mock_fetch_page.side_effect = [
@@ -177,6 +319,137 @@ class MultiSourceIngestionTests(unittest.TestCase):
         urls = [call.args[0] for call in mock_fetch_json.call_args_list]
         self.assertTrue(any("challenge_type%5B%5D=hybrid" in url for url in urls))
 
+    def test_fans_out_remaining_devpost_pages_from_meta(self) -> None:
+        def fake_fetch_json(url, timeout_seconds, budget=None):
+            query = parse_qs(urlparse(url).query)
+            challenge_type = query["challenge_type[]"][0]
+            page = int(query["page"][0])
+            offset = {"online": 0, "in-person": 100}[challenge_type]
+            return {
+                "hackathons": [{"id": offset + page}],
+                "meta": {"total_count": 4, "per_page": 1},
+            }
+
+        with patch(
+            "app.ingestion.connectors.devpost._fetch_json",
+            side_effect=fake_fetch_json,
+        ) as mock_fetch_json:
+            records = fetch_devpost_hackathons(
+                max_pages=0,
+                challenge_types=("online", "in-person"),
+                max_in_flight=2,
+            )
+
+        self.assertEqual(
+            [record["id"] for record in records], [1, 2, 3, 4, 101, 102, 103, 104]
+        )
+        self.assertEqual(mock_fetch_json.call_count, 8)
+
+    def test_skips_devpost_challenge_types_with_duplicate_listing(self) -> None:
+        def fake_fetch_json(url, timeout_seconds, budget=None):
+            page = int(parse_qs(urlparse(url).query)["page"][0])
+            return {
+                "hackathons": [{"id": page}],
+                "meta": {"total_count": 3, "per_page": 1},
+            }
+
+        with patch(
+            "app.ingestion.connectors.devpost._fetch_json",
+            side_effect=fake_fetch_json,
+        ) as mock_fetch_json:
+            records = fetch_devpost_hackathons(max_pages=0)
+
+        self.assertEqual([record["id"] for record in records], [1, 2, 3])
+        # Page 1 for each of the three types, plus pages 2-3 for "online" only.
+        self.assertEqual(mock_fetch_json.call_count, 5)
+
+    def test_incremental_unstop_stops_after_unchanged_pages(self) -> None:
+        pages = [
+            {"data": {"data": [{"id": page, "title": f"Event {page}"}], "last_page": 6}}
+            for page in range(1, 7)
+        ]
+        known = {
+            str(item["id"]): fingerprint_record(item)
+            for payload in pages
+            for item in payload["data"]["data"]
+        }
+        crawl = SourceCrawl("unstop", known_fingerprints=known, unchanged_page_limit=2)
+
+        with patch(
+            "app.ingestion.connectors.unstop._fetch_page", side_effect=pages
+        ) as mock_fetch_page:
+            records = fetch_unstop_hackathons(max_pages=0, crawl=crawl)
+
+        self.assertEqual([record["id"] for record in records], [1, 2])
+        self.assertEqual(mock_fetch_page.call_count, 2)
+        self.assertFalse(crawl.complete)
+
+    def test_incremental_unstop_keeps_walking_past_changed_pages(self) -> None:
+        pages = [
+            {"data": {"data": [{"id": page, "title": f"Event {page}"}], "last_page": 3}}
+            for page in range(1, 4)
+        ]
+        known = {"1": fingerprint_record({"id": 1, "title": "Old title"})}
+        crawl = SourceCrawl("unstop", known_fingerprints=known, unchanged_page_limit=1)
+
+        with patch("app.ingestion.connectors.unstop._fetch_page", side_effect=pages):
+            records = fetch_unstop_hackathons(max_pages=0, crawl=crawl)
+
+        self.assertEqual([record["id"] for record in records], [1, 2, 3])
+        self.assertTrue(crawl.complete)
+        self.assertEqual(sorted(crawl.seen_fingerprints), ["1", "2", "3"])
+
+    def test_incremental_devpost_stops_after_unchanged_pages(self) -> None:
+        def payload_for(page):
+            return {
+                "hackathons": [{"id": page, "title": f"Event {page}"}],
+                "meta": {"total_count": 10, "per_page": 1},
+            }
+
+        def fake_fetch_json(url, timeout_seconds, budget=None):
+            return payload_for(int(parse_qs(urlparse(url).query)["page"][0]))
+
+        # Page 1 changed since the last run; pages 2 onwards did not.
+        known = {
+            str(page): fingerprint_record(payload_for(page)["hackathons"][0])
+            for page in range(2, 11)
+        }
+        crawl = SourceCrawl("devpost", known_fingerprints=known, unchanged_page_limit=2)
+
+        with patch(
+            "app.ingestion.connectors.devpost._fetch_json",
+            side_effect=fake_fetch_json,
+        ) as mock_fetch_json:
+            records = fetch_devpost_hackathons(
+                max_pages=0,
+                challenge_types=("online",),
+                max_in_flight=2,
+                crawl=crawl,
+            )
+
+        self.assertEqual([record["id"] for record in records], [1, 2, 3])
+        self.assertEqual(mock_fetch_json.call_count, 3)
+        self.assertFalse(crawl.complete)
+
+    def test_unstop_stops_paginating_at_deadline(self) -> None:
+        now = [0.0]
+
+        def fake_fetch_page(page, per_page, timeout_seconds, budget=None):
+            now[0] += 10.0
+            return {"data": {"data": [{"id": page}], "last_page": 10}}
+
+        crawl = SourceCrawl(
+            "unstop", deadline=CrawlDeadline(25.0, clock=lambda: now[0])
+        )
+        with patch(
+            "app.ingestion.connectors.unstop._fetch_page", side_effect=fake_fetch_page
+        ):
+            records = fetch_unstop_hackathons(max_pages=0, crawl=crawl)
+
+        self.assertEqual([record["id"] for record in records], [1, 2, 3])
+        self.assertFalse(crawl.complete)
+        self.assertEqual(crawl.stop_reason, "deadline reached")
+
     def test_normalizes_devfolio(self) -> None:
         now = datetime(2026, 3, 1, tzinfo=timezone.utc)
         records = [
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import sqlite3
 import tempfile
 import unittest
@@ -5,7 +7,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
-from app.ingestion.pipeline import run_pipeline
+from app.ingestion.crawl import SourceCrawl, load_incremental_crawls, save_crawl_state
+from app.ingestion.pipeline import (
+    _ensure_schema,
+    ingest_all_sources,
+    ingest_all_sources_async,
+    run_pipeline,
+)
 
 
 def _record(identifier: str, source_platform: str = "Devpost") -> dict[str, object]:
@@ -111,5 +119,224 @@ class PipelineTests(unittest.TestCase):
             self.assertEqual(rows, [("devpost-1", 1), ("unstop-1", 1)])
 
 
+    def test_concurrent_sources_merge_in_serial_order(self) -> None:
+        delays = {"devpost": 0.05, "devfolio": 0.03, "hackerearth": 0.0, "unstop": 0.02, "mlh": 0.01}
+
+        async def fake_source(
+            source, max_pages, mlh_season_year, current_time, crawl, mlh_season_window_days
+        ):
+            await asyncio.sleep(delays[source])
+            if source == "hackerearth":
+                raise RuntimeError("source down")
+            records = [
+                _record("shared", source.title()),
+                _record(f"{source}-1", source.title()),
+            ]
+            for record in records:
+                record["final_submission_date"] = "2099-01-01T00:00:00+00:00"
+            return records
+
+        with patch(
+            "app.ingestion.pipeline._fetch_and_normalize_source_async",
+            side_effect=fake_source,
+        ):
+            serial = ingest_all_sources(geocode=False, source_concurrency=1)
+            parallel = ingest_all_sources(geocode=False, source_concurrency=5)
+
+        self.assertEqual(
+            [(record["id"], record["source_platform"]) for record in parallel],
+            [(record["id"], record["source_platform"]) for record in serial],
+        )
+        self.assertEqual(
+            [record["id"] for record in parallel],
+            ["shared", "devpost-1", "devfolio-1", "unstop-1", "mlh-1"],
+        )
+        self.assertEqual(parallel[0]["source_platform"], "Mlh")
+
+
+    def test_async_ingestion_bounds_sources_on_one_event_loop(self) -> None:
+        active = 0
+        peak = 0
+        loops = set()
+
+        async def fake_source(
+            source, max_pages, mlh_season_year, current_time, crawl, mlh_season_window_days
+        ):
+            nonlocal active, peak
+            loops.add(id(asyncio.get_running_loop()))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            record = _record(f"{source}-1", source.title())
+            record["final_submission_date"] = "2099-01-01T00:00:00+00:00"
+            return [record]
+
+        with patch(
+            "app.ingestion.pipeline._fetch_and_normalize_source_async",
+            side_effect=fake_source,
+        ):
+            records = asyncio.run(
+                ingest_all_sources_async(geocode=False, source_concurrency=2)
+            )
+
+        self.assertEqual(len(records), 5)
+        self.assertEqual(peak, 2)
+        self.assertEqual(len(loops), 1)
+
+    def test_partial_source_keeps_unseen_records_active_and_in_json(self) -> None:
+        def future_record(identifier: str) -> dict[str, object]:
+            record = _record(identifier)
+            record["final_submission_date"] = "2099-01-01T00:00:00+00:00"
+            return record
+
+        def incremental_run(*args, crawls, **kwargs):
+            crawls["devpost"].mark_partial("incremental stop at online page 2")
+            return [future_record("devpost-1")]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "hackhunt.db"
+            json_path = Path(temp_dir) / "out.json"
+
+            with patch(
+                "app.ingestion.pipeline.ingest_all_sources",
+                return_value=[future_record("devpost-1"), future_record("devpost-2")],
+            ):
+                run_pipeline(
+                    max_pages=0,
+                    db_path=db_path,
+                    json_output_path=None,
+                    geocode=False,
+                    sources=["devpost"],
+                    mlh_season_year=None,
+                )
+
+            with patch(
+                "app.ingestion.pipeline.ingest_all_sources",
+                side_effect=incremental_run,
+            ):
+                summary = run_pipeline(
+                    max_pages=0,
+                    db_path=db_path,
+                    json_output_path=json_path,
+                    geocode=False,
+                    sources=["devpost"],
+                    mlh_season_year=None,
+                    incremental=True,
+                )
+
+            connection = sqlite3.connect(db_path)
+            try:
+                rows = connection.execute(
+                    "SELECT id, is_active FROM hackathons ORDER BY id"
+                ).fetchall()
+            finally:
+                connection.close()
+            written = json.loads(json_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(rows, [("devpost-1", 1), ("devpost-2", 1)])
+        self.assertEqual(summary["partial_sources"], ["devpost"])
+        self.assertEqual([item["id"] for item in written], ["devpost-1", "devpost-2"])
+
+    def test_incremental_crawl_falls_back_to_full_crawl_on_cadence(self) -> None:
+        finished_at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        crawl = SourceCrawl("unstop")
+        crawl.record_page([{"id": 7, "title": "Seven"}])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            connection = sqlite3.connect(Path(temp_dir) / "hackhunt.db")
+            try:
+                _ensure_schema(connection)
+                save_crawl_state(connection, [crawl], finished_at=finished_at)
+
+                soon = load_incremental_crawls(
+                    connection,
+                    ["unstop"],
+                    now=finished_at.replace(hour=6),
+                    full_crawl_interval_hours=24,
+                )
+                later = load_incremental_crawls(
+                    connection,
+                    ["unstop"],
+                    now=finished_at.replace(day=3),
+                    full_crawl_interval_hours=24,
+                )
+            finally:
+                connection.close()
+
+        self.assertTrue(soon["unstop"].incremental)
+        self.assertEqual(list(soon["unstop"].known_fingerprints), ["7"])
+        self.assertFalse(later["unstop"].incremental)
+
+    def test_sources_are_fetched_cheapest_first(self) -> None:
+        started = []
+
+        async def fake_source(
+            source, max_pages, mlh_season_year, current_time, crawl, mlh_season_window_days
+        ):
+            started.append(source)
+            return []
+
+        with patch(
+            "app.ingestion.pipeline._fetch_and_normalize_source_async",
+            side_effect=fake_source,
+        ):
+            ingest_all_sources(geocode=False, source_concurrency=1)
+
+        self.assertEqual(started, ["devfolio", "hackerearth", "mlh", "unstop", "devpost"])
+
+    def test_deadline_commits_partial_run_without_deactivating(self) -> None:
+        async def fake_source(
+            source, max_pages, mlh_season_year, current_time, crawl, mlh_season_window_days
+        ):
+            self.fail(f"{source} should not be fetched after the deadline")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "hackhunt.db"
+            json_path = Path(temp_dir) / "out.json"
+            seeded = _record("devpost-1")
+            seeded["final_submission_date"] = "2099-01-01T00:00:00+00:00"
+
+            with patch(
+                "app.ingestion.pipeline.ingest_all_sources",
+                return_value=[seeded],
+            ):
+                run_pipeline(
+                    max_pages=0,
+                    db_path=db_path,
+                    json_output_path=None,
+                    geocode=False,
+                    sources=["devpost"],
+                    mlh_season_year=None,
+                )
+
+            with patch(
+                "app.ingestion.pipeline._fetch_and_normalize_source_async",
+                side_effect=fake_source,
+            ):
+                summary = run_pipeline(
+                    max_pages=0,
+                    db_path=db_path,
+                    json_output_path=json_path,
+                    geocode=False,
+                    sources=["devpost", "unstop"],
+                    mlh_season_year=None,
+                    deadline_seconds=0.001,
+                )
+
+            connection = sqlite3.connect(db_path)
+            try:
+                rows = connection.execute(
+                    "SELECT id, is_active FROM hackathons ORDER BY id"
+                ).fetchall()
+            finally:
+                connection.close()
+            written = json.loads(json_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(summary["partial_sources"], ["devpost", "unstop"])
+        self.assertEqual(rows, [("devpost-1", 1)])
+        self.assertEqual([item["id"] for item in written], ["devpost-1"])
+
+
 if __name__ == "__main__":
     unittest.main()
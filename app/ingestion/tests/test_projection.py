@@ -0,0 +1,101 @@
+import unittest
+from datetime import datetime, timezone
+
+from app.ingestion.connectors.devpost import DEVPOST_ITEM_FIELDS
+from app.ingestion.connectors.unstop import UNSTOP_ITEM_FIELDS
+from app.ingestion.projection import project_fields, project_items
+from app.ingestion.transformers import (
+    normalize_devpost_hackathons,
+    normalize_unstop_hackathons,
+)
+
+
+class ProjectionTests(unittest.TestCase):
+    def test_projects_nested_dicts_and_lists(self) -> None:
+        projection = {"id": None, "org": {"name": None}, "tags": {"label": None}}
+        item = {
+            "id": 7,
+            "banner": "x" * 1000,
+            "org": {"name": "Acme", "logo": "logo.png"},
+            "tags": [{"label": "AI", "color": "red"}, "plain"],
+        }
+
+        self.assertEqual(
+            project_fields(item, projection),
+            {"id": 7, "org": {"name": "Acme"}, "tags": [{"label": "AI"}, "plain"]},
+        )
+
+    def test_keeps_missing_and_mistyped_fields_as_they_were(self) -> None:
+        projection = {"id": None, "org": {"name": None}}
+
+        self.assertEqual(
+            project_items([{"org": "Acme"}, {"id": None}, "junk"], projection),
+            [{"org": "Acme"}, {"id": None}, "junk"],
+        )
+
+    def test_unstop_projection_keeps_normalized_output(self) -> None:
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        records = [
+            {
+                "id": 10,
+                "title": "CTF Championship",
+                "region": "online",
+                "details": "<p>Online prelims and <b>offline</b> finals</p>",
+                "banner_mobile": {"image_url": "https://example.com/banner.png"},
+                "public_url": "hackathons/ctf-10",
+                "seo_url": "https://unstop.com/hackathons/ctf-10",
+                "updated_at": "2026-03-01T10:00:00+05:30",
+                "end_date": "2026-03-20T11:00:00+05:30",
+                "organisation": {"name": "NFSU", "about": "A long profile" * 50},
+                "address_with_country_logo": {
+                    "city": "Gandhinagar",
+                    "country": {"name": "India", "logo": "flag.png"},
+                },
+                "prizes": [{"cash": 5000, "pre_placement_internship": 1, "rank": 1}],
+                "required_skills": [{"skill_name": "Machine Learning", "id": 3}],
+                "regnRequirements": {
+                    "start_regn_dt": "2026-03-01T00:00:00+05:30",
+                    "end_regn_dt": "2026-03-18T00:00:00+05:30",
+                    "reg_status": "STARTED",
+                },
+            }
+        ]
+
+        projected = project_items(records, UNSTOP_ITEM_FIELDS)
+
+        self.assertNotIn("banner_mobile", projected[0])
+        self.assertEqual(projected[0]["organisation"], {"name": "NFSU"})
+        self.assertEqual(
+            normalize_unstop_hackathons(projected, now=now),
+            normalize_unstop_hackathons(records, now=now),
+        )
+
+    def test_devpost_projection_keeps_normalized_output(self) -> None:
+        now = datetime(2026, 2, 28, 12, 0, tzinfo=timezone.utc)
+        records = [
+            {
+                "id": 101,
+                "title": "AI Sprint",
+                "url": "https://example.com/ai-sprint",
+                "thumbnail_url": "https://example.com/thumb.png",
+                "displayed_location": {"icon": "globe", "location": "Online"},
+                "submission_period_dates": "Feb 27 - Mar 01, 2026",
+                "themes": [{"id": 1, "name": "Machine Learning/AI"}],
+                "organization_name": "Acme",
+                "analytics_identifier": "internship swag",
+                "prize_amount": "$10,000",
+                "registrations_count": 500,
+            }
+        ]
+
+        projected = project_items(records, DEVPOST_ITEM_FIELDS)
+
+        self.assertNotIn("thumbnail_url", projected[0])
+        self.assertEqual(
+            normalize_devpost_hackathons(projected, now=now),
+            normalize_devpost_hackathons(records, now=now),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+
+from app.ingestion.rate_limit import HostGovernor, HostPolicy, parse_retry_after
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class HostGovernorTests(unittest.TestCase):
+    def _governor(self, clock: _FakeClock, policy: HostPolicy) -> HostGovernor:
+        return HostGovernor(
+            policies={"example.com": policy},
+            clock=clock.clock,
+            sleep=clock.sleep,
+        )
+
+    def test_paces_requests_to_policy_rate_after_burst(self) -> None:
+        clock = _FakeClock()
+        governor = self._governor(
+            clock, HostPolicy(requests_per_second=2.0, burst=2, max_in_flight=1)
+        )
+
+        for _ in range(6):
+            governor.wait_for_token("example.com")
+
+        # Two burst tokens are free; the remaining four are spaced 0.5s apart.
+        self.assertAlmostEqual(clock.now, 2.0)
+
+    def test_throttle_blocks_host_until_retry_after_and_halves_rate(self) -> None:
+        clock = _FakeClock()
+        governor = self._governor(
+            clock, HostPolicy(requests_per_second=4.0, burst=4, max_in_flight=1)
+        )
+
+        governor.record_throttle("example.com", retry_after_seconds=10)
+        governor.wait_for_token("example.com")
+
+        self.assertGreaterEqual(clock.now, 10.0)
+        self.assertEqual(governor.current_rate("example.com"), 2.0)
+
+        for _ in range(20):
+            governor.record_success("example.com")
+        self.assertEqual(governor.current_rate("example.com"), 4.0)
+
+    def test_hosts_are_limited_independently(self) -> None:
+        clock = _FakeClock()
+        governor = HostGovernor(
+            policies={},
+            default_policy=HostPolicy(requests_per_second=1.0, burst=1, max_in_flight=1),
+            clock=clock.clock,
+            sleep=clock.sleep,
+        )
+
+        governor.wait_for_token("a.example.com")
+        governor.wait_for_token("b.example.com")
+
+        self.assertEqual(clock.sleeps, [])
+
+    def test_caps_requests_in_flight_per_host(self) -> None:
+        governor = HostGovernor(
+            policies={
+                "example.com": HostPolicy(
+                    requests_per_second=1000.0, burst=1000, max_in_flight=2
+                )
+            }
+        )
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal active, peak
+            with governor.slot("example.com"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak, 2)
+
+    def test_parses_retry_after_seconds_and_http_dates(self) -> None:
+        now = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        self.assertEqual(parse_retry_after("30"), 30.0)
+        self.assertEqual(
+            parse_retry_after("Sun, 01 Mar 2026 12:00:45 GMT", now=now), 45.0
+        )
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
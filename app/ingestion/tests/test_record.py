@@ -0,0 +1,112 @@
+import json
+import sqlite3
+import unittest
+from datetime import datetime, timezone
+
+from app.ingestion.pipeline import (
+    _drop_expired,
+    _ensure_schema,
+    _load_active_records,
+    _serialize_for_json,
+    _upsert_records,
+)
+from app.ingestion.record import FIELDS, HackathonRecord
+from app.ingestion.transformers import normalize_mlh_hackathons
+
+
+def _record(**overrides: object) -> HackathonRecord:
+    values = {
+        "id": "mlh-1",
+        "title": "HackIllinois",
+        "url": "https://mlh.io/events/1",
+        "source_platform": "MLH",
+        "format": "Offline",
+        "location_text": "Urbana, Illinois",
+        "start_date": "2026-03-01T00:00:00+00:00",
+        "final_submission_date": "2026-03-03T00:00:00+00:00",
+        "days_to_final": 2,
+        "created_at": "2026-02-01T00:00:00+00:00",
+        "themes": ["AI/ML"],
+        "prizes": ["Unspecified"],
+    }
+    values.update(overrides)
+    return HackathonRecord.from_mapping(values)
+
+
+class HackathonRecordTests(unittest.TestCase):
+    def test_reads_like_a_mapping(self) -> None:
+        record = _record()
+
+        self.assertEqual(list(record), list(FIELDS))
+        self.assertEqual(record["id"], "mlh-1")
+        self.assertIsNone(record.get("latitude"))
+        self.assertEqual(record.get("missing", "default"), "default")
+        self.assertNotIn("start_at", record)
+        with self.assertRaises(KeyError):
+            record["to_json"]
+
+        record["latitude"] = 40.1
+        self.assertEqual(record.latitude, 40.1)
+        with self.assertRaises(KeyError):
+            record["organizer"] = "Acme"
+
+    def test_interns_repeated_values(self) -> None:
+        first = _record(location_text="".join(["Urbana, ", "Illinois"]))
+        second = _record(id="mlh-2", themes=["AI/ML"])
+
+        self.assertIs(first.location_text, second.location_text)
+        self.assertIs(first.themes, second.themes)
+        self.assertEqual(first.themes, ("AI/ML",))
+
+    def test_keeps_parsed_dates_next_to_iso_strings(self) -> None:
+        normalized = normalize_mlh_hackathons(
+            [
+                {
+                    "id": "hack",
+                    "name": "Hack",
+                    "starts_at": "2026-03-01T09:00:00-06:00",
+                    "ends_at": "2026-03-03T18:00:00-06:00",
+                    "format_type": "digital",
+                }
+            ],
+            now=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        )
+        record = normalized[0]
+
+        self.assertEqual(
+            record.final_submission_at, datetime(2026, 3, 4, 0, 0, tzinfo=timezone.utc)
+        )
+        self.assertEqual(record.final_submission_at.isoformat(), record.final_submission_date)
+
+        record["final_submission_date"] = "2099-01-01T00:00:00"
+        self.assertEqual(record.final_submission_at, datetime(2099, 1, 1, tzinfo=timezone.utc))
+
+    def test_drop_expired_keeps_unparseable_dates(self) -> None:
+        now = datetime(2026, 3, 2, tzinfo=timezone.utc)
+        records = [
+            _record(id="ended", final_submission_date="2026-03-01T00:00:00+00:00"),
+            _record(id="open"),
+            _record(id="unknown", final_submission_date="soon"),
+        ]
+
+        self.assertEqual([record.id for record in _drop_expired(records, now)], ["open", "unknown"])
+
+    def test_round_trips_through_sqlite_and_json(self) -> None:
+        record = _record(latitude=40.1, longitude=-88.2)
+        connection = sqlite3.connect(":memory:")
+        try:
+            _ensure_schema(connection)
+            self.assertEqual(_upsert_records(connection, [record, _record(id="mlh-2")]), 2)
+            loaded = _load_active_records(connection, ["MLH"], exclude_ids=["mlh-2"])
+        finally:
+            connection.close()
+
+        self.assertEqual(loaded, [record])
+        serialized = json.loads(json.dumps(_serialize_for_json(loaded)))
+        self.assertEqual(serialized[0]["coordinates"], {"lat": 40.1, "lng": -88.2})
+        self.assertEqual(serialized[0]["themes"], ["AI/ML"])
+        self.assertEqual(serialized[0]["sourcePlatform"], "MLH")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from app.ingestion.connectors.devpost import fetch_devpost_hackathons
+from app.ingestion.http_client import HttpError
+from app.ingestion.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitTrialPending,
+    FailureBudget,
+    FailureBudgetExceeded,
+    backoff_delay,
+    call_with_retries,
+    reset_breakers,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failing(exc: Exception):
+    def operation():
+        raise exc
+
+    return operation
+
+
+class ResilienceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_breakers()
+
+    def tearDown(self) -> None:
+        reset_breakers()
+
+    def test_backoff_is_exponential_with_full_jitter_and_capped(self) -> None:
+        self.assertEqual(backoff_delay(1, base_seconds=1, rng=lambda: 1.0), 1.0)
+        self.assertEqual(backoff_delay(3, base_seconds=1, rng=lambda: 1.0), 4.0)
+        self.assertEqual(
+            backoff_delay(10, base_seconds=1, cap_seconds=20, rng=lambda: 1.0), 20.0
+        )
+        self.assertEqual(backoff_delay(3, base_seconds=1, rng=lambda: 0.0), 0.0)
+
+    def test_breaker_opens_after_consecutive_failures_and_fails_fast(self) -> None:
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30, clock=clock)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise ConnectionResetError("reset")
+
+        with self.assertRaises(CircuitOpenError):
+            call_with_retries(
+                operation,
+                host="example.com",
+                description="test",
+                max_attempts=5,
+                breaker=breaker,
+                sleep=lambda seconds: None,
+            )
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            call_with_retries(
+                lambda: "ok", host="example.com", description="test", breaker=breaker
+            )
+
+        clock.now = 31
+        self.assertEqual(breaker.state, "half-open")
+        result = call_with_retries(
+            lambda: "ok", host="example.com", description="test", breaker=breaker
+        )
+        self.assertEqual(result, "ok")
+        self.assertEqual(breaker.state, "closed")
+
+    def test_concurrent_pages_wait_for_the_half_open_trial(self) -> None:
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+        trial_started = threading.Event()
+        release_trial = threading.Event()
+
+        def trial():
+            trial_started.set()
+            release_trial.wait(5)
+            return "trial"
+
+        def page(operation):
+            return call_with_retries(operation, host="example.com", description="page", breaker=breaker)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(page, trial)
+            self.assertTrue(trial_started.wait(5))
+            others = [pool.submit(page, lambda: "page") for _ in range(3)]
+            release_trial.set()
+            self.assertEqual([first.result(5)] + [other.result(5) for other in others], ["trial"] + ["page"] * 3)
+
+        # A trial that outlasts the wait fails the page, not the source.
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock, trial_wait_seconds=0.01)
+        breaker.record_failure()
+        clock.now = 62
+        breaker.before_call("example.com")
+        with self.assertRaises(CircuitTrialPending):
+            breaker.before_call("example.com")
+
+    def test_failed_half_open_trial_reopens_breaker(self) -> None:
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+
+        with self.assertRaises(TimeoutError):
+            call_with_retries(
+                _failing(TimeoutError("slow")),
+                host="example.com",
+                description="test",
+                max_attempts=1,
+                breaker=breaker,
+            )
+
+        self.assertEqual(breaker.state, "open")
+
+    def test_client_errors_are_not_retried(self) -> None:
+        operation = MagicMock(side_effect=HttpError("https://example.com", 404, "Not Found"))
+
+        with self.assertRaises(HttpError):
+            call_with_retries(
+                operation,
+                host="example.com",
+                description="test",
+                max_attempts=3,
+                sleep=lambda seconds: None,
+            )
+
+        self.assertEqual(operation.call_count, 1)
+
+    def test_failure_budget_stops_calls_once_exhausted(self) -> None:
+        budget = FailureBudget("Example", max_failures=2)
+        operation = MagicMock(side_effect=TimeoutError("slow"))
+
+        with self.assertRaises(FailureBudgetExceeded):
+            call_with_retries(
+                operation,
+                host="example.com",
+                description="test",
+                budget=budget,
+                max_attempts=5,
+                breaker=CircuitBreaker(failure_threshold=10),
+                sleep=lambda seconds: None,
+            )
+
+        self.assertEqual(operation.call_count, 2)
+
+    def test_devpost_fails_source_fast_when_site_is_down(self) -> None:
+        client = MagicMock()
+        client.get_json.side_effect = TimeoutError("timed out")
+
+        with patch(
+            "app.ingestion.connectors.devpost.get_default_client", return_value=client
+        ), patch("app.ingestion.resilience.backoff_delay", return_value=0):
+            with self.assertRaises(CircuitOpenError):
+                fetch_devpost_hackathons(max_pages=0)
+
+        # The breaker opens after three consecutive timeouts, so the remaining
+        # challenge types never reach the network.
+        self.assertEqual(client.get_json.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 from datetime import datetime, timezone
 
-from app.ingestion.timeline_parser import parse_submission_period_dates
+from app.ingestion.timeline_parser import (
+    _parse_normalized,
+    parse_many,
+    parse_submission_period_dates,
+)
 
 
 class TimelineParserTests(unittest.TestCase):
@@ -63,6 +67,43 @@ class TimelineParserTests(unittest.TestCase):
         )
         self.assertEqual(parsed.days_to_final, 0)
 
+    def test_rejects_malformed_periods(self) -> None:
+        for text in (
+            "Foo 01 - Mar 16, 2026",
+            "Feb 01 - Bar 16, 2026",
+            "Feb 01, 2026 - 28, 2026",
+            "Mar 16, 2026 - Feb 01, 2026",
+            "Feb 30, 2026",
+            "Feb 02",
+            "February 02 - 16, 2026",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_submission_period_dates(text))
+
+    def test_normalizes_whitespace_and_month_case(self) -> None:
+        self.assertEqual(
+            parse_submission_period_dates("  FEB 02 -\n  mar 16,2026 "),
+            parse_submission_period_dates("Feb 02 - Mar 16, 2026"),
+        )
+
+    def test_parse_many_memoizes_repeated_periods(self) -> None:
+        _parse_normalized.cache_clear()
+        fallback = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+        results = parse_many(
+            ["Feb 14 - 28, 2026", "Feb  14 - 28, 2026", "", "Feb 14 - 28, 2026"],
+            fallback_now=fallback,
+        )
+
+        self.assertIsNone(results[2])
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(results[0].start_date.year, 2025)
+        self.assertEqual(_parse_normalized.cache_info().misses, 1)
+        self.assertEqual(
+            parse_submission_period_dates("Feb 14 - 28, 2026").start_date.year, 2026
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,12 @@
 import unittest
 from datetime import datetime, timezone
 
+from app.ingestion.normalizer_spec import (
+    SourceSpec,
+    TextField,
+    compile_normalizer,
+    compile_path,
+)
 from app.ingestion.transformers import normalize_devpost_hackathons
 
 
@@ -91,6 +97,71 @@ class TransformerTests(unittest.TestCase):
         self.assertEqual(normalized[0]["id"], "devpost-2")
         self.assertEqual(normalized[0]["days_to_final"], 0)
 
+    def test_compiled_path_getter_tolerates_non_dict_parents(self) -> None:
+        get_city = compile_path(("venue", "address", "city"))
+
+        self.assertEqual(get_city({"venue": {"address": {"city": "Pune"}}}), "Pune")
+        self.assertIsNone(get_city({"venue": {"address": "Pune"}}))
+        self.assertIsNone(get_city({"venue": None}))
+        self.assertIsNone(get_city({}))
+
+    def test_compiles_normalizer_from_spec(self) -> None:
+        spec = SourceSpec(
+            key="example",
+            source_platform="Example",
+            id_path=("slug",),
+            title=TextField(("event", "name"), "Untitled Hackathon"),
+            url=lambda record: f"https://example.com/{record['slug']}",
+            start_paths=(("event", "opens"), ("created",)),
+            final_paths=(("event", "closes"),),
+            closes_at_path=("event", "registration_closes"),
+            format=lambda record: "Online",
+            location_text=lambda record, format_value: "Global",
+            organizer_path=("host",),
+        )
+        normalize = compile_normalizer(spec)
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        normalized = normalize(
+            [
+                {
+                    "slug": "a",
+                    "host": "Acme",
+                    "created": "2026-02-20",
+                    "event": {"closes": "2026-03-10T12:00:00Z"},
+                },
+                {
+                    "slug": "b",
+                    "host": " acme ",
+                    "event": {"opens": "2026-03-02", "closes": "2026-03-04"},
+                },
+                {
+                    "slug": "closed",
+                    "event": {
+                        "opens": "2026-02-01",
+                        "closes": "2026-03-04",
+                        "registration_closes": "2026-02-15",
+                    },
+                },
+                {"slug": "", "event": {"opens": "2026-03-02", "closes": "2026-03-04"}},
+                {"slug": "undated", "event": {"name": "No dates"}},
+            ],
+            now=now,
+        )
+
+        self.assertEqual(normalize.__name__, "normalize_example_hackathons")
+        self.assertEqual([record["id"] for record in normalized], ["example-a", "example-b"])
+        first = normalized[0]
+        self.assertEqual(first["title"], "Untitled Hackathon")
+        self.assertEqual(first["url"], "https://example.com/a")
+        self.assertEqual(first["start_date"], "2026-02-20T00:00:00+00:00")
+        self.assertEqual(first["final_submission_date"], "2026-03-10T12:00:00+00:00")
+        self.assertEqual(first["days_to_final"], 18)
+        self.assertEqual(first["themes"], ())
+        self.assertEqual(first["prizes"], ("Unspecified",))
+        self.assertEqual(first["organizer_past_events"], 1)
+        self.assertEqual(first["created_at"], now.isoformat())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 
 MONTH_BY_ABBREV = {
@@ -21,23 +22,22 @@ MONTH_BY_ABBREV = {
     "dec": 12,
 }
 
-FULL_DATE_RANGE_PATTERN = re.compile(
-    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2}),\s*(?P<start_year>\d{4})\s*-\s*"
-    r"(?P<end_month>[A-Za-z]{3})\s+(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
+# Devpost writes submission periods in one of four shapes, all starting with
+# "Mon D":
+#   "Dec 05, 2025 - Mar 30, 2026"  explicit years on both ends
+#   "Feb 02 - Mar 16, 2026"        month to month, end year only
+#   "Feb 01 - 28, 2026"            same month, end year only
+#   "Feb 28, 2026"                 single day
+# One grammar covers them; which optional groups matched tells them apart.
+TIMELINE_PATTERN = re.compile(
+    r"(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2})"
+    r"(?:,\s*(?P<start_year>\d{4}))?"
+    r"(?:\s*-\s*(?:(?P<end_month>[A-Za-z]{3})\s+)?(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4}))?"
 )
 
-MONTH_TO_MONTH_RANGE_PATTERN = re.compile(
-    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2})\s*-\s*"
-    r"(?P<end_month>[A-Za-z]{3})\s+(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
-)
-
-SAME_MONTH_RANGE_PATTERN = re.compile(
-    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2})\s*-\s*(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
-)
-
-SINGLE_DAY_PATTERN = re.compile(
-    r"^(?P<month>[A-Za-z]{3})\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})$"
-)
+# Listings repeat the same few periods, so parses are memoized per
+# (normalized text, fallback year).
+TIMELINE_CACHE_SIZE = 4096
 
 
 @dataclass(frozen=True)
@@ -48,11 +48,11 @@ class TimelineParseResult:
 
 
 def _normalize_text(value: str) -> str:
-    return re.sub(r"\s+", " ", value.strip())
+    return " ".join(value.split())
 
 
 def _month_to_number(value: str) -> Optional[int]:
-    return MONTH_BY_ABBREV.get(value.strip().lower()[:3])
+    return MONTH_BY_ABBREV.get(value.lower())
 
 
 def _to_utc_datetime(year: int, month: int, day: int, *, is_end: bool) -> Optional[datetime]:
@@ -87,73 +87,62 @@ def _build_result(
     )
 
 
+@lru_cache(maxsize=TIMELINE_CACHE_SIZE)
+def _parse_normalized(
+    normalized: str, fallback_year: Optional[int]
+) -> Optional[TimelineParseResult]:
+    match = TIMELINE_PATTERN.fullmatch(normalized)
+    if match is None:
+        return None
+    start_month = _month_to_number(match.group("start_month"))
+    if start_month is None:
+        return None
+    start_day = int(match.group("start_day"))
+    start_year_text = match.group("start_year")
+
+    if match.group("end_day") is None:
+        if start_year_text is None:
+            return None
+        year = int(start_year_text)
+        return _build_result(year, start_month, start_day, year, start_month, start_day)
+
+    end_month_text = match.group("end_month")
+    end_year = int(match.group("end_year"))
+    end_day = int(match.group("end_day"))
+    if end_month_text is None:
+        # "Feb 01, 2026 - 28, 2026" is not a shape Devpost uses.
+        if start_year_text is not None:
+            return None
+        start_year = end_year if fallback_year is None else min(fallback_year, end_year)
+        return _build_result(start_year, start_month, start_day, end_year, start_month, end_day)
+
+    end_month = _month_to_number(end_month_text)
+    if end_month is None:
+        return None
+    if start_year_text is not None:
+        start_year = int(start_year_text)
+    else:
+        start_year = end_year if start_month <= end_month else end_year - 1
+    return _build_result(start_year, start_month, start_day, end_year, end_month, end_day)
+
+
 def parse_submission_period_dates(
     period_text: str, fallback_now: Optional[datetime] = None
 ) -> Optional[TimelineParseResult]:
     normalized = _normalize_text(period_text)
     if not normalized:
         return None
+    return _parse_normalized(
+        normalized, fallback_now.year if fallback_now is not None else None
+    )
 
-    match = FULL_DATE_RANGE_PATTERN.match(normalized)
-    if match:
-        start_month = _month_to_number(match.group("start_month"))
-        end_month = _month_to_number(match.group("end_month"))
-        if start_month is None or end_month is None:
-            return None
-        return _build_result(
-            int(match.group("start_year")),
-            start_month,
-            int(match.group("start_day")),
-            int(match.group("end_year")),
-            end_month,
-            int(match.group("end_day")),
-        )
-
-    match = MONTH_TO_MONTH_RANGE_PATTERN.match(normalized)
-    if match:
-        start_month = _month_to_number(match.group("start_month"))
-        end_month = _month_to_number(match.group("end_month"))
-        if start_month is None or end_month is None:
-            return None
-        end_year = int(match.group("end_year"))
-        start_year = end_year if start_month <= end_month else end_year - 1
-        return _build_result(
-            start_year,
-            start_month,
-            int(match.group("start_day")),
-            end_year,
-            end_month,
-            int(match.group("end_day")),
-        )
-
-    match = SAME_MONTH_RANGE_PATTERN.match(normalized)
-    if match:
-        month = _month_to_number(match.group("start_month"))
-        if month is None:
-            return None
-        end_year = int(match.group("end_year"))
-        start_year = fallback_now.year if fallback_now is not None else end_year
-        if fallback_now is None:
-            start_year = end_year
-        elif start_year > end_year:
-            start_year = end_year
-
-        return _build_result(
-            start_year,
-            month,
-            int(match.group("start_day")),
-            end_year,
-            month,
-            int(match.group("end_day")),
-        )
-
-    match = SINGLE_DAY_PATTERN.match(normalized)
-    if match:
-        month = _month_to_number(match.group("month"))
-        if month is None:
-            return None
-        year = int(match.group("year"))
-        day = int(match.group("day"))
-        return _build_result(year, month, day, year, month, day)
 
-    return None
+def parse_many(
+    period_texts: Iterable[str], fallback_now: Optional[datetime] = None
+) -> List[Optional[TimelineParseResult]]:
+    fallback_year = fallback_now.year if fallback_now is not None else None
+    results: List[Optional[TimelineParseResult]] = []
+    for period_text in period_texts:
+        normalized = _normalize_text(period_text)
+        results.append(_parse_normalized(normalized, fallback_year) if normalized else None)
+    return results
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import re
-from collections import Counter
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional
 from urllib.parse import urljoin
 
 try:
-    from app.ingestion.timeline_parser import parse_submission_period_dates
+    from app.ingestion.columnar import NUMPY_AVAILABLE, compile_columnar_normalizer
+    from app.ingestion.html_text import contains_any
+    from app.ingestion.keywords import KeywordMatcher
+    from app.ingestion.normalizer_spec import SourceSpec, TextField, compile_normalizer
+    from app.ingestion.record import HackathonRecord
 except ModuleNotFoundError:
-    from ingestion.timeline_parser import parse_submission_period_dates  # type: ignore[no-redef]
+    from ingestion.columnar import (  # type: ignore[no-redef]
+        NUMPY_AVAILABLE,
+        compile_columnar_normalizer,
+    )
+    from ingestion.html_text import contains_any  # type: ignore[no-redef]
+    from ingestion.keywords import KeywordMatcher  # type: ignore[no-redef]
+    from ingestion.normalizer_spec import (  # type: ignore[no-redef]
+        SourceSpec,
+        TextField,
+        compile_normalizer,
+    )
+    from ingestion.record import HackathonRecord  # type: ignore[no-redef]
 
 
 PRIZE_ORDER = ["Cash", "Swag", "Job/Internship", "Unspecified"]
@@ -43,43 +57,6 @@ def _dedupe_preserving_order(values: Iterable[str]) -> List[str]:
     return deduped
 
 
-def _parse_datetime(value: Any) -> Optional[datetime]:
-    if value is None:
-        return None
-    text = str(value).strip()
-    if not text:
-        return None
-
-    normalized = text.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        for format_hint in (
-            "%Y-%m-%d %H:%M:%S%z",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-        ):
-            try:
-                parsed = datetime.strptime(normalized, format_hint)
-                break
-            except ValueError:
-                continue
-        else:
-            return None
-
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
-
-def _to_utc_iso(value: datetime) -> str:
-    return value.astimezone(timezone.utc).isoformat()
-
-
-def _days_between(start_date: datetime, end_date: datetime) -> int:
-    return max((end_date.date() - start_date.date()).days, 0)
-
-
 def _extract_cash_prize(prize_amount: Any) -> bool:
     if prize_amount is None:
         return False
@@ -133,180 +110,95 @@ def _extract_devfolio_themes(record: Dict[str, Any]) -> List[str]:
     return _dedupe_preserving_order(themes)
 
 
-def _strip_html(value: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", value)).strip()
+def _devpost_location(record: Dict[str, Any]) -> Dict[str, Any]:
+    return record.get("displayed_location") or {}
+
+
+DEVPOST_FORMAT_KEYWORDS = KeywordMatcher(
+    {"online": "online", "virtual": "virtual", "in-person": "in-person"}
+)
 
 
-def _derive_devpost_format(location: Dict[str, Any]) -> str:
+def _derive_devpost_format(record: Dict[str, Any]) -> str:
+    location = _devpost_location(record)
     icon = str(location.get("icon") or "").strip().lower()
-    location_text = str(location.get("location") or "").strip().lower()
-    if icon == "globe" or "online" in location_text or "virtual" in location_text:
+    found = DEVPOST_FORMAT_KEYWORDS.values(str(location.get("location") or "").strip().lower())
+    if icon == "globe" or "online" in found or "virtual" in found:
         return "Online"
-    if "online" in location_text and "in-person" in location_text:
+    if "online" in found and "in-person" in found:
         return "Hybrid"
     return "Offline"
 
 
-def _derive_devpost_location_text(format_value: str, location: Dict[str, Any]) -> str:
-    raw_location = str(location.get("location") or "").strip()
+def _derive_devpost_location_text(record: Dict[str, Any], format_value: str) -> str:
+    raw_location = str(_devpost_location(record).get("location") or "").strip()
     if format_value == "Online":
         return "Global"
     return raw_location or "Unspecified"
 
 
+DEVPOST_PRIZE_KEYWORDS = KeywordMatcher(
+    {"swag": "Swag", "merch": "Swag", "internship": "Job/Internship", "job": "Job/Internship"},
+    whole_words=["job"],
+)
+
+
 def _derive_devpost_prize_categories(record: Dict[str, Any]) -> List[str]:
     title = str(record.get("title") or "").lower()
     summary = str(record.get("analytics_identifier") or "").lower()
-    searchable = f"{title} {summary}"
     categories: List[str] = []
 
     if _extract_cash_prize(record.get("prize_amount")):
         categories.append("Cash")
-    if "swag" in searchable or "merch" in searchable:
-        categories.append("Swag")
-    if "internship" in searchable or re.search(r"\bjob\b", searchable):
-        categories.append("Job/Internship")
+    categories.extend(DEVPOST_PRIZE_KEYWORDS.values(f"{title} {summary}"))
 
     return _finalize_prize_categories(categories)
 
 
-def normalize_devpost_hackathons(
-    records: List[Dict[str, Any]], now: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
-    normalized_records: List[Dict[str, Any]] = []
-    current_time = now or datetime.now(timezone.utc)
-    organizer_counts = Counter(
-        str(record.get("organization_name") or "").strip().lower()
-        for record in records
-        if str(record.get("organization_name") or "").strip()
-    )
+def _join_address(address: Dict[str, Any]) -> str:
+    city = str(address.get("city") or "").strip()
+    state = str(address.get("state") or "").strip()
+    country_raw = address.get("country")
+    if isinstance(country_raw, dict):
+        country_name = str(country_raw.get("name") or "").strip()
+    elif isinstance(country_raw, str):
+        country_name = country_raw.strip()
+    else:
+        country_name = ""
 
-    for record in records:
-        timeline = parse_submission_period_dates(
-            str(record.get("submission_period_dates") or ""),
-            fallback_now=current_time,
-        )
-        if timeline is None:
-            continue
+    location_parts = [part for part in (city, state, country_name) if part]
+    return ", ".join(location_parts) if location_parts else "Location TBD"
 
-        # Skip events where submissions have closed
-        if timeline.final_submission_date < current_time:
-            continue
 
-        location = record.get("displayed_location") or {}
-        format_value = _derive_devpost_format(location)
-        location_text = _derive_devpost_location_text(format_value, location)
-        organizer_name = str(record.get("organization_name") or "").strip().lower()
-        organizer_past_events = max(organizer_counts.get(organizer_name, 1) - 1, 0)
-
-        normalized_records.append(
-            {
-                "id": f"devpost-{record.get('id')}",
-                "title": str(record.get("title") or "Untitled Hackathon"),
-                "url": str(record.get("url") or "https://devpost.com/hackathons"),
-                "source_platform": "Devpost",
-                "format": format_value,
-                "location_text": location_text,
-                "latitude": None,
-                "longitude": None,
-                "start_date": timeline.start_date.isoformat(),
-                "final_submission_date": timeline.final_submission_date.isoformat(),
-                "days_to_final": timeline.days_to_final,
-                "themes": _extract_themes(record),
-                "organizer_past_events": organizer_past_events,
-                "prizes": _derive_devpost_prize_categories(record),
-                "created_at": current_time.isoformat(),
-            }
-        )
-
-    return normalized_records
-
-
-def normalize_devfolio_hackathons(
-    records: List[Dict[str, Any]], now: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
-    current_time = now or datetime.now(timezone.utc)
-    normalized_records: List[Dict[str, Any]] = []
-
-    for record in records:
-        settings = record.get("settings") if isinstance(record.get("settings"), dict) else {}
-        start_date = _parse_datetime(settings.get("reg_starts_at")) or _parse_datetime(
-            record.get("starts_at")
-        )
-        final_date = _parse_datetime(record.get("ends_at")) or _parse_datetime(
-            settings.get("reg_ends_at")
-        )
-        if start_date is None or final_date is None:
-            continue
+def _derive_devfolio_format(record: Dict[str, Any]) -> str:
+    return "Online" if record.get("is_online") else "Offline"
 
-        # Skip events where registration has closed
-        reg_end = _parse_datetime(settings.get("reg_ends_at"))
-        if reg_end is not None and reg_end < current_time:
-            continue
 
-        is_online = bool(record.get("is_online"))
-        format_value = "Online" if is_online else "Offline"
+def _derive_devfolio_location_text(record: Dict[str, Any], format_value: str) -> str:
+    if format_value == "Online":
+        return "Global"
+    return _join_address(record)
+
+
+def _derive_devfolio_url(record: Dict[str, Any]) -> str:
+    slug = str(record.get("slug") or "").strip()
+    return f"https://devfolio.co/hackathons/{slug}" if slug else "https://devfolio.co/hackathons"
 
-        # Extract location from city/state/country fields
-        if is_online:
-            location_text = "Global"
-        else:
-            city = str(record.get("city") or "").strip()
-            state = str(record.get("state") or "").strip()
-            country_raw = record.get("country")
-            country_name = ""
-            if isinstance(country_raw, dict):
-                country_name = str(country_raw.get("name") or "").strip()
-            elif isinstance(country_raw, str):
-                country_name = country_raw.strip()
-
-            location_parts = [p for p in (city, state, country_name) if p]
-            location_text = ", ".join(location_parts) if location_parts else "Location TBD"
-        event_uuid = str(record.get("uuid") or "").strip()
-        if not event_uuid:
-            continue
-        slug = str(record.get("slug") or "").strip()
-        url = (
-            f"https://devfolio.co/hackathons/{slug}"
-            if slug
-            else "https://devfolio.co/hackathons"
-        )
-
-        normalized_records.append(
-            {
-                "id": f"devfolio-{event_uuid}",
-                "title": str(record.get("name") or "Untitled Hackathon"),
-                "url": url,
-                "source_platform": "Devfolio",
-                "format": format_value,
-                "location_text": location_text,
-                "latitude": None,
-                "longitude": None,
-                "start_date": _to_utc_iso(start_date),
-                "final_submission_date": _to_utc_iso(final_date),
-                "days_to_final": _days_between(start_date, final_date),
-                "themes": _extract_devfolio_themes(record),
-                "organizer_past_events": 0,
-                "prizes": ["Unspecified"],
-                "created_at": current_time.isoformat(),
-            }
-        )
-
-    return normalized_records
+
+UNSTOP_IN_PERSON_KEYWORDS = KeywordMatcher({"offline": True, "in-person": True})
 
 
 def _derive_unstop_format(record: Dict[str, Any]) -> str:
     region = str(record.get("region") or "").strip().lower()
-    details = _strip_html(str(record.get("details") or "")).lower()
 
     if "hybrid" in region:
         return "Hybrid"
-    if "online" in region and ("offline" in details or "in-person" in details):
-        return "Hybrid"
     if "online" in region:
+        # Only an online listing's details can change the answer.
+        details = str(record.get("details") or "")
+        if contains_any(details, UNSTOP_IN_PERSON_KEYWORDS):
+            return "Hybrid"
         return "Online"
-    if "offline" in region or "in-person" in details or "campus" in details:
-        return "Offline"
     return "Offline"
 
 
@@ -319,19 +211,7 @@ def _derive_unstop_location_text(record: Dict[str, Any], format_value: str) -> s
         if isinstance(record.get("address_with_country_logo"), dict)
         else {}
     )
-    city = str(address.get("city") or "").strip()
-    state = str(address.get("state") or "").strip()
-    country_raw = address.get("country")
-    if isinstance(country_raw, dict):
-        country_name = str(country_raw.get("name") or "").strip()
-    elif isinstance(country_raw, str):
-        country_name = country_raw.strip()
-    else:
-        country_name = ""
-
-    location_parts = [p for p in (city, state, country_name) if p]
-    compact = [part for part in location_parts if part]
-    return ", ".join(compact) if compact else "Location TBD"
+    return _join_address(address)
 
 
 def _derive_unstop_prizes(record: Dict[str, Any]) -> List[str]:
@@ -362,79 +242,14 @@ def _derive_unstop_themes(record: Dict[str, Any]) -> List[str]:
     return _dedupe_preserving_order(themes)
 
 
-def normalize_unstop_hackathons(
-    records: List[Dict[str, Any]], now: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
-    current_time = now or datetime.now(timezone.utc)
-    organizer_counts = Counter(
-        str((record.get("organisation") or {}).get("name") or "").strip().lower()
-        for record in records
-        if isinstance(record.get("organisation"), dict)
-        and str((record.get("organisation") or {}).get("name") or "").strip()
-    )
-    normalized_records: List[Dict[str, Any]] = []
-
-    for record in records:
-        regn = record.get("regnRequirements") if isinstance(record.get("regnRequirements"), dict) else {}
-        start_date = _parse_datetime(regn.get("start_regn_dt")) or _parse_datetime(
-            record.get("approved_date")
-        ) or _parse_datetime(record.get("updated_at"))
-        final_date = _parse_datetime(record.get("end_date")) or _parse_datetime(
-            regn.get("end_regn_dt")
-        )
-        if start_date is None or final_date is None:
-            continue
-
-        # Skip events where registration has closed
-        reg_end_date = _parse_datetime(regn.get("end_regn_dt"))
-        if reg_end_date is not None and reg_end_date < current_time:
-            continue
-
-        identifier = str(record.get("id") or "").strip()
-        if not identifier:
-            continue
-
-        seo_url = str(record.get("seo_url") or "").strip()
-        public_url = str(record.get("public_url") or "").strip()
-        if seo_url.startswith("http://") or seo_url.startswith("https://"):
-            event_url = seo_url
-        elif public_url:
-            event_url = urljoin("https://unstop.com/", public_url.lstrip("/"))
-        else:
-            event_url = "https://unstop.com/hackathons"
-
-        format_value = _derive_unstop_format(record)
-        location_text = _derive_unstop_location_text(record, format_value)
-        organizer_name = (
-            str((record.get("organisation") or {}).get("name") or "").strip().lower()
-            if isinstance(record.get("organisation"), dict)
-            else ""
-        )
-        organizer_past_events = max(organizer_counts.get(organizer_name, 1) - 1, 0)
-
-        normalized_records.append(
-            {
-                "id": f"unstop-{identifier}",
-                "title": str(record.get("title") or "Untitled Hackathon"),
-                "url": event_url,
-                "source_platform": "Unstop",
-                "format": format_value,
-                "location_text": location_text,
-                "latitude": None,
-                "longitude": None,
-                "start_date": _to_utc_iso(start_date),
-                "final_submission_date": _to_utc_iso(final_date),
-                "days_to_final": _days_between(start_date, final_date),
-                "themes": _derive_unstop_themes(record),
-                "organizer_past_events": organizer_past_events,
-                "prizes": _derive_unstop_prizes(record),
-                "created_at": (
-                    _parse_datetime(record.get("updated_at")) or current_time
-                ).isoformat(),
-            }
-        )
-
-    return normalized_records
+def _derive_unstop_url(record: Dict[str, Any]) -> str:
+    seo_url = str(record.get("seo_url") or "").strip()
+    public_url = str(record.get("public_url") or "").strip()
+    if seo_url.startswith("http://") or seo_url.startswith("https://"):
+        return seo_url
+    if public_url:
+        return urljoin("https://unstop.com/", public_url.lstrip("/"))
+    return "https://unstop.com/hackathons"
 
 
 def _derive_mlh_format(record: Dict[str, Any]) -> str:
@@ -462,104 +277,126 @@ def _derive_mlh_location_text(record: Dict[str, Any], format_value: str) -> str:
     return ", ".join(compact) if compact else "Location TBD"
 
 
-def normalize_mlh_hackathons(
-    records: List[Dict[str, Any]], now: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
-    current_time = now or datetime.now(timezone.utc)
-    normalized_records: List[Dict[str, Any]] = []
-    for record in records:
-        start_date = _parse_datetime(record.get("starts_at"))
-        final_date = _parse_datetime(record.get("ends_at"))
-        if start_date is None or final_date is None:
-            continue
-
-        # Skip events that have already ended
-        if final_date < current_time:
-            continue
-
-        identifier = str(record.get("id") or "").strip()
-        if not identifier:
-            continue
-
-        website_url = str(record.get("website_url") or "").strip()
-        path_url = str(record.get("url") or "").strip()
-        event_url = (
-            website_url
-            if website_url.startswith("http://") or website_url.startswith("https://")
-            else urljoin("https://mlh.io/", path_url.lstrip("/"))
-        )
-
-        format_value = _derive_mlh_format(record)
-        normalized_records.append(
-            {
-                "id": f"mlh-{identifier}",
-                "title": str(record.get("name") or "Untitled Hackathon"),
-                "url": event_url,
-                "source_platform": "MLH",
-                "format": format_value,
-                "location_text": _derive_mlh_location_text(record, format_value),
-                "latitude": None,
-                "longitude": None,
-                "start_date": _to_utc_iso(start_date),
-                "final_submission_date": _to_utc_iso(final_date),
-                "days_to_final": _days_between(start_date, final_date),
-                "themes": [],
-                "organizer_past_events": 0,
-                "prizes": ["Unspecified"],
-                "created_at": current_time.isoformat(),
-            }
-        )
-    return normalized_records
-
-
-def normalize_hackerearth_hackathons(
-    records: List[Dict[str, Any]], now: Optional[datetime] = None
-) -> List[Dict[str, Any]]:
-    current_time = now or datetime.now(timezone.utc)
-    organizer_counts = Counter(
-        str(record.get("organizer") or "").strip().lower()
-        for record in records
-        if str(record.get("organizer") or "").strip()
-    )
-    normalized_records: List[Dict[str, Any]] = []
-    for record in records:
-        identifier = str(record.get("id") or "").strip()
-        if not identifier:
-            continue
-        try:
-            start_unix = int(record.get("start_unix"))
-            final_unix = int(record.get("final_submission_unix"))
-        except Exception:
-            continue
-        start_date = datetime.fromtimestamp(start_unix, tz=timezone.utc)
-        final_date = datetime.fromtimestamp(final_unix, tz=timezone.utc)
-        if final_date < start_date:
-            continue
-
-        # Skip events where the submission deadline has passed
-        if final_date < current_time:
-            continue
-
-        organizer_name = str(record.get("organizer") or "").strip().lower()
-        organizer_past_events = max(organizer_counts.get(organizer_name, 1) - 1, 0)
-
-        normalized_records.append(
-            {
-                "id": f"hackerearth-{identifier}",
-                "title": str(record.get("title") or "Untitled Hackathon"),
-                "url": str(record.get("url") or "https://www.hackerearth.com/challenges/hackathon/"),
-                "source_platform": "HackerEarth",
-                "format": "Online",
-                "location_text": "Global",
-                "latitude": None,
-                "longitude": None,
-                "start_date": _to_utc_iso(start_date),
-                "final_submission_date": _to_utc_iso(final_date),
-                "days_to_final": _days_between(start_date, final_date),
-                "themes": [],
-                "organizer_past_events": organizer_past_events,
-                "prizes": ["Unspecified"],
-                "created_at": current_time.isoformat(),
-            }
-        )
-    return normalized_records
+def _derive_mlh_url(record: Dict[str, Any]) -> str:
+    website_url = str(record.get("website_url") or "").strip()
+    if website_url.startswith("http://") or website_url.startswith("https://"):
+        return website_url
+    path_url = str(record.get("url") or "").strip()
+    return urljoin("https://mlh.io/", path_url.lstrip("/"))
+
+
+DEVPOST_SPEC = SourceSpec(
+    key="devpost",
+    source_platform="Devpost",
+    id_path=("id",),
+    id_required=False,
+    title=TextField(("title",), "Untitled Hackathon"),
+    url=TextField(("url",), "https://devpost.com/hackathons"),
+    period_path=("submission_period_dates",),
+    # Skip events where submissions have closed
+    skip_ended=True,
+    format=_derive_devpost_format,
+    location_text=_derive_devpost_location_text,
+    themes=_extract_themes,
+    prizes=_derive_devpost_prize_categories,
+    organizer_path=("organization_name",),
+)
+
+DEVFOLIO_SPEC = SourceSpec(
+    key="devfolio",
+    source_platform="Devfolio",
+    id_path=("uuid",),
+    title=TextField(("name",), "Untitled Hackathon"),
+    url=_derive_devfolio_url,
+    start_paths=(("settings", "reg_starts_at"), ("starts_at",)),
+    final_paths=(("ends_at",), ("settings", "reg_ends_at")),
+    # Skip events where registration has closed
+    closes_at_path=("settings", "reg_ends_at"),
+    format=_derive_devfolio_format,
+    location_text=_derive_devfolio_location_text,
+    themes=_extract_devfolio_themes,
+)
+
+UNSTOP_SPEC = SourceSpec(
+    key="unstop",
+    source_platform="Unstop",
+    id_path=("id",),
+    title=TextField(("title",), "Untitled Hackathon"),
+    url=_derive_unstop_url,
+    start_paths=(("regnRequirements", "start_regn_dt"), ("approved_date",), ("updated_at",)),
+    final_paths=(("end_date",), ("regnRequirements", "end_regn_dt")),
+    # Skip events where registration has closed
+    closes_at_path=("regnRequirements", "end_regn_dt"),
+    format=_derive_unstop_format,
+    location_text=_derive_unstop_location_text,
+    themes=_derive_unstop_themes,
+    prizes=_derive_unstop_prizes,
+    organizer_path=("organisation", "name"),
+    created_at_path=("updated_at",),
+)
+
+MLH_SPEC = SourceSpec(
+    key="mlh",
+    source_platform="MLH",
+    id_path=("id",),
+    title=TextField(("name",), "Untitled Hackathon"),
+    url=_derive_mlh_url,
+    start_paths=(("starts_at",),),
+    final_paths=(("ends_at",),),
+    # Skip events that have already ended
+    skip_ended=True,
+    format=_derive_mlh_format,
+    location_text=_derive_mlh_location_text,
+)
+
+HACKEREARTH_SPEC = SourceSpec(
+    key="hackerearth",
+    source_platform="HackerEarth",
+    id_path=("id",),
+    title=TextField(("title",), "Untitled Hackathon"),
+    url=TextField(("url",), "https://www.hackerearth.com/challenges/hackathon/"),
+    start_paths=(("start_unix",),),
+    final_paths=(("final_submission_unix",),),
+    date_format="unix",
+    skip_reversed=True,
+    # Skip events where the submission deadline has passed
+    skip_ended=True,
+    format=lambda record: "Online",
+    location_text=lambda record, format_value: "Global",
+    organizer_path=("organizer",),
+)
+
+normalize_devpost_hackathons = compile_normalizer(DEVPOST_SPEC)
+normalize_devfolio_hackathons = compile_normalizer(DEVFOLIO_SPEC)
+normalize_unstop_hackathons = compile_normalizer(UNSTOP_SPEC)
+normalize_mlh_hackathons = compile_normalizer(MLH_SPEC)
+normalize_hackerearth_hackathons = compile_normalizer(HACKEREARTH_SPEC)
+
+SOURCE_SPECS: Dict[str, SourceSpec] = {
+    spec.key: spec
+    for spec in (DEVPOST_SPEC, DEVFOLIO_SPEC, HACKEREARTH_SPEC, UNSTOP_SPEC, MLH_SPEC)
+}
+_ROW_NORMALIZERS = {
+    "devpost": normalize_devpost_hackathons,
+    "devfolio": normalize_devfolio_hackathons,
+    "hackerearth": normalize_hackerearth_hackathons,
+    "unstop": normalize_unstop_hackathons,
+    "mlh": normalize_mlh_hackathons,
+}
+_COLUMNAR_NORMALIZERS = (
+    {key: compile_columnar_normalizer(spec) for key, spec in SOURCE_SPECS.items()}
+    if NUMPY_AVAILABLE
+    else {}
+)
+
+
+def normalize_batch(
+    source: str, records: List[Dict[str, Any]], now: Optional[datetime] = None
+) -> List[HackathonRecord]:
+    """Normalize a large batch of raw ``source`` records, e.g. for a replay.
+
+    Uses the columnar NumPy path when NumPy is installed and the row
+    normalizer otherwise; both produce the same records.
+    """
+    normalizer = _COLUMNAR_NORMALIZERS.get(source) or _ROW_NORMALIZERS[source]
+    return normalizer(records, now=now)
@@ -0,0 +1,142 @@
+"""
+Benchmark columnar (NumPy) normalization against the row normalizers.
+
+Replays a synthetic backlog of Unstop, Devfolio and MLH records, shaped like
+the real listings and with the repetition a replay of many crawls has, through
+both paths, checks that they produce the same records and prints the timings.
+Requires numpy.
+
+Usage: python scripts/bench_columnar_normalize.py [--records 300000] [--distinct-dates 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.columnar import NUMPY_AVAILABLE, compile_columnar_normalizer
+    from app.ingestion.normalizer_spec import compile_normalizer
+    from app.ingestion.transformers import SOURCE_SPECS
+except ModuleNotFoundError:
+    from ingestion.columnar import (  # type: ignore[no-redef]
+        NUMPY_AVAILABLE,
+        compile_columnar_normalizer,
+    )
+    from ingestion.normalizer_spec import compile_normalizer  # type: ignore[no-redef]
+    from ingestion.transformers import SOURCE_SPECS  # type: ignore[no-redef]
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _date_pool(rng: random.Random, size: int) -> List[str]:
+    pool = []
+    for _ in range(size):
+        moment = NOW + timedelta(minutes=rng.randint(-60 * 24 * 90, 60 * 24 * 120))
+        style = rng.randrange(3)
+        if style == 0:
+            pool.append(moment.astimezone(timezone(timedelta(hours=5, minutes=30))).isoformat())
+        elif style == 1:
+            pool.append(moment.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        else:
+            pool.append(moment.strftime("%Y-%m-%d %H:%M:%S"))
+    return pool
+
+
+def _records(source: str, count: int, dates: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    records = []
+    for index in range(count):
+        start, end, closes = rng.choice(dates), rng.choice(dates), rng.choice(dates)
+        if source == "unstop":
+            records.append(
+                {
+                    "id": index,
+                    "title": f"Event {index}",
+                    "region": rng.choice(["online", "offline"]),
+                    "details": "Offline campus finals",
+                    "public_url": f"hackathons/event-{index}",
+                    "updated_at": start,
+                    "end_date": end,
+                    "organisation": {"name": f"Org {index % 300}"},
+                    "prizes": [{"cash": index % 3}],
+                    "required_skills": [{"skill_name": "Machine Learning"}],
+                    "regnRequirements": {"start_regn_dt": start, "end_regn_dt": closes},
+                }
+            )
+        elif source == "devfolio":
+            records.append(
+                {
+                    "uuid": f"uuid-{index}",
+                    "name": f"Event {index}",
+                    "slug": f"event-{index}",
+                    "is_online": index % 2 == 0,
+                    "city": "Pune",
+                    "settings": {"reg_starts_at": start, "reg_ends_at": closes},
+                    "ends_at": end,
+                }
+            )
+        else:
+            records.append(
+                {
+                    "id": f"mlh-{index}",
+                    "name": f"Event {index}",
+                    "starts_at": start,
+                    "ends_at": end,
+                    "url": f"/events/{index}",
+                    "format_type": "physical",
+                    "location": "Urbana, Illinois",
+                }
+            )
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=300_000)
+    parser.add_argument("--distinct-dates", type=int, default=5000)
+    args = parser.parse_args()
+    if not NUMPY_AVAILABLE:
+        raise SystemExit("numpy is not installed")
+
+    rng = random.Random(7)
+    dates = _date_pool(rng, max(args.distinct_dates, 1))
+    per_source = max(args.records // 3, 1)
+    results: Dict[str, Any] = {"records": per_source * 3, "distinct_dates": len(dates)}
+    row_total = columnar_total = 0.0
+    for source in ("unstop", "devfolio", "mlh"):
+        records = _records(source, per_source, dates, rng)
+        row_normalize = compile_normalizer(SOURCE_SPECS[source])
+        columnar_normalize = compile_columnar_normalizer(SOURCE_SPECS[source])
+
+        started = time.perf_counter()
+        row_output = row_normalize(records, now=NOW)
+        row_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        columnar_output = columnar_normalize(records, now=NOW)
+        columnar_seconds = time.perf_counter() - started
+
+        if row_output != columnar_output:
+            raise SystemExit(f"{source}: columnar output differs from the row normalizer")
+        results[f"{source}_row_seconds"] = round(row_seconds, 3)
+        results[f"{source}_columnar_seconds"] = round(columnar_seconds, 3)
+        row_total += row_seconds
+        columnar_total += columnar_seconds
+
+    results["speedup"] = round(row_total / columnar_total, 2) if columnar_total else None
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark the Devfolio __NEXT_DATA__ candidate walker.
+
+Builds a synthetic multi-MB payload shaped like the Devfolio hackathons page
+(several dehydrated queries whose hackathon lists overlap) and times the
+candidate walk against the previous recursive walker, which visited every
+preferred list twice. Both walk the same parsed payload, so JSON decoding
+and locating the script tag are reported separately as end-to-end time.
+
+Usage: python scripts/bench_devfolio_walker.py [--hackathons 4000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.connectors.devfolio import (
+        QUERY_DATA_PATH,
+        _iter_hackathon_candidates,
+        _resolve_path,
+        extract_devfolio_hackathons_from_html,
+    )
+except ModuleNotFoundError:
+    from ingestion.connectors.devfolio import (  # type: ignore[no-redef]
+        QUERY_DATA_PATH,
+        _iter_hackathon_candidates,
+        _resolve_path,
+        extract_devfolio_hackathons_from_html,
+    )
+
+
+def _legacy_candidates(value: Any) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    if isinstance(value, list):
+        for item in value:
+            results.extend(_legacy_candidates(item))
+        return results
+    if not isinstance(value, dict):
+        return results
+    if str(value.get("uuid") or "").strip():
+        results.append(value)
+        return results
+    for key in ("open_hackathons", "featured_hackathons", "hackathons", "all_hackathons"):
+        nested = value.get(key)
+        if isinstance(nested, list):
+            results.extend(_legacy_candidates(nested))
+    for nested in value.values():
+        if isinstance(nested, (dict, list)):
+            results.extend(_legacy_candidates(nested))
+    return results
+
+
+def _legacy_walk(roots: List[Any]) -> List[Dict[str, Any]]:
+    records: List[Dict[str, Any]] = []
+    seen = set()
+    for data in roots:
+        for event in _legacy_candidates(data):
+            uuid = str(event.get("uuid") or "").strip()
+            if uuid and uuid not in seen:
+                seen.add(uuid)
+                records.append(event)
+    return records
+
+
+def _walk(roots: List[Any]) -> List[Dict[str, Any]]:
+    seen: set = set()
+    records: List[Dict[str, Any]] = []
+    for data in roots:
+        records.extend(_iter_hackathon_candidates(data, seen))
+    return records
+
+
+def _build_html(hackathon_count: int) -> str:
+    def hackathon(index: int) -> Dict[str, Any]:
+        return {
+            "uuid": f"uuid-{index}",
+            "name": f"Hackathon {index}",
+            "slug": f"hackathon-{index}",
+            "tagline": "Build something " * 8,
+            "themes": [{"name": f"Theme {index % 17}"}, {"name": "Open Innovation"}],
+            "settings": {"site": f"https://hackathon-{index}.devfolio.co"},
+        }
+
+    hackathons = [hackathon(index) for index in range(hackathon_count)]
+    half = hackathon_count // 2
+    queries = [
+        {
+            "queryKey": ["hackathons", "open"],
+            "state": {
+                "data": {
+                    "open_hackathons": hackathons[:half],
+                    "featured_hackathons": hackathons[half // 2 : half],
+                    "meta": {"pages": {"nested": [{"filters": ["a", "b"]}] * 50}},
+                }
+            },
+        },
+        {
+            "queryKey": ["hackathons", "all"],
+            "state": {"data": {"hackathons": hackathons, "all_hackathons": hackathons[half:]}},
+        },
+    ]
+    payload = {"props": {"pageProps": {"dehydratedState": {"queries": queries}}}}
+    return (
+        '<html><body><script id="__NEXT_DATA__" type="application/json">'
+        + json.dumps(payload)
+        + "</script></body></html>"
+    )
+
+
+def _best_of(repeat: int, function: Any, argument: Any) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hackathons", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = _build_html(args.hackathons)
+    start = html.index(">", html.index('id="__NEXT_DATA__"')) + 1
+    payload = json.loads(html[start : html.index("</script>", start)])
+    roots = _resolve_path(payload, QUERY_DATA_PATH)
+
+    current = _walk(roots)
+    if [item["uuid"] for item in current] != [item["uuid"] for item in _legacy_walk(roots)]:
+        raise SystemExit("walker output differs from the legacy walker")
+    if len(extract_devfolio_hackathons_from_html(html)) != len(current):
+        raise SystemExit("extractor output differs from the walker")
+
+    legacy_seconds = _best_of(args.repeat, _legacy_walk, roots)
+    walker_seconds = _best_of(args.repeat, _walk, roots)
+    end_to_end_seconds = _best_of(args.repeat, extract_devfolio_hackathons_from_html, html)
+    print(
+        json.dumps(
+            {
+                "payload_mb": round(len(html) / (1024 * 1024), 2),
+                "hackathons": len(current),
+                "legacy_walk_seconds": round(legacy_seconds, 4),
+                "walk_seconds": round(walker_seconds, 4),
+                "walk_speedup": round(legacy_seconds / walker_seconds, 2) if walker_seconds else None,
+                "extract_end_to_end_seconds": round(end_to_end_seconds, 4),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
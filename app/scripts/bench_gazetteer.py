@@ -0,0 +1,148 @@
+"""
+Benchmark the offline gazetteer: index size, open time and lookup latency.
+
+Without --index, builds an index from a synthetic GeoNames-style dump with
+--places cities (with admin1 areas, countries and alternate names) in a
+temporary directory. Then resolves a mix of "City", "City, State",
+"City, State, Country", venue-prefixed and unknown location strings and
+reports the resolve rate and per-lookup latency.
+
+Usage: python scripts/bench_gazetteer.py [--places 30000] [--lookups 50000] [--index data/gazetteer.bin]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.gazetteer import (
+        Gazetteer,
+        read_admin1_codes,
+        read_country_info,
+        read_geonames_cities,
+        write_gazetteer,
+    )
+except ModuleNotFoundError:
+    from ingestion.gazetteer import (  # type: ignore[no-redef]
+        Gazetteer,
+        read_admin1_codes,
+        read_country_info,
+        read_geonames_cities,
+        write_gazetteer,
+    )
+
+COUNTRIES = [("IN", "IND", "India"), ("US", "USA", "United States"), ("GB", "GBR", "United Kingdom"),
+             ("DE", "DEU", "Germany"), ("CA", "CAN", "Canada"), ("BR", "BRA", "Brazil")]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))).title()
+
+
+def _synthetic_dump(rng: random.Random, places: int) -> Tuple[List[str], List[str], List[str], List[Tuple[str, str, str]]]:
+    admin1 = {code: [(f"{code}.{index:02d}", _word(rng)) for index in range(30)] for code, _, _ in COUNTRIES}
+    city_names = [_word(rng) for _ in range(max(places // 3, 1))]
+    city_lines: List[str] = []
+    samples: List[Tuple[str, str, str]] = []
+    for geonameid in range(places):
+        country, _, country_name = rng.choice(COUNTRIES)
+        admin1_key, admin1_name = rng.choice(admin1[country])
+        name = rng.choice(city_names)
+        alternates = ",".join([_word(rng), f"{name}pur", "XYZ"])
+        city_lines.append(
+            "\t".join(
+                [str(geonameid), name, name, alternates, f"{rng.uniform(-60, 60):.5f}",
+                 f"{rng.uniform(-170, 170):.5f}", "P", "PPL", country, "", admin1_key.split(".")[1],
+                 "", "", "", str(rng.randint(15000, 5_000_000)), "", "0", "UTC", "2024-01-01"]
+            )
+        )
+        samples.append((name, admin1_name, country_name))
+    admin1_lines = [f"{key}\t{name}\t{name}\t0" for entries in admin1.values() for key, name in entries]
+    country_lines = [f"{code}\t{iso3}\t0\tXX\t{name}" for code, iso3, name in COUNTRIES]
+    return city_lines, admin1_lines, country_lines, samples
+
+
+def _queries(rng: random.Random, samples: List[Tuple[str, str, str]], count: int) -> List[str]:
+    queries = []
+    for _ in range(count):
+        city, state, country = rng.choice(samples)
+        shape = rng.randrange(5)
+        if shape == 0:
+            queries.append(city)
+        elif shape == 1:
+            queries.append(f"{city}, {state}")
+        elif shape == 2:
+            queries.append(f"{city}, {state}, {country}")
+        elif shape == 3:
+            queries.append(f"{_word(rng)} Institute of Technology, {city}, {country}")
+        else:
+            queries.append(f"{_word(rng)} {_word(rng)}, {_word(rng)}")
+    return queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--places", type=int, default=30_000)
+    parser.add_argument("--lookups", type=int, default=50_000)
+    parser.add_argument("--index", type=Path, help="Benchmark an existing index instead.")
+    parser.add_argument("--queries", type=Path, help="Location strings to resolve, one per line.")
+    args = parser.parse_args()
+
+    rng = random.Random(9)
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index_path: Optional[Path] = args.index
+        samples: List[Tuple[str, str, str]] = []
+        if index_path is None:
+            city_lines, admin1_lines, country_lines, samples = _synthetic_dump(rng, args.places)
+            index_path = Path(temp_dir) / "gazetteer.bin"
+            started = time.perf_counter()
+            results.update(
+                write_gazetteer(
+                    index_path,
+                    read_geonames_cities(city_lines),
+                    admin1_names=read_admin1_codes(admin1_lines),
+                    country_names=read_country_info(country_lines),
+                )
+            )
+            results["build_seconds"] = round(time.perf_counter() - started, 3)
+
+        if args.queries is not None:
+            queries = [line.strip() for line in args.queries.read_text(encoding="utf-8").splitlines() if line.strip()]
+        elif samples:
+            queries = _queries(rng, samples, args.lookups)
+        else:
+            raise SystemExit("--queries is required with --index")
+
+        started = time.perf_counter()
+        gazetteer = Gazetteer(index_path)
+        results["open_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        results["index_bytes"] = index_path.stat().st_size
+
+        started = time.perf_counter()
+        resolved = sum(1 for query in queries if gazetteer.resolve(query) is not None)
+        seconds = time.perf_counter() - started
+        gazetteer.close()
+
+    results["lookups"] = len(queries)
+    results["resolved_fraction"] = round(resolved / len(queries), 3) if queries else None
+    results["microseconds_per_lookup"] = round(seconds / len(queries) * 1e6, 2) if queries else None
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark KeywordMatcher against per-keyword ``in`` loops.
+
+Matches location-like strings against the geocoder's fallback cities and
+against --keywords synthetic place names (the size a bundled alias table
+could grow to), checking both give the same answers.
+
+Usage: python scripts/bench_keywords.py [--keywords 5000] [--texts 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.geocoding import FALLBACK_COORDINATES
+    from app.ingestion.keywords import KeywordMatcher
+except ModuleNotFoundError:
+    from ingestion.geocoding import FALLBACK_COORDINATES  # type: ignore[no-redef]
+    from ingestion.keywords import KeywordMatcher  # type: ignore[no-redef]
+
+
+def _legacy_first(keywords: Dict[str, Tuple[float, float]], text: str) -> Optional[Tuple[float, float]]:
+    for key, value in keywords.items():
+        if key in text:
+            return value
+    return None
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+
+def _time(func: Callable[[str], object], texts: List[str]) -> Tuple[float, List[object]]:
+    started = time.perf_counter()
+    answers = [func(text) for text in texts]
+    return time.perf_counter() - started, answers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keywords", type=int, default=5000)
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(23)
+    large = {_word(rng): (rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(args.keywords)}
+    results = {}
+    for label, keywords in (("fallback", dict(FALLBACK_COORDINATES)), ("large", large)):
+        names = list(keywords)
+        texts = [
+            f"{_word(rng)} campus, {rng.choice(names) if rng.random() < 0.5 else _word(rng)}, {_word(rng)}"
+            for _ in range(args.texts)
+        ]
+        matcher = KeywordMatcher(keywords)
+        legacy_seconds, expected = _time(lambda text: _legacy_first(keywords, text), texts)
+        seconds, answers = _time(matcher.first, texts)
+        if answers != expected:
+            raise SystemExit(f"{label}: matcher disagrees with the legacy loop")
+        results[label] = {
+            "keywords": len(keywords),
+            "legacy_microseconds": round(legacy_seconds / len(texts) * 1e6, 2),
+            "matcher_microseconds": round(seconds / len(texts) * 1e6, 2),
+            "speedup": round(legacy_seconds / seconds, 2),
+        }
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
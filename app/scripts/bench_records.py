@@ -0,0 +1,200 @@
+"""
+Benchmark slotted HackathonRecords against the dict records they replaced.
+
+Builds a synthetic crawl's worth of normalized records both ways, then
+measures the memory they hold and the time of the post-normalization stages
+(expiry filter, SQLite upsert into an in-memory database, JSON
+serialization). The dict side uses copies of the previous pipeline code, and
+both sides are checked to write the same rows and JSON.
+
+Usage: python scripts/bench_records.py [--records 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.pipeline import (
+        _drop_expired,
+        _ensure_schema,
+        _serialize_for_json,
+        _upsert_records,
+    )
+    from app.ingestion.record import FIELDS, HackathonRecord
+except ModuleNotFoundError:
+    from ingestion.pipeline import (  # type: ignore[no-redef]
+        _drop_expired,
+        _ensure_schema,
+        _serialize_for_json,
+        _upsert_records,
+    )
+    from ingestion.record import FIELDS, HackathonRecord  # type: ignore[no-redef]
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+PLATFORMS = ["Devpost", "Devfolio", "Unstop", "MLH", "HackerEarth"]
+LOCATIONS = ["Online", "Bengaluru, Karnataka, India", "Urbana, Illinois", "London, UK"]
+THEMES = [[], ["AI/ML"], ["AI/ML", "Open Source"], ["Web3"], ["General"]]
+PRIZES = [["Cash"], ["Cash", "Swag"], ["Unspecified"], ["Job/Internship"]]
+
+
+def _legacy_drop_expired(records: List[Dict[str, Any]], current_time: datetime) -> List[Dict[str, Any]]:
+    active = []
+    for record in records:
+        try:
+            fsd = datetime.fromisoformat(str(record.get("final_submission_date", "")))
+            if fsd.tzinfo is None:
+                fsd = fsd.replace(tzinfo=timezone.utc)
+            if fsd < current_time:
+                continue
+        except (ValueError, TypeError):
+            pass
+        active.append(record)
+    return active
+
+
+def _legacy_upsert(connection: sqlite3.Connection, records: List[Dict[str, Any]]) -> int:
+    columns = ", ".join(FIELDS)
+    placeholders = ", ".join(f":{column}" for column in FIELDS)
+    statement = f"INSERT OR REPLACE INTO hackathons ({columns}, is_active) VALUES ({placeholders}, 1)"
+    cursor = connection.cursor()
+    for record in records:
+        params = dict(record)
+        params["days_to_final"] = int(record["days_to_final"])
+        params["themes"] = json.dumps(record.get("themes", []))
+        params["organizer_past_events"] = int(record.get("organizer_past_events", 0))
+        params["prizes"] = json.dumps(record.get("prizes", []))
+        cursor.execute(statement, params)
+    connection.commit()
+    return len(records)
+
+
+def _legacy_serialize(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": record["id"],
+            "title": record["title"],
+            "url": record["url"],
+            "sourcePlatform": record["source_platform"],
+            "format": record["format"],
+            "locationText": record["location_text"],
+            "coordinates": (
+                {"lat": record["latitude"], "lng": record["longitude"]}
+                if record.get("latitude") is not None and record.get("longitude") is not None
+                else None
+            ),
+            "startDate": record["start_date"],
+            "finalSubmissionDate": record["final_submission_date"],
+            "daysToFinal": record["days_to_final"],
+            "themes": record.get("themes", []),
+            "organizerPastEvents": record.get("organizer_past_events", 0),
+            "prizes": record.get("prizes", []),
+            "createdAt": record["created_at"],
+        }
+        for record in records
+    ]
+
+
+def _raw_rows(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    rows = []
+    for index in range(count):
+        start = NOW + timedelta(days=rng.randint(-30, 60))
+        final = start + timedelta(days=rng.randint(0, 30))
+        location = rng.choice(LOCATIONS)
+        rows.append(
+            {
+                "id": f"event-{index}",
+                "title": f"Event {index}",
+                "url": f"https://example.com/events/{index}",
+                # Built per record, as the transformers do, so equal values are
+                # separate objects unless something interns them.
+                "source_platform": "".join(rng.choice(PLATFORMS)),
+                "format": "Online" if location == "Online" else "Offline",
+                "location_text": " ".join(location.split(" ")),
+                "latitude": None,
+                "longitude": None,
+                "start_date": start.isoformat(),
+                "final_submission_date": final.isoformat(),
+                "days_to_final": (final - start).days,
+                "themes": list(rng.choice(THEMES)),
+                "organizer_past_events": rng.randint(0, 3),
+                "prizes": list(rng.choice(PRIZES)),
+                "created_at": NOW.isoformat(),
+            }
+        )
+    return rows
+
+
+def _measure(build: Callable[[], List[Any]]) -> Any:
+    gc.collect()
+    tracemalloc.start()
+    records = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, size
+
+
+def _stages(records, drop, upsert, serialize) -> Any:
+    connection = sqlite3.connect(":memory:")
+    _ensure_schema(connection)
+    started = time.perf_counter()
+    active = drop(records, NOW)
+    upsert(connection, active)
+    output = json.dumps(serialize(active))
+    seconds = time.perf_counter() - started
+    rows = connection.execute("SELECT * FROM hackathons ORDER BY id").fetchall()
+    connection.close()
+    return seconds, rows, output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    raw = _raw_rows(args.records, rng)
+    dicts, dict_bytes = _measure(lambda: [dict(row) for row in raw])
+    slotted, record_bytes = _measure(lambda: [HackathonRecord.from_mapping(row) for row in raw])
+
+    dict_seconds, dict_rows, dict_json = _stages(
+        dicts, _legacy_drop_expired, _legacy_upsert, _legacy_serialize
+    )
+    record_seconds, record_rows, record_json = _stages(
+        slotted, _drop_expired, _upsert_records, _serialize_for_json
+    )
+    if dict_rows != record_rows or dict_json != record_json:
+        raise SystemExit("record pipeline output differs from the dict pipeline")
+
+    print(
+        json.dumps(
+            {
+                "records": len(raw),
+                "dict_bytes_per_record": round(dict_bytes / len(raw)),
+                "record_bytes_per_record": round(record_bytes / len(raw)),
+                "dict_stage_seconds": round(dict_seconds, 3),
+                "record_stage_seconds": round(record_seconds, 3),
+                "speedup": round(dict_seconds / record_seconds, 2) if record_seconds else None,
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark the Devpost submission-period parser.
+
+Generates a batch of submission_period_dates strings in every shape Devpost
+uses (plus malformed ones), with the heavy repetition a real listing has, and
+times the previous four-regex parser against the single-grammar parser, both
+called per string and through parse_many(). Every string is checked to parse
+identically before anything is timed.
+
+Usage: python scripts/bench_timeline_parser.py [--strings 100000] [--distinct 600] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.timeline_parser import (
+        MONTH_BY_ABBREV,
+        TimelineParseResult,
+        _build_result,
+        _parse_normalized,
+        parse_many,
+        parse_submission_period_dates,
+    )
+except ModuleNotFoundError:
+    from ingestion.timeline_parser import (  # type: ignore[no-redef]
+        MONTH_BY_ABBREV,
+        TimelineParseResult,
+        _build_result,
+        _parse_normalized,
+        parse_many,
+        parse_submission_period_dates,
+    )
+
+LEGACY_FULL = re.compile(
+    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2}),\s*(?P<start_year>\d{4})\s*-\s*"
+    r"(?P<end_month>[A-Za-z]{3})\s+(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
+)
+LEGACY_MONTH_TO_MONTH = re.compile(
+    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2})\s*-\s*"
+    r"(?P<end_month>[A-Za-z]{3})\s+(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
+)
+LEGACY_SAME_MONTH = re.compile(
+    r"^(?P<start_month>[A-Za-z]{3})\s+(?P<start_day>\d{1,2})\s*-\s*(?P<end_day>\d{1,2}),\s*(?P<end_year>\d{4})$"
+)
+LEGACY_SINGLE_DAY = re.compile(r"^(?P<month>[A-Za-z]{3})\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})$")
+
+
+def _legacy_month(value: str) -> Optional[int]:
+    return MONTH_BY_ABBREV.get(value.strip().lower()[:3])
+
+
+def _legacy_parse(
+    period_text: str, fallback_now: Optional[datetime] = None
+) -> Optional[TimelineParseResult]:
+    normalized = re.sub(r"\s+", " ", period_text.strip())
+    if not normalized:
+        return None
+    match = LEGACY_FULL.match(normalized)
+    if match:
+        start_month = _legacy_month(match.group("start_month"))
+        end_month = _legacy_month(match.group("end_month"))
+        if start_month is None or end_month is None:
+            return None
+        return _build_result(
+            int(match.group("start_year")), start_month, int(match.group("start_day")),
+            int(match.group("end_year")), end_month, int(match.group("end_day")),
+        )
+    match = LEGACY_MONTH_TO_MONTH.match(normalized)
+    if match:
+        start_month = _legacy_month(match.group("start_month"))
+        end_month = _legacy_month(match.group("end_month"))
+        if start_month is None or end_month is None:
+            return None
+        end_year = int(match.group("end_year"))
+        start_year = end_year if start_month <= end_month else end_year - 1
+        return _build_result(
+            start_year, start_month, int(match.group("start_day")),
+            end_year, end_month, int(match.group("end_day")),
+        )
+    match = LEGACY_SAME_MONTH.match(normalized)
+    if match:
+        month = _legacy_month(match.group("start_month"))
+        if month is None:
+            return None
+        end_year = int(match.group("end_year"))
+        start_year = end_year if fallback_now is None else min(fallback_now.year, end_year)
+        return _build_result(
+            start_year, month, int(match.group("start_day")),
+            end_year, month, int(match.group("end_day")),
+        )
+    match = LEGACY_SINGLE_DAY.match(normalized)
+    if match:
+        month = _legacy_month(match.group("month"))
+        if month is None:
+            return None
+        year = int(match.group("year"))
+        day = int(match.group("day"))
+        return _build_result(year, month, day, year, month, day)
+    return None
+
+
+def _random_period(rng: random.Random) -> str:
+    months = [name.title() for name in MONTH_BY_ABBREV] + ["Foo"]
+    start_month, end_month = rng.choice(months), rng.choice(months)
+    start_day, end_day = rng.randint(1, 31), rng.randint(1, 31)
+    start_year = rng.choice([2025, 2026])
+    end_year = start_year + rng.choice([0, 0, 1])
+    shape = rng.randrange(6)
+    if shape == 0:
+        return f"{start_month} {start_day:02d}, {start_year} - {end_month} {end_day:02d}, {end_year}"
+    if shape == 1:
+        return f"{start_month} {start_day:02d} - {end_month} {end_day:02d}, {end_year}"
+    if shape == 2:
+        return f"{start_month} {start_day:02d} - {end_day:02d}, {end_year}"
+    if shape == 3:
+        return f"{start_month} {start_day}, {start_year}"
+    if shape == 4:
+        return f"  {start_month}  {start_day} -\n{end_day},{end_year} "
+    return rng.choice(["Rolling", "", "TBD", f"{start_month} {start_day:02d}, {start_year} - {end_day}, {end_year}"])
+
+
+def _best_of(repeat: int, function: Callable[[], Any], reset: Callable[[], None]) -> float:
+    timings = []
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strings", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    distinct = [_random_period(rng) for _ in range(max(args.distinct, 1))]
+    texts: List[str] = [rng.choice(distinct) for _ in range(args.strings)]
+    fallback_now = datetime(2025, 11, 1, tzinfo=timezone.utc)
+
+    for text in distinct:
+        if _legacy_parse(text, fallback_now) != parse_submission_period_dates(text, fallback_now):
+            raise SystemExit(f"parsers disagree on {text!r}")
+
+    no_reset = lambda: None  # noqa: E731
+    legacy_seconds = _best_of(
+        args.repeat, lambda: [_legacy_parse(text, fallback_now) for text in texts], no_reset
+    )
+    single_seconds = _best_of(
+        args.repeat,
+        lambda: [parse_submission_period_dates(text, fallback_now) for text in texts],
+        _parse_normalized.cache_clear,
+    )
+    batch_seconds = _best_of(
+        args.repeat, lambda: parse_many(texts, fallback_now), _parse_normalized.cache_clear
+    )
+    print(
+        json.dumps(
+            {
+                "strings": len(texts),
+                "distinct": len(set(texts)),
+                "legacy_seconds": round(legacy_seconds, 4),
+                "per_string_seconds": round(single_seconds, 4),
+                "parse_many_seconds": round(batch_seconds, 4),
+                "speedup": round(legacy_seconds / batch_seconds, 2) if batch_seconds else None,
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
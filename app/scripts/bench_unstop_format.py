@@ -0,0 +1,100 @@
+"""
+Benchmark Unstop format derivation on large `details` HTML.
+
+Builds Unstop listings with tens of KB of description HTML, checks that the
+incremental scanner derives the same format as the previous two-regex strip,
+and times both.
+
+Usage: python scripts/bench_unstop_format.py [--records 2000] [--details-kb 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.transformers import _derive_unstop_format
+except ModuleNotFoundError:
+    from ingestion.transformers import _derive_unstop_format  # type: ignore[no-redef]
+
+PARAGRAPHS = [
+    "<p>Welcome to the <b>national</b> hackathon for students across the country.</p>",
+    "<ul><li>Round 1: idea submission</li><li>Round 2: prototype review</li></ul>",
+    "<p>Finals will be held <strong>in-person</strong> at the host campus.</p>",
+    "<p>All rounds are conducted <em>online</em> on the platform.</p>",
+    "<div class=\"rules\"><h3>Rules</h3><p>Teams of up to four members.</p></div>",
+]
+
+
+def _legacy_format(record: Dict[str, Any]) -> str:
+    region = str(record.get("region") or "").strip().lower()
+    details = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", str(record.get("details") or ""))).strip().lower()
+    if "hybrid" in region:
+        return "Hybrid"
+    if "online" in region and ("offline" in details or "in-person" in details):
+        return "Hybrid"
+    if "online" in region:
+        return "Online"
+    if "offline" in region or "in-person" in details or "campus" in details:
+        return "Offline"
+    return "Offline"
+
+
+def _records(count: int, details_kb: int, rng: random.Random) -> List[Dict[str, Any]]:
+    records = []
+    for _ in range(count):
+        chunks: List[str] = []
+        while sum(len(chunk) for chunk in chunks) < details_kb * 1024:
+            chunks.append(rng.choice(PARAGRAPHS))
+        records.append({"region": rng.choice(["online", "offline", "hybrid"]), "details": "".join(chunks)})
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--details-kb", type=int, default=40)
+    args = parser.parse_args()
+
+    records = _records(args.records, args.details_kb, random.Random(5))
+    for record in records:
+        if _legacy_format(record) != _derive_unstop_format(record):
+            raise SystemExit("formats differ")
+
+    started = time.perf_counter()
+    for record in records:
+        _legacy_format(record)
+    legacy_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for record in records:
+        _derive_unstop_format(record)
+    new_seconds = time.perf_counter() - started
+
+    print(
+        json.dumps(
+            {
+                "records": len(records),
+                "details_kb": args.details_kb,
+                "legacy_seconds": round(legacy_seconds, 4),
+                "scanner_seconds": round(new_seconds, 4),
+                "speedup": round(legacy_seconds / new_seconds, 2) if new_seconds else None,
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
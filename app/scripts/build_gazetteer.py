@@ -0,0 +1,79 @@
+"""
+Build the offline gazetteer index used by the geocoder.
+
+Reads a GeoNames cities dump (e.g. cities15000.txt from
+https://download.geonames.org/export/dump/) and, optionally, the matching
+admin1CodesASCII.txt and countryInfo.txt so that "City, State, Country"
+strings can be disambiguated by name, and writes the binary index the
+geocoder memory-maps (app/data/gazetteer.bin by default).
+
+Usage: python scripts/build_gazetteer.py cities15000.txt [--admin1 admin1CodesASCII.txt]
+       [--countries countryInfo.txt] [--output data/gazetteer.bin] [--no-alternate-names]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.gazetteer import (
+        read_admin1_codes,
+        read_country_info,
+        read_geonames_cities,
+        write_gazetteer,
+    )
+    from app.ingestion.geocoding import DEFAULT_GAZETTEER_PATH
+except ModuleNotFoundError:
+    from ingestion.gazetteer import (  # type: ignore[no-redef]
+        read_admin1_codes,
+        read_country_info,
+        read_geonames_cities,
+        write_gazetteer,
+    )
+    from ingestion.geocoding import DEFAULT_GAZETTEER_PATH  # type: ignore[no-redef]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cities", type=Path, help="GeoNames cities dump (tab-separated).")
+    parser.add_argument("--admin1", type=Path, help="GeoNames admin1CodesASCII.txt.")
+    parser.add_argument("--countries", type=Path, help="GeoNames countryInfo.txt.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_GAZETTEER_PATH)
+    parser.add_argument(
+        "--no-alternate-names",
+        action="store_true",
+        help="Index only each place's name and ASCII name (smaller, fewer matches).",
+    )
+    args = parser.parse_args()
+
+    admin1 = None
+    if args.admin1 is not None:
+        with args.admin1.open(encoding="utf-8") as handle:
+            admin1 = read_admin1_codes(handle)
+    countries = None
+    if args.countries is not None:
+        with args.countries.open(encoding="utf-8") as handle:
+            countries = read_country_info(handle)
+
+    with args.cities.open(encoding="utf-8") as handle:
+        counts = write_gazetteer(
+            args.output,
+            read_geonames_cities(handle),
+            admin1_names=admin1,
+            country_names=countries,
+            alternate_names=not args.no_alternate_names,
+        )
+    print(json.dumps({"output": str(args.output), "bytes": args.output.stat().st_size, **counts}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Report how many geocoder lookups canonical location keys save.
+
+Reads ingested hackathons (data/ingested_hackathons.json by default), takes
+the location text of every listing the pipeline would geocode, and compares
+the old cache key (lowercased, stripped text) with canonical_location. A
+cold cache misses once per distinct key; every other listing is a hit or
+needs no lookup at all (placeholders), so the hit rate is the share of
+listings that cost no provider lookup.
+
+Usage: python scripts/report_location_keys.py [--input data/ingested_hackathons.json] [--show-merged]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.locations import canonical_location
+except ModuleNotFoundError:
+    from ingestion.locations import canonical_location  # type: ignore[no-redef]
+
+DEFAULT_INPUT = REPO_ROOT / "data" / "ingested_hackathons.json"
+
+
+def _legacy_key(location_text: str) -> Optional[str]:
+    normalized = location_text.strip().lower()
+    if not normalized or normalized in {"global", "online", "virtual"}:
+        return None
+    return normalized
+
+
+def _summary(keys: List[Optional[str]]) -> Dict[str, Any]:
+    # Each distinct key misses once; skipped texts and repeats cost nothing.
+    misses = len({key for key in keys if key is not None})
+    return {
+        "skipped": sum(1 for key in keys if key is None),
+        "misses": misses,
+        "hit_rate": round(1 - misses / len(keys), 3) if keys else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument(
+        "--show-merged", action="store_true", help="Also list the texts that now share a key."
+    )
+    args = parser.parse_args()
+
+    records = json.loads(args.input.read_text(encoding="utf-8"))
+    texts = [
+        str(record.get("locationText") or "")
+        for record in records
+        if record.get("format") != "Online"
+    ]
+    canonical = [canonical_location(text) for text in texts]
+    legacy_summary = _summary([_legacy_key(text) for text in texts])
+    canonical_summary = _summary(canonical)
+    results: Dict[str, object] = {
+        "listings": len(texts),
+        "legacy": legacy_summary,
+        "canonical": canonical_summary,
+        "saved_lookups": legacy_summary["misses"] - canonical_summary["misses"],
+    }
+    if args.show_merged:
+        variants: Dict[str, Set[str]] = defaultdict(set)
+        for text, key in zip(texts, canonical):
+            if key is not None:
+                variants[key].add(text)
+        results["merged"] = {
+            key: sorted(group) for key, group in sorted(variants.items()) if len(group) > 1
+        }
+        results["placeholders"] = sorted({text for text, key in zip(texts, canonical) if key is None})
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
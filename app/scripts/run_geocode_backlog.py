@@ -0,0 +1,24 @@
+"""
+HackHunt deferred geocoding worker.
+
+Drains the geocode_backlog table that `run_ingestion.py --defer-geocoding`
+fills and patches the coordinates into the database and JSON output.
+"""
+
+from pathlib import Path
+import sys
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+for path in (REPO_ROOT, REPO_ROOT.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    from app.ingestion.pipeline import geocode_backlog_main
+except ModuleNotFoundError:
+    from ingestion.pipeline import geocode_backlog_main  # type: ignore[no-redef]
+
+
+if __name__ == "__main__":
+    geocode_backlog_main()
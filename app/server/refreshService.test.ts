@@ -21,5 +21,12 @@ test("extractSummaryFromIngestionOutput parses last valid JSON line", () => {
 test("resolveRefreshRequest builds all-pages ingestion command by default", () => {
   const request = resolveRefreshRequest();
   assert.equal(request.command, "python");
-  assert.deepEqual(request.args, ["scripts/run_ingestion.py", "--max-pages", "0"]);
+  assert.deepEqual(request.args, [
+    "scripts/run_ingestion.py",
+    "--max-pages",
+    "0",
+    "--deadline-seconds",
+    "840",
+    "--resume",
+  ]);
 });
@@ -21,6 +21,8 @@ export interface RefreshResult {
 }
 
 const REFRESH_TIMEOUT_MS = 15 * 60 * 1000;
+// Leave the ingestion run a minute to wind down and commit before SIGTERM.
+const REFRESH_DEADLINE_SECONDS = REFRESH_TIMEOUT_MS / 1000 - 60;
 
 const coerceNumber = (value: unknown): number => {
   const parsed = Number(value);
@@ -32,7 +34,14 @@ export const resolveRefreshRequest = (): RefreshRequest => {
   const maxPages = process.env.HACKHUNT_REFRESH_MAX_PAGES?.trim() || "0";
   return {
     command,
-    args: ["scripts/run_ingestion.py", "--max-pages", maxPages],
+    args: [
+      "scripts/run_ingestion.py",
+      "--max-pages",
+      maxPages,
+      "--deadline-seconds",
+      String(REFRESH_DEADLINE_SECONDS),
+      "--resume",
+    ],
   };
 };
 